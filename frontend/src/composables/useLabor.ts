@@ -21,6 +21,12 @@ export interface WorkRecord {
   is_overtime: boolean
   is_night: boolean
   is_holiday: boolean
+  leave_days?: string
+}
+
+export interface WorkRecordPage {
+  next: string | null
+  results: WorkRecord[]
 }
 
 export interface Job {
@@ -37,6 +43,9 @@ export interface Job {
   has_paid_weekly_holiday: boolean
   is_severance_eligible: boolean
   is_current: boolean
+  work_record_count: number
+  latest_work_date: string | null
+  // ?expand=work_records 요청 시에만 포함
   work_records?: WorkRecord[]
 }
 
@@ -56,6 +65,10 @@ export interface JobSummary {
   total_hours: number
   total_days: number
   estimated_salary: number
+  night_hours: number
+  overtime_hours: number
+  holiday_hours: number
+  premium_pay: number
   week_stats: WeekStat[]
 }
 
@@ -68,19 +81,122 @@ export interface LaborStats {
   todayHours: number
 }
 
+export interface MinWagePeriod {
+  start: string
+  end: string
+  effective_from: string
+  min_wage_ok: boolean
+  min_wage_required: number
+}
+
 export interface EvaluationResult {
   min_wage_ok: boolean
   min_wage_required: number
+  law_effective_from: string
+  min_wage_periods: MinWagePeriod[]
   weekly_holiday_pay: number
   annual_leave_days: number
   severance_estimate: number
   warnings: string[]
 }
 
+export interface WeeklyHolidayPayWeek {
+  week: string
+  week_start: string
+  total_hours: number
+  days_worked: number
+  weekly_holiday_pay: number
+}
+
+export interface WeeklyHolidayPayResult {
+  job_id: number
+  weeks: WeeklyHolidayPayWeek[]
+  totals: {
+    weeks: number
+    eligible_weeks: number
+    weekly_holiday_pay: number
+  }
+}
+
+export interface SeveranceResult {
+  as_of: string
+  source: 'manual' | 'records'
+  service_days: number
+  service_years: number
+  wage_last_3m: number
+  days_last_3m: number
+  average_daily_wage: number
+  severance_estimate: number
+  series?: { as_of: string; wage_last_3m: number; days_last_3m: number; severance_estimate: number }[]
+}
+
 export interface AnnualLeaveResult {
   total: number
   used: number
   available: number
+  accrued: number
+  expired: number
+  as_of: string
+}
+
+export interface CombinedWeek {
+  week_start: string
+  job_count: number
+  worked_hours: number
+  overlap_hours: number
+  combined_hours: number
+  over_limit: boolean
+}
+
+export interface OverlapReport {
+  records: number
+  conflict_count: number
+  conflicts: {
+    records: number[]
+    employees: number[]
+    work_dates: string[]
+    start: string
+    end: string
+    overlap_minutes: number
+  }[]
+  weeks: CombinedWeek[]
+  warnings: string[]
+}
+
+export interface CalendarDate {
+  date: string
+  day: number
+  is_scheduled: boolean
+  projected_minutes: number
+  record: WorkRecord | null
+}
+
+export interface CombinedTotals {
+  job_count: number
+  combined_weekly_hours: number
+  jobs_over_15h: number
+  actual_weekly_hours: CombinedWeek[]
+  max_actual_weekly_hours: number
+  weekly_holiday_pay_total: number
+  severance_estimate_total: number
+  warnings: string[]
+}
+
+export interface DashboardResult {
+  month: string
+  jobs: {
+    job: Job
+    summary: JobSummary
+    evaluation: EvaluationResult
+    annual_leave: AnnualLeaveResult
+    calendar: CalendarDate[]
+  }[]
+  totals: CombinedTotals
+}
+
+export interface BatchEvaluationResult {
+  results: Record<string, { evaluation: EvaluationResult; annual_leave: AnnualLeaveResult }>
+  totals: CombinedTotals
 }
 
 // ===== State =====
@@ -153,6 +269,46 @@ export function useLabor(accessToken?: string) {
     }
   }
 
+  /**
+   * 여러 Job의 평가 결과 + 연차 요약 일괄 조회 (ids 생략 시 전체 Job)
+   * API 엔드포인트: GET /labor/jobs/evaluations/?ids=1,2
+   */
+  async function fetchEvaluations(jobIds?: number[]): Promise<BatchEvaluationResult> {
+    loading.value = true
+    error.value = null
+    try {
+      const headers = accessToken ? { Authorization: `Bearer ${accessToken}` } : {}
+      const params = jobIds && jobIds.length ? { ids: jobIds.join(',') } : {}
+      const response = await apiClient.get<BatchEvaluationResult>('/labor/jobs/evaluations/', { params, headers })
+      return response.data
+    } catch (err: any) {
+      error.value = err.response?.data?.detail || '평가 결과 조회 실패'
+      throw err
+    } finally {
+      loading.value = false
+    }
+  }
+
+  /**
+   * 대시보드 일괄 조회 (Job별 월 요약/평가/연차/달력 + 합산 지표를 한 번에)
+   * API: GET /labor/jobs/dashboard/?month=YYYY-MM
+   */
+  async function fetchDashboard(month?: string): Promise<DashboardResult> {
+    loading.value = true
+    error.value = null
+    try {
+      const headers = accessToken ? { Authorization: `Bearer ${accessToken}` } : {}
+      const params = month ? { month } : {}
+      const response = await apiClient.get<DashboardResult>('/labor/jobs/dashboard/', { params, headers })
+      return response.data
+    } catch (err: any) {
+      error.value = err.response?.data?.detail || '대시보드 조회 실패'
+      throw err
+    } finally {
+      loading.value = false
+    }
+  }
+
   /**
    * 연차휴가 요약 조회
    * API: GET /labor/jobs/<id>/annual-leave/
@@ -173,23 +329,71 @@ export function useLabor(accessToken?: string) {
   }
 
   /**
-   * 특정 Job의 기간별 근로 기록 조회
+   * 특정 Job의 실제 근로기록 기준 ISO 주별 주휴수당 조회 (from/to 생략 시 전체 근속기간)
+   * API: GET /labor/jobs/<id>/weekly-holiday-pay/?from=YYYY-MM-DD&to=YYYY-MM-DD
+   */
+  async function fetchWeeklyHolidayPay(jobId: number, from?: string, to?: string): Promise<WeeklyHolidayPayResult> {
+    loading.value = true
+    error.value = null
+    try {
+      const headers = accessToken ? { Authorization: `Bearer ${accessToken}` } : {}
+      const params: Record<string, string> = {}
+      if (from) params.from = from
+      if (to) params.to = to
+      const response = await apiClient.get<WeeklyHolidayPayResult>(`/labor/jobs/${jobId}/weekly-holiday-pay/`, { params, headers })
+      return response.data
+    } catch (err: any) {
+      error.value = err.response?.data?.detail || '주휴수당 조회 실패'
+      throw err
+    } finally {
+      loading.value = false
+    }
+  }
+
+  /**
+   * 특정 Job의 기준일 퇴직 가정 퇴직금 추정 조회 (최근 3개월 임금은 근로기록 집계 기반, 직접 입력값 우선)
+   * API: GET /labor/jobs/<id>/severance/?as_of=YYYY-MM-DD&from=YYYY-MM-DD
+   * @param asOf - 퇴직 기준일 (생략 시 오늘)
+   * @param from - 지정하면 from~asOf 매월 1일 기준 시계열(series) 포함
+   */
+  async function fetchSeverance(jobId: number, asOf?: string, from?: string): Promise<SeveranceResult> {
+    loading.value = true
+    error.value = null
+    try {
+      const headers = accessToken ? { Authorization: `Bearer ${accessToken}` } : {}
+      const params: Record<string, string> = {}
+      if (asOf) params.as_of = asOf
+      if (from) params.from = from
+      const response = await apiClient.get<SeveranceResult>(`/labor/jobs/${jobId}/severance/`, { params, headers })
+      return response.data
+    } catch (err: any) {
+      error.value = err.response?.data?.detail || '퇴직금 조회 실패'
+      throw err
+    } finally {
+      loading.value = false
+    }
+  }
+
+  /**
+   * 특정 Job의 기간별 근로 기록 조회 (커서 페이지네이션)
    * @param jobId - Job ID
    * @param startDate - 시작 날짜 (YYYY-MM-DD)
    * @param endDate - 종료 날짜 (YYYY-MM-DD)
+   * @param cursor - 이전 응답의 next URL에 포함된 cursor (첫 페이지는 생략)
    */
   async function fetchWorkRecords(
     jobId: number,
     startDate: string,
-    endDate: string
-  ): Promise<WorkRecord[]> {
+    endDate: string,
+    cursor?: string
+  ): Promise<WorkRecordPage> {
     loading.value = true
     error.value = null
 
     try {
       const headers = accessToken ? { Authorization: `Bearer ${accessToken}` } : {}
-      const response = await apiClient.get<WorkRecord[]>(`/labor/jobs/${jobId}/work-records/`, {
-        params: { start: startDate, end: endDate },
+      const response = await apiClient.get<WorkRecordPage>(`/labor/jobs/${jobId}/work-records/`, {
+        params: { start: startDate, end: endDate, ...(cursor ? { cursor } : {}) },
         headers,
       })
       return response.data
@@ -201,6 +405,28 @@ export function useLabor(accessToken?: string) {
     }
   }
 
+  /**
+   * 사용자의 모든 Job에 걸친 근로기록 시간 중복 점검 + 주별 합산 실제 근로시간 (start/end 생략 시 전체 기간)
+   * API: GET /labor/work-records/overlaps/?start=YYYY-MM-DD&end=YYYY-MM-DD
+   */
+  async function fetchOverlaps(start?: string, end?: string): Promise<OverlapReport> {
+    loading.value = true
+    error.value = null
+    try {
+      const headers = accessToken ? { Authorization: `Bearer ${accessToken}` } : {}
+      const params: Record<string, string> = {}
+      if (start) params.start = start
+      if (end) params.end = end
+      const response = await apiClient.get<OverlapReport>('/labor/work-records/overlaps/', { params, headers })
+      return response.data
+    } catch (err: any) {
+      error.value = err.response?.data?.detail || '근무 중복 점검 실패'
+      throw err
+    } finally {
+      loading.value = false
+    }
+  }
+
   /**
    * 현재 월의 통계 계산
    * @param summary - Job 요약 정보
@@ -269,7 +495,12 @@ export function useLabor(accessToken?: string) {
     fetchJobs,
     fetchJobSummary,
     fetchWorkRecords,
+    fetchOverlaps,
     fetchEvaluation,
+    fetchEvaluations,
+    fetchDashboard,
+    fetchWeeklyHolidayPay,
+    fetchSeverance,
     fetchAnnualLeave,
     calculateStats,
     getMonthString,
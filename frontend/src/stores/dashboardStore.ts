@@ -0,0 +1,81 @@
+import { ref, computed } from 'vue'
+import { useLabor, type DashboardResult } from '../composables/useLabor'
+
+type DashboardJob = DashboardResult['jobs'][number]
+
+// 전역 상태 (싱글톤) - 월별 대시보드 일괄 조회 결과 (모든 Job의 요약/평가/연차/달력)
+const dashboards = ref<Record<string, DashboardResult>>({})
+const loading = ref(false)
+const error = ref<string | null>(null)
+// 근로기록/Job 정보가 바뀌면 올려서 화면이 다시 조회하도록 함
+const version = ref(0)
+// 같은 달을 여러 컴포넌트가 동시에 요청해도 API는 한 번만 호출
+const requests = new Map<string, Promise<DashboardResult>>()
+
+// Composable: useDashboard
+export function useDashboard() {
+  const { fetchDashboard } = useLabor()
+
+  /**
+   * 해당 월 대시보드 조회 (이미 받은 달이면 API 호출 없이 반환)
+   * API: GET /labor/jobs/dashboard/?month=YYYY-MM
+   */
+  async function loadDashboard(month: string): Promise<DashboardResult> {
+    const cached = dashboards.value[month]
+    if (cached) return cached
+
+    let request = requests.get(month)
+    if (!request) {
+      const requestedVersion = version.value
+      loading.value = true
+      error.value = null
+      request = fetchDashboard(month)
+        .then((result) => {
+          // 요청 중에 데이터가 바뀌었으면(invalidate) 이전 결과는 저장하지 않음
+          if (requestedVersion === version.value) {
+            dashboards.value = { ...dashboards.value, [month]: result }
+          }
+          return result
+        })
+        .catch((err: any) => {
+          error.value = err.response?.data?.detail || '대시보드 조회 실패'
+          throw err
+        })
+        .finally(() => {
+          requests.delete(month)
+          loading.value = requests.size > 0
+        })
+      requests.set(month, request)
+    }
+    return request
+  }
+
+  /**
+   * 해당 월 대시보드에서 Job 하나의 항목 (요약/평가/연차/달력), 아직 조회 전이면 null
+   */
+  function jobEntry(month: string, jobId?: number | null): DashboardJob | null {
+    if (!jobId) return null
+    return dashboards.value[month]?.jobs.find((entry) => entry.job.id === jobId) || null
+  }
+
+  /**
+   * 액션: 받아 둔 대시보드 비우기 (근로기록 저장, Job 수정/추가 후 호출)
+   */
+  function invalidate() {
+    dashboards.value = {}
+    requests.clear()
+    version.value++
+  }
+
+  return {
+    // 상태
+    loading: computed(() => loading.value),
+    error: computed(() => error.value),
+    version: computed(() => version.value),
+
+    // 액션
+    loadDashboard,
+    jobEntry,
+    invalidate,
+  }
+}
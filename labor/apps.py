@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class LaborConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'labor'
+
+    def ready(self):
+        # WorkRecord 변경 시 집계 테이블 증분 갱신
+        from . import signals  # noqa: F401
+        # 다른 프로세스의 법령 기준 변경을 반영하는 주기 (초, None이면 재시작 전까지 유지)
+        from .law import DEFAULT_RELOAD_SECONDS, law_index
+        law_index.reload_seconds = getattr(settings, 'LABOR_LAW_INDEX_TTL', DEFAULT_RELOAD_SECONDS)
@@ -0,0 +1,69 @@
+"""labor/conditional.py
+
+Job 단위 조회 API의 조건부 GET (ETag / Last-Modified → 304 Not Modified)
+- 검증값은 Employee 한 행만으로 계산 (근로기록/스케줄/Job 변경 시 올라가는 data_version과 updated_at)
+- ETag: Job id + data_version + 액션 + 쿼리 파라미터 + 법령 기준 fingerprint (+ 기준일이 오늘인 액션은 오늘 날짜)
+- If-None-Match / If-Modified-Since가 맞으면 요약·집계·평가 계산 전에 304 응답
+- 브라우저가 매번 재검증하도록 Cache-Control: private, no-cache
+"""
+
+import hashlib
+from datetime import date, datetime, time
+from functools import wraps
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from .law import law_index
+
+
+def employee_etag(employee, request, action: str, today=None) -> str:
+    params = sorted((key, value) for key, values in request.query_params.lists() for value in values)
+    raw = (
+        f'{employee.id}:{employee.data_version}:{action}:{params!r}:{law_index.fingerprint()}:'
+        f'{today.isoformat() if today else ""}'
+    )
+    return quote_etag(hashlib.sha1(raw.encode('utf-8')).hexdigest())
+
+
+def employee_last_modified(employee, today=None) -> int:
+    """Last-Modified (timestamp) - 기준일이 오늘인 액션은 오늘 0시 이전으로 내려가지 않음"""
+    modified = employee.updated_at
+    if today is not None:
+        modified = max(modified, timezone.make_aware(datetime.combine(today, time.min)))
+    # If-Modified-Since는 초 단위이므로 초 미만은 버림
+    return int(modified.timestamp())
+
+
+def set_validators(response, etag: str, last_modified: int):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Authorization'])
+
+
+def conditional_employee_get(depends_on_today: bool = False):
+    """EmployeeViewSet detail 액션용 조건부 GET 데코레이터
+
+    depends_on_today: 결과가 오늘 날짜에 따라 달라지는 액션 (evaluation, annual-leave 기본값)
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(self, request, *args, **kwargs):
+            if request.method != 'GET':
+                return view(self, request, *args, **kwargs)
+            employee = self.get_object()
+            today = date.today() if depends_on_today else None
+            etag = employee_etag(employee, request, view.__name__, today)
+            last_modified = employee_last_modified(employee, today)
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view(self, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            set_validators(response, etag, last_modified)
+            return response
+        return wrapped
+    return decorator
@@ -0,0 +1,133 @@
+"""labor/evaluation_cache.py
+
+evaluate_labor / calculate_annual_leave 결과 캐시
+두 함수는 JobInputs 필드와 기준일(today)만으로 결과가 정해지므로
+(계산 종류, JobInputs 필드 해시, 기준일)을 키로 결과를 재사용한다.
+
+- 프로세스 내 LRU (최대 MAXSIZE개)
+- settings.LABOR_EVALUATION_CACHE['BACKEND']에 Django cache alias를 지정하면 공유 캐시도 사용
+- EmployeeUpdateSerializer로 Job이 수정되면 이전 입력값의 항목을 삭제 (invalidate)
+
+settings 예:
+    LABOR_EVALUATION_CACHE = {'MAXSIZE': 4096, 'BACKEND': 'default', 'TIMEOUT': 86400}
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import astuple
+from datetime import date
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .law import law_index
+from .services import JobInputs, calculate_annual_leave, evaluate_labor
+
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_TIMEOUT = 60 * 60 * 24
+KEY_PREFIX = 'labor:eval'
+KINDS = {
+    'evaluation': evaluate_labor,
+    'annual_leave': calculate_annual_leave,
+}
+
+
+def inputs_hash(inputs: JobInputs) -> str:
+    """JobInputs 필드 값 + 법령 기준(LawParameterSet)의 해시 (값이 같으면 같은 해시)"""
+    raw = f'{astuple(inputs)!r}:{law_index.fingerprint()}'
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class EvaluationCache:
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, backend: Optional[str] = None,
+                 timeout: int = DEFAULT_TIMEOUT):
+        self.maxsize = maxsize
+        self.backend = backend
+        self.timeout = timeout
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_settings(cls) -> "EvaluationCache":
+        config = getattr(settings, 'LABOR_EVALUATION_CACHE', {})
+        return cls(
+            maxsize=config.get('MAXSIZE', DEFAULT_MAXSIZE),
+            backend=config.get('BACKEND'),
+            timeout=config.get('TIMEOUT', DEFAULT_TIMEOUT),
+        )
+
+    def make_key(self, kind: str, inputs: JobInputs, today: date) -> str:
+        return f'{KEY_PREFIX}:{kind}:{inputs_hash(inputs)}:{today.isoformat()}'
+
+    def _shared(self):
+        return caches[self.backend] if self.backend else None
+
+    def get_or_compute(self, kind: str, inputs: JobInputs, today: Optional[date] = None) -> Dict[str, Any]:
+        today = today or date.today()
+        key = self.make_key(kind, inputs, today)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+
+        shared = self._shared()
+        result = shared.get(key) if shared is not None else None
+        if result is None:
+            result = KINDS[kind](inputs, today)
+            if shared is not None:
+                shared.set(key, result, self.timeout)
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.hits += 1
+
+        self._store(key, result)
+        return copy.deepcopy(result)
+
+    def _store(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evaluate(self, inputs: JobInputs, today: Optional[date] = None) -> Dict[str, Any]:
+        """캐시된 evaluate_labor"""
+        return self.get_or_compute('evaluation', inputs, today)
+
+    def annual_leave(self, inputs: JobInputs, today: Optional[date] = None) -> Dict[str, Any]:
+        """캐시된 calculate_annual_leave"""
+        return self.get_or_compute('annual_leave', inputs, today)
+
+    def invalidate(self, inputs: JobInputs, today: Optional[date] = None) -> None:
+        """해당 입력값(수정 전 Job)의 기준일 결과를 모두 삭제"""
+        today = today or date.today()
+        keys = [self.make_key(kind, inputs, today) for kind in KINDS]
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+        shared = self._shared()
+        if shared is not None:
+            shared.delete_many(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+evaluation_cache = EvaluationCache.from_settings()
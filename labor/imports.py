@@ -0,0 +1,139 @@
+"""labor/imports.py
+
+근로기록 일괄 업로드 (CSV / JSON Lines)
+- 업로드 파일을 한 줄씩 읽어 행 단위로 검증 (전체를 메모리에 올리지 않음)
+- Job 소유권은 사용자 Job id 목록을 한 번만 조회해 확인
+- (employee, work_date) 기준 bulk_create(update_conflicts=True)로 배치 upsert
+- bulk_create는 save()/signal을 거치지 않으므로 worked_minutes, 집계, 연차 ledger, data_version을 직접 갱신
+- 행 단위로 거부하지 않고, 업로드 기간 안에서 여러 Job 간 겹치는 기록 수를 리포트에 포함 (labor/overlaps.py)
+"""
+
+import csv
+import io
+import json
+from collections import defaultdict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from django.db import transaction
+
+from .leave import rebuild_leave_ledgers
+from .models import Employee, WorkRecord
+from .overlaps import overlap_report
+from .response_cache import response_cache
+from .rollups import refresh_rollups
+from .serializers import WorkRecordImportRowSerializer
+
+
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+SUPPORTED_FORMATS = ('csv', 'jsonl')
+UPSERT_FIELDS = [
+    'time_in', 'time_out', 'break_minutes', 'worked_minutes',
+    'is_overtime', 'is_night', 'is_holiday', 'leave_days',
+]
+
+
+class ImportFormatError(ValueError):
+    """지원하지 않는 파일 형식"""
+
+
+def detect_format(filename: str, requested: Optional[str] = None) -> str:
+    """요청된 형식 또는 파일 확장자로 형식 결정 (csv / jsonl)"""
+    file_format = (requested or '').lower()
+    if not file_format:
+        ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+        file_format = {'csv': 'csv', 'jsonl': 'jsonl', 'ndjson': 'jsonl'}.get(ext, '')
+    if file_format not in SUPPORTED_FORMATS:
+        raise ImportFormatError("지원하지 않는 형식입니다. (csv, jsonl 중 선택)")
+    return file_format
+
+
+def iter_rows(stream, file_format: str) -> Iterator[Tuple[int, Any]]:
+    """(행 번호, 행 데이터) 순회. 행 번호는 데이터 행 기준 1부터."""
+    if file_format == 'csv':
+        for row_number, row in enumerate(csv.DictReader(stream), start=1):
+            # 빈 칸은 값이 없는 것으로 처리 (기본값 적용)
+            yield row_number, {k: v for k, v in row.items() if k and v not in (None, '')}
+        return
+
+    row_number = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            yield row_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, e
+
+
+def import_work_records(user, upload, file_format: str, default_employee: Optional[int] = None) -> Dict[str, Any]:
+    """업로드 파일의 근로기록을 upsert하고 행별 오류 리포트를 반환"""
+    owned_ids = set(Employee.objects.filter(user=user).values_list('id', flat=True))
+    report = {'rows': 0, 'imported': 0, 'error_count': 0, 'errors': []}
+    touched = defaultdict(set)  # employee_id -> 변경된 work_date (집계 갱신용)
+    batch: Dict[Tuple[int, Any], WorkRecord] = {}
+
+    def add_error(row_number, errors):
+        report['error_count'] += 1
+        if len(report['errors']) < MAX_REPORTED_ERRORS:
+            report['errors'].append({'row': row_number, 'errors': errors})
+
+    def flush():
+        if not batch:
+            return
+        WorkRecord.objects.bulk_create(
+            list(batch.values()),
+            update_conflicts=True,
+            unique_fields=['employee', 'work_date'],
+            update_fields=UPSERT_FIELDS,
+        )
+        report['imported'] += len(batch)
+        batch.clear()
+
+    stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+    try:
+        with transaction.atomic():
+            for row_number, row in iter_rows(stream, file_format):
+                report['rows'] += 1
+                if isinstance(row, Exception):
+                    add_error(row_number, {'non_field_errors': [f'JSON 형식 오류: {row}']})
+                    continue
+                if not isinstance(row, dict):
+                    add_error(row_number, {'non_field_errors': ['각 행은 객체여야 합니다.']})
+                    continue
+                if default_employee is not None:
+                    row.setdefault('employee', default_employee)
+
+                serializer = WorkRecordImportRowSerializer(data=row)
+                if not serializer.is_valid():
+                    add_error(row_number, serializer.errors)
+                    continue
+                data = serializer.validated_data
+                if data['employee'] not in owned_ids:
+                    add_error(row_number, {'employee': ['이 Job에 접근할 권한이 없습니다.']})
+                    continue
+
+                record = WorkRecord(employee_id=data.pop('employee'), **data)
+                record.worked_minutes = record.get_worked_minutes()
+                # 같은 배치 안의 중복 키는 마지막 행 우선
+                batch[(record.employee_id, record.work_date)] = record
+                touched[record.employee_id].add(record.work_date)
+                if len(batch) >= BATCH_SIZE:
+                    flush()
+            flush()
+
+            for employee_id, dates in touched.items():
+                refresh_rollups(employee_id, dates)
+            # 덮어쓴 행의 이전 연차 사용값을 알 수 없으므로 변경된 Job의 ledger는 모두 재생성
+            rebuild_leave_ledgers(touched)
+            Employee.bump_data_version(touched)
+            response_cache.invalidate(touched)
+    except UnicodeDecodeError:
+        raise ImportFormatError("파일 인코딩 오류입니다. (UTF-8만 지원)")
+    finally:
+        stream.detach()
+
+    dates = [work_date for work_dates in touched.values() for work_date in work_dates]
+    report['overlap_count'] = overlap_report(user, min(dates), max(dates))['conflict_count'] if dates else 0
+    return report
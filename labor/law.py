@@ -0,0 +1,156 @@
+"""labor/law.py
+
+시행일별 노동법 계산 기준(LawParameterSet) 조회
+- DB 테이블을 처음 조회할 때 한 번 읽어 시행일 순 정렬 배열(구간 인덱스)로 보관
+- 기준일 조회는 bisect로 O(log n), 호출마다 DB 조회 없음
+- LawParameterSet 변경 시 signal로 인덱스를 비우고 다음 조회 때 다시 읽음
+  (다른 프로세스는 settings.LABOR_LAW_INDEX_TTL초(기본 60초)가 지나면 다시 읽음, None이면 재시작 전까지 유지)
+- 테이블이 비어 있거나 아직 마이그레이션 전이면 DEFAULT_LAW_PARAMETERS 사용
+"""
+
+import hashlib
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from decimal import Decimal
+from time import monotonic
+from typing import Iterable, List, Optional, Tuple
+
+from django.db.utils import DatabaseError
+
+
+@dataclass(frozen=True)
+class LawParameters:
+    effective_from: date
+    min_wage: int
+    weekly_holiday_min_hours: float = 15.0
+    severance_min_weekly_hours: float = 15.0
+    annual_leave_min_weekly_hours: float = 15.0
+    annual_leave_min_attendance: float = 0.8
+    annual_leave_base_days: int = 15
+    annual_leave_max_days: int = 25
+    daily_work_hours: float = 8.0
+    weekly_work_hours: float = 40.0
+    overtime_premium_rate: float = 0.5
+    night_premium_rate: float = 0.5
+    holiday_premium_rate: float = 0.5
+    holiday_overtime_premium_rate: float = 1.0
+
+
+# 0007 마이그레이션의 초기 데이터와 동일
+DEFAULT_LAW_PARAMETERS = [
+    LawParameters(effective_from=date(2024, 1, 1), min_wage=9860),
+    LawParameters(effective_from=date(2025, 1, 1), min_wage=10030),
+    LawParameters(effective_from=date(2026, 1, 1), min_wage=10320),
+]
+
+
+DEFAULT_RELOAD_SECONDS = 60
+
+
+def parameters_from_row(row) -> LawParameters:
+    """LawParameterSet 행을 LawParameters로 변환
+
+    마이그레이션의 과거 모델 행이면 그 시점에 없는 필드는 LawParameters 기본값 사용
+    """
+    values = {}
+    for field in fields(LawParameters):
+        if hasattr(row, field.name):
+            value = getattr(row, field.name)
+            values[field.name] = float(value) if isinstance(value, Decimal) else value
+    return LawParameters(**values)
+
+
+class LawParameterIndex:
+    def __init__(self, reload_seconds: Optional[float] = None):
+        self._lock = threading.Lock()
+        self._starts: Optional[List[int]] = None  # effective_from.toordinal() 오름차순
+        self._params: List[LawParameters] = []
+        self._fingerprint = ''
+        self._loaded_at = 0.0
+        # 마지막으로 읽은 뒤 이 시간(초)이 지나면 다시 읽음 (None이면 reset() 전까지 유지)
+        self.reload_seconds = reload_seconds
+
+    @classmethod
+    def from_params(cls, params: Iterable[LawParameters]) -> "LawParameterIndex":
+        """DB 대신 주어진 기준으로 만든 인덱스 (마이그레이션에서 과거 모델 행으로 사용, 다시 읽지 않음)"""
+        index = cls()
+        index._set(list(params))
+        return index
+
+    def _set(self, params: List[LawParameters]) -> None:
+        self._params = sorted(params, key=lambda p: p.effective_from) or list(DEFAULT_LAW_PARAMETERS)
+        self._fingerprint = hashlib.sha1(repr(self._params).encode('utf-8')).hexdigest()
+        self._starts = [p.effective_from.toordinal() for p in self._params]
+
+    def _load(self) -> None:
+        from .models import LawParameterSet
+
+        try:
+            rows = [parameters_from_row(row) for row in LawParameterSet.objects.order_by('effective_from')]
+        except DatabaseError:
+            rows = []
+        self._set(rows)
+        self._loaded_at = monotonic()
+
+    def _expired(self) -> bool:
+        return self.reload_seconds is not None and monotonic() - self._loaded_at > self.reload_seconds
+
+    def _ensure_loaded(self) -> None:
+        if self._starts is None or self._expired():
+            with self._lock:
+                if self._starts is None or self._expired():
+                    self._load()
+
+    def reset(self) -> None:
+        """다음 조회 때 DB에서 다시 읽도록 인덱스 비우기"""
+        with self._lock:
+            self._starts = None
+
+    def all(self) -> List[LawParameters]:
+        self._ensure_loaded()
+        return list(self._params)
+
+    def fingerprint(self) -> str:
+        """전체 기준값의 해시 (기준이 수정되면 값이 바뀜 - 계산 캐시/스냅샷 키에 포함)"""
+        self._ensure_loaded()
+        return self._fingerprint
+
+    def boundaries(self) -> List[int]:
+        """시행일 ordinal 배열 (labor/vectorized.py에서 searchsorted로 사용)"""
+        self._ensure_loaded()
+        return list(self._starts)
+
+    def lookup(self, on: date) -> LawParameters:
+        """기준일에 적용되는 기준 (가장 이른 시행일 이전이면 가장 이른 기준 적용)"""
+        self._ensure_loaded()
+        index = bisect_right(self._starts, on.toordinal()) - 1
+        return self._params[max(index, 0)]
+
+    def split(self, start: date, end: date) -> List[Tuple[date, date, LawParameters]]:
+        """start~end(포함) 기간을 시행일 경계로 나눈 (구간 시작, 구간 끝, 기준) 목록"""
+        self._ensure_loaded()
+        if end < start:
+            return []
+        segments = []
+        index = max(bisect_right(self._starts, start.toordinal()) - 1, 0)
+        segment_start = start
+        while segment_start <= end:
+            if index + 1 < len(self._params):
+                segment_end = min(end, self._params[index + 1].effective_from - timedelta(days=1))
+            else:
+                segment_end = end
+            if segment_end >= segment_start:
+                segments.append((segment_start, segment_end, self._params[index]))
+                segment_start = segment_end + timedelta(days=1)
+            index += 1
+        return segments
+
+
+# reload_seconds는 LaborConfig.ready()에서 settings.LABOR_LAW_INDEX_TTL로 설정
+law_index = LawParameterIndex(reload_seconds=DEFAULT_RELOAD_SECONDS)
+
+
+def law_parameters(on: Optional[date] = None) -> LawParameters:
+    return law_index.lookup(on or date.today())
@@ -0,0 +1,203 @@
+"""labor/leave.py
+
+연차휴가 ledger (AnnualLeaveEvent) 생성/조회
+- 발생: 1년 미만은 매월 1일 (입사 1년 시점 소멸), 이후 매 입사기념일에 15일 + 2년마다 1일 (최대 25일, 1년 후 소멸)
+  기준값은 발생일에 시행 중인 LawParameterSet 값 사용
+- 사용: WorkRecord.leave_days (반차 0.5) - 먼저 발생한 연차부터 차감, 잔여가 없으면 다음 발생분에서 차감
+- 소멸: 소멸일까지 남은 발생분
+- 이벤트마다 발생/사용/소멸 누계와 잔여를 저장하므로, 임의 날짜의 잔여는 인덱스 한 행 조회
+- Job의 근속정보나 연차 사용 기록이 바뀌면 해당 Job의 ledger만 다시 생성 (labor/signals.py)
+  오늘 기준 1년 뒤까지 미리 생성해 두고, 조회 날짜가 그 이후면 그때 연장
+- 작년 출근율은 생성 시점의 가장 최근 입사기념일 발생분에만 적용되므로,
+  다음 입사기념일(leave_ledger_refresh_on)이 지나면 조회 시 다시 생성
+"""
+
+from collections import deque
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from .law import law_parameters
+from .models import AnnualLeaveEvent, Employee, WorkRecord
+from .rollups import add_months
+
+
+LEDGER_LOOKAHEAD_DAYS = 365
+
+Grant = Tuple[date, Decimal, date]  # (발생일, 일수, 소멸일)
+
+
+def next_anniversary(employee: Employee, today: date) -> date:
+    """today 이후(당일 제외) 첫 입사기념일"""
+    years = max(1, today.year - employee.start_date.year)
+    while add_months(employee.start_date, 12 * years) <= today:
+        years += 1
+    return add_months(employee.start_date, 12 * years)
+
+
+def leave_grants(employee: Employee, until: date, today: date) -> List[Grant]:
+    """until까지의 연차 발생 목록 (발생일 순)
+
+    작년 출근율(attendance_rate_last_year)은 today 이전 가장 최근 입사기념일 발생분에만 적용
+    """
+    start = employee.start_date
+    last_day = min(until, employee.end_date) if employee.end_date else until
+    weekly_hours = float(employee.weekly_hours)
+    attendance = employee.attendance_rate_last_year
+    first_anniversary = add_months(start, 12)
+
+    grants: List[Grant] = []
+    for months in range(1, 12):
+        grant_date = add_months(start, months)
+        if grant_date > last_day:
+            return grants
+        if weekly_hours >= law_parameters(grant_date).annual_leave_min_weekly_hours:
+            grants.append((grant_date, Decimal(1), first_anniversary))
+
+    years = 1
+    while True:
+        grant_date = add_months(start, 12 * years)
+        if grant_date > last_day:
+            return grants
+        params = law_parameters(grant_date)
+        days = min(params.annual_leave_max_days, params.annual_leave_base_days + (years - 1) // 2)
+        is_latest = grant_date <= today < add_months(start, 12 * (years + 1))
+        if is_latest and attendance is not None and float(attendance) < params.annual_leave_min_attendance:
+            days = 0
+        if days and weekly_hours >= params.annual_leave_min_weekly_hours:
+            grants.append((grant_date, Decimal(days), add_months(start, 12 * (years + 1))))
+        years += 1
+
+
+def build_leave_events(employee_id: int, grants: List[Grant], uses: Iterable[Tuple[date, Decimal]],
+                       until: date) -> List[AnnualLeaveEvent]:
+    """발생/사용 목록으로 ledger 이벤트 생성 (같은 날은 소멸 → 발생 → 사용 순)"""
+    timeline = sorted(
+        [(grant_date, 1, days, expires_on) for grant_date, days, expires_on in grants]
+        + [(use_date, 2, Decimal(days), None) for use_date, days in uses if use_date <= until]
+    )
+    events: List[AnnualLeaveEvent] = []
+    totals = {'accrued': Decimal(0), 'used': Decimal(0), 'expired': Decimal(0)}
+    alive = deque()  # [소멸일, 남은 일수] - 발생 순 (소멸일도 같은 순서)
+    debt = Decimal(0)  # 잔여보다 많이 사용한 일수 (다음 발생분에서 차감)
+
+    def add_event(event_date, kind, days, expires_on=None):
+        events.append(AnnualLeaveEvent(
+            employee_id=employee_id,
+            event_date=event_date,
+            kind=kind,
+            days=days,
+            expires_on=expires_on,
+            accrued_total=totals['accrued'],
+            used_total=totals['used'],
+            expired_total=totals['expired'],
+            balance=totals['accrued'] - totals['used'] - totals['expired'],
+        ))
+
+    def expire_until(day):
+        # 같은 날 소멸하는 발생분(1년 미만 월별 발생 등)은 한 이벤트로 기록
+        while alive and alive[0][0] <= day:
+            expires_on, expired = alive[0][0], Decimal(0)
+            while alive and alive[0][0] == expires_on:
+                expired += alive.popleft()[1]
+            if expired > 0:
+                totals['expired'] += expired
+                add_event(expires_on, AnnualLeaveEvent.KIND_EXPIRY, -expired)
+
+    for event_date, order, days, expires_on in timeline:
+        expire_until(event_date)
+        if order == 1:
+            totals['accrued'] += days
+            paid = min(debt, days)
+            debt -= paid
+            alive.append([expires_on, days - paid])
+            add_event(event_date, AnnualLeaveEvent.KIND_ACCRUAL, days, expires_on)
+        else:
+            totals['used'] += days
+            remaining = days
+            while remaining > 0 and alive:
+                take = min(remaining, alive[0][1])
+                alive[0][1] -= take
+                remaining -= take
+                if alive[0][1] == 0:
+                    alive.popleft()
+            debt += remaining
+            add_event(event_date, AnnualLeaveEvent.KIND_USE, -days)
+    expire_until(until)
+    return events
+
+
+def rebuild_leave_ledger(employee: Employee, today: Optional[date] = None, until: Optional[date] = None) -> date:
+    """Job 한 개의 ledger를 다시 생성 (오늘 + LEDGER_LOOKAHEAD_DAYS까지). 생성한 마지막 날짜 반환."""
+    today = today or date.today()
+    until = max(until or today, today) + timedelta(days=LEDGER_LOOKAHEAD_DAYS)
+    uses = WorkRecord.objects.filter(employee_id=employee.id, leave_days__gt=0).values_list('work_date', 'leave_days')
+    events = build_leave_events(employee.id, leave_grants(employee, until, today), uses, until)
+    refresh_on = next_anniversary(employee, today)
+    with transaction.atomic():
+        AnnualLeaveEvent.objects.filter(employee_id=employee.id).delete()
+        AnnualLeaveEvent.objects.bulk_create(events)
+        Employee.objects.filter(pk=employee.id).update(leave_ledger_until=until, leave_ledger_refresh_on=refresh_on)
+    employee.leave_ledger_until = until
+    employee.leave_ledger_refresh_on = refresh_on
+    return until
+
+
+def rebuild_leave_ledgers(employee_ids: Iterable[int], today: Optional[date] = None) -> None:
+    for employee in Employee.objects.filter(pk__in=list(employee_ids)):
+        rebuild_leave_ledger(employee, today)
+
+
+def _ensure_ledger(employee: Employee, on: date) -> None:
+    stale = employee.leave_ledger_refresh_on is not None and employee.leave_ledger_refresh_on <= date.today()
+    if stale or employee.leave_ledger_until is None or employee.leave_ledger_until < on:
+        rebuild_leave_ledger(employee, until=on)
+
+
+def _balance_json(event: Optional[AnnualLeaveEvent], on: date) -> Dict:
+    zero = Decimal(0)
+    accrued = event.accrued_total if event else zero
+    used = event.used_total if event else zero
+    expired = event.expired_total if event else zero
+    return {
+        "total": float(accrued - expired),
+        "used": float(used),
+        "available": float(event.balance if event else zero),
+        "accrued": float(accrued),
+        "expired": float(expired),
+        "as_of": on.isoformat(),
+    }
+
+
+def leave_balance(employee: Employee, on: Optional[date] = None) -> Dict:
+    """on 날짜 기준 연차 잔여 (ledger가 준비되어 있으면 인덱스 한 행 조회)
+
+    반환: { total(발생 - 소멸), used, available, accrued, expired, as_of }
+    """
+    on = on or date.today()
+    _ensure_ledger(employee, on)
+    event = (
+        AnnualLeaveEvent.objects.filter(employee_id=employee.id, event_date__lte=on)
+        .order_by('-event_date', '-id')
+        .first()
+    )
+    return _balance_json(event, on)
+
+
+def leave_balances(employees: Iterable[Employee], on: Optional[date] = None) -> Dict[int, Dict]:
+    """여러 Job의 연차 잔여 (Job마다 인덱스를 타는 서브쿼리 1회)"""
+    on = on or date.today()
+    employees = list(employees)
+    for employee in employees:
+        _ensure_ledger(employee, on)
+    latest = AnnualLeaveEvent.objects.filter(employee=OuterRef('pk'), event_date__lte=on).order_by('-event_date', '-id')
+    events = AnnualLeaveEvent.objects.filter(id__in=Subquery(
+        Employee.objects.filter(pk__in=[employee.id for employee in employees])
+        .annotate(latest_event_id=Subquery(latest.values('id')[:1]))
+        .values('latest_event_id')
+    ))
+    by_employee = {event.employee_id: event for event in events}
+    return {employee.id: _balance_json(by_employee.get(employee.id), on) for employee in employees}
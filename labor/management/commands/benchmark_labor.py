@@ -0,0 +1,316 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count, Sum
+from django.test.utils import CaptureQueriesContext, get_runner, setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from labor.synthetic import PopulationSpec, generate_population
+
+
+# 저장소 작업 트리가 아닌 임시 디렉터리에 누적 (다른 위치는 --output으로 지정)
+DEFAULT_OUTPUT = os.path.join(tempfile.gettempdir(), 'labor_benchmarks.json')
+DEFAULT_SIZES = '10k,100k'
+# 직렬화/행 검증 벤치마크의 처리 건수 (데이터 규모와 무관하게 고정, 건당 시간 비교용)
+SERIALIZE_LIMIT = 10000
+
+
+@dataclass
+class Benchmark:
+    """측정 항목 (setup은 매 반복 전에 실행하며 측정에서 제외, warmup이면 측정 전에 한 번 실행)"""
+    name: str
+    run: Callable[[], Any]
+    setup: Optional[Callable[[], None]] = None
+    warmup: bool = False
+    items: Optional[int] = None
+
+
+def parse_size(value: str) -> int:
+    """'10k' / '100k' / '1m' / '250000' → 근로기록 수"""
+    value = value.strip().lower()
+    multiplier = {'k': 1000, 'm': 1000000}.get(value[-1:], 1)
+    number = value[:-1] if multiplier > 1 else value
+    try:
+        return int(float(number) * multiplier)
+    except ValueError:
+        raise CommandError(f"크기 형식 오류: {value} (예: 10k,100k,1m)")
+
+
+def size_label(records: int) -> str:
+    if records % 1000000 == 0:
+        return f'{records // 1000000}m'
+    if records % 1000 == 0:
+        return f'{records // 1000}k'
+    return str(records)
+
+
+def measure(benchmark: Benchmark, repeat: int) -> Dict[str, Any]:
+    if benchmark.warmup:
+        if benchmark.setup:
+            benchmark.setup()
+        benchmark.run()
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        if benchmark.setup:
+            benchmark.setup()
+        with CaptureQueriesContext(connection) as captured:
+            started = perf_counter()
+            benchmark.run()
+            timings.append((perf_counter() - started) * 1000)
+        queries = len(captured)
+    median = statistics.median(timings)
+    return {
+        'name': benchmark.name,
+        'repeat': repeat,
+        'min_ms': round(min(timings), 3),
+        'median_ms': round(median, 3),
+        'max_ms': round(max(timings), 3),
+        'queries': queries,
+        'items': benchmark.items,
+        'us_per_item': round(median * 1000 / benchmark.items, 3) if benchmark.items else None,
+    }
+
+
+def build_benchmarks(today: date) -> List[Benchmark]:
+    """seed 데이터에서 첫 사용자/첫 Job을 표본으로 services, 조회 경로(summary/calendar/evaluation), serializer 측정 항목 구성"""
+    from rest_framework.test import APIClient
+
+    from labor.models import CalculationResult, Employee, WorkRecord
+    from labor.overlaps import overlap_report
+    from labor.response_cache import response_cache
+    from labor.rollups import next_month_start, rebuild_rollups
+    from labor.serializers import WorkRecordImportRowSerializer, WorkRecordSerializer
+    from labor.services import calc_weekly_holiday_pay, calculate_annual_leave, combined_job_totals, evaluate_labor
+    from labor.severance import job_inputs_with_wages
+    from labor.vectorized import JobInputArrays, evaluate_labor_arrays
+    from labor.views import _build_month_summaries
+
+    employees = list(Employee.objects.select_related('user').order_by('id'))
+    job = employees[0]
+    user = job.user
+    month_start = today.replace(day=1)
+    month_end = next_month_start(month_start) - timedelta(days=1)
+    year_first_month = (month_start - timedelta(days=334)).strftime('%Y-%m')
+    month = month_start.strftime('%Y-%m')
+
+    inputs = job_inputs_with_wages(employees, today)
+    evaluations = {employee_id: evaluate_labor(job_inputs, today) for employee_id, job_inputs in inputs.items()}
+    jobs_by_user = defaultdict(list)
+    for employee in employees:
+        jobs_by_user[employee.user_id].append((inputs[employee.id], evaluations[employee.id]))
+    records = list(WorkRecord.objects.order_by('id')[:SERIALIZE_LIMIT])
+    rows = [
+        {
+            'employee': record.employee_id, 'work_date': record.work_date.isoformat(),
+            'time_in': record.time_in.isoformat() if record.time_in else None,
+            'time_out': record.time_out.isoformat() if record.time_out else None,
+            'break_minutes': record.break_minutes,
+        }
+        for record in records
+    ]
+
+    client = APIClient()
+    client.force_authenticate(user)
+
+    def api(path):
+        def run():
+            response = client.get(path)
+            if response.status_code != 200:
+                raise CommandError(f"{path}: status {response.status_code}")
+        return run
+
+    def clear_response_cache():
+        response_cache.cache.clear()
+
+    def drop_snapshots(calculation_type):
+        def setup():
+            CalculationResult.objects.filter(employee=job, calculation_type=calculation_type).delete()
+            clear_response_cache()
+        return setup
+
+    def summaries_all_jobs():
+        _build_month_summaries(Employee.objects.prefetch_related('schedules'), month_start, month_end)
+
+    def validate_rows():
+        for row in rows:
+            WorkRecordImportRowSerializer(data=row).is_valid(raise_exception=True)
+
+    summary = f'/api/labor/jobs/{job.id}/summary/?month={month}'
+    evaluation = f'/api/labor/jobs/{job.id}/evaluation/'
+    return [
+        # labor/services.py (+ 평가 입력값 조회, 배열 버전)
+        Benchmark('services.job_inputs_with_wages', lambda: job_inputs_with_wages(employees, today),
+                  items=len(employees)),
+        Benchmark('services.evaluate_labor', lambda: [evaluate_labor(value, today) for value in inputs.values()],
+                  items=len(inputs)),
+        Benchmark('services.calculate_annual_leave',
+                  lambda: [calculate_annual_leave(value, today) for value in inputs.values()], items=len(inputs)),
+        Benchmark('services.calc_weekly_holiday_pay', lambda: [
+            calc_weekly_holiday_pay(value.weekly_hours, value.hourly_rate, value.work_days_per_week)
+            for value in inputs.values()
+        ], items=len(inputs)),
+        Benchmark('services.combined_job_totals',
+                  lambda: [combined_job_totals(jobs) for jobs in jobs_by_user.values()], items=len(jobs_by_user)),
+        Benchmark('vectorized.evaluate_labor_arrays',
+                  lambda: evaluate_labor_arrays(JobInputArrays.from_inputs(list(inputs.values())), today),
+                  items=len(inputs)),
+
+        # 조회 경로 (cold: 스냅샷/응답 캐시 없음, snapshot: 스냅샷만 있음, cached: 응답 캐시 적중)
+        Benchmark('summary.month_all_jobs', summaries_all_jobs, items=len(employees)),
+        Benchmark('api.summary.cold', api(summary), setup=drop_snapshots(CalculationResult.TYPE_MONTHLY_SUMMARY)),
+        Benchmark('api.summary.snapshot', api(summary), setup=clear_response_cache, warmup=True),
+        Benchmark('api.summary.cached', api(summary), warmup=True),
+        Benchmark('api.evaluation.cold', api(evaluation), setup=drop_snapshots(CalculationResult.TYPE_EVALUATION)),
+        Benchmark('api.evaluation.snapshot', api(evaluation), setup=clear_response_cache, warmup=True),
+        Benchmark('api.evaluation.cached', api(evaluation), warmup=True),
+        Benchmark('api.calendar.month', api(f'/api/labor/jobs/{job.id}/calendar/?month={month}'),
+                  setup=clear_response_cache),
+        Benchmark('api.calendar.year', api(f'/api/labor/jobs/{job.id}/calendar/?from={year_first_month}&to={month}'),
+                  setup=clear_response_cache),
+        Benchmark('api.calendar.cached', api(f'/api/labor/jobs/{job.id}/calendar/?month={month}'), warmup=True),
+        Benchmark('api.evaluations', api('/api/labor/jobs/evaluations/'), setup=clear_response_cache, warmup=True),
+        Benchmark('api.dashboard', api(f'/api/labor/jobs/dashboard/?month={month}'), setup=clear_response_cache,
+                  warmup=True),
+        Benchmark('api.jobs.expand', api('/api/labor/jobs/?expand=work_records,schedules&records_limit=20')),
+
+        # serializers
+        Benchmark('serializers.work_records', lambda: WorkRecordSerializer(records, many=True).data,
+                  items=len(records)),
+        Benchmark('serializers.import_rows', validate_rows, items=len(rows)),
+
+        # ORM / 집계 (데이터 전체 규모에 비례하는 항목)
+        Benchmark('orm.work_record_totals',
+                  lambda: WorkRecord.objects.aggregate(count=Count('id'), minutes=Sum('worked_minutes'))),
+        Benchmark('rollups.rebuild_job', lambda: rebuild_rollups([job.id])),
+        Benchmark('overlaps.user_report', lambda: overlap_report(user)),
+    ]
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': f'{connection.vendor} {connection.Database.sqlite_version}'
+        if connection.vendor == 'sqlite' else connection.vendor,
+        'platform': platform.platform(),
+    }
+
+
+def load_history(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {'runs': []}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def previous_size_result(history: Dict[str, Any], params: Dict[str, Any], label: str) -> Optional[Dict[str, Any]]:
+    """같은 조건(params)으로 같은 크기를 측정한 가장 최근 결과"""
+    for run in reversed(history['runs']):
+        if run['params'] == params and label in run['sizes']:
+            return run['sizes'][label]
+    return None
+
+
+class Command(BaseCommand):
+    help = (
+        "합성 데이터(labor/synthetic.py)를 근로기록 10k/100k/1m 규모로 테스트 DB에 생성하고 "
+        "services, 조회 경로(summary/calendar/evaluation), serializer 실행 시간을 측정해 JSON 이력 파일에 추가합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default=DEFAULT_SIZES, help='근로기록 규모 목록 (예: 10k,100k,1m)')
+        parser.add_argument('--jobs', type=int, default=3, help='사용자별 Job 수')
+        parser.add_argument('--years', type=float, default=3, help='근로기록 기간 (년)')
+        parser.add_argument('--seed', type=int, default=0, help='난수 seed')
+        parser.add_argument('--repeat', type=int, default=5, help='항목별 반복 횟수 (중앙값 비교)')
+        parser.add_argument('--only', default='', help='이름이 이 접두사로 시작하는 항목만 측정 (쉼표 구분)')
+        parser.add_argument('--label', default='', help='실행 설명 (브랜치/변경 내용 등)')
+        parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'결과를 누적할 JSON 파일 (기본 {DEFAULT_OUTPUT})')
+
+    def handle(self, *args, **options):
+        sizes = [parse_size(value) for value in options['sizes'].split(',') if value.strip()]
+        prefixes = tuple(value.strip() for value in options['only'].split(',') if value.strip())
+        # 같은 params로 측정한 이전 결과와 비교 (반복 횟수는 중앙값 비교에 영향이 없으므로 제외)
+        params = {'jobs': options['jobs'], 'years': options['years'], 'seed': options['seed']}
+        history = load_history(options['output'])
+        # 평가/연차 API가 오늘 날짜 기준이므로 데이터도 오늘 기준으로 생성
+        today = date.today()
+
+        run = {
+            'run_at': timezone.now().isoformat(),
+            'label': options['label'],
+            'today': today.isoformat(),
+            'environment': environment(),
+            'params': params,
+            'repeat': options['repeat'],
+            'sizes': {},
+        }
+        setup_test_environment()
+        runner = get_runner(settings)(verbosity=0)
+        try:
+            for records in sizes:
+                label = size_label(records)
+                old_config = runner.setup_databases()
+                try:
+                    spec = PopulationSpec.for_records(
+                        records, jobs_per_user=options['jobs'], years=options['years'], seed=options['seed']
+                    )
+                    self.stdout.write(f"[{label}] 사용자 {spec.users}명 x Job {spec.jobs_per_user}개 데이터 생성 중...")
+                    population = generate_population(spec, today)
+                    results = [
+                        measure(benchmark, options['repeat'])
+                        for benchmark in build_benchmarks(today)
+                        if not prefixes or benchmark.name.startswith(prefixes)
+                    ]
+                finally:
+                    runner.teardown_databases(old_config)
+
+                run['sizes'][label] = {'target_records': records, 'population': population, 'results': results}
+                self.write_results(label, population, results, previous_size_result(history, params, label))
+        finally:
+            teardown_test_environment()
+
+        history['runs'].append(run)
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']} (누적 {len(history['runs'])}회)"))
+
+    def write_results(self, label, population, results, previous):
+        self.stdout.write(
+            f"[{label}] 근로기록 {population['work_records']}건, Job {population['employees']}개 "
+            f"(생성 {sum(population['seconds'].values()):.1f}s)"
+        )
+        before = {result['name']: result for result in (previous or {}).get('results', [])}
+        for result in results:
+            line = (
+                f"  {result['name']:36} {result['median_ms']:10.2f}ms (min {result['min_ms']:.2f}) "
+                f"{result['queries']:4}q"
+            )
+            if result['us_per_item'] is not None:
+                line += f"  {result['us_per_item']:.2f}us/건"
+            old = before.get(result['name'])
+            if old and old['median_ms']:
+                line += f"  이전 대비 {(result['median_ms'] / old['median_ms'] - 1) * 100:+.1f}%"
+            self.stdout.write(line)
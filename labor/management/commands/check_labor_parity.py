@@ -0,0 +1,40 @@
+import random
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from labor.models import Employee
+from labor.services import job_to_inputs
+from labor.synthetic import random_job_inputs
+from labor.vectorized import parity_mismatches
+
+
+class Command(BaseCommand):
+    help = (
+        "스칼라 evaluate_labor와 NumPy 배열 버전(labor/vectorized.py)의 결과가 완전히 같은지 대량 샘플로 검증합니다. "
+        "(작은 고정 seed 샘플은 labor/tests/test_parity.py에서 manage.py test로 검증)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--samples', type=int, default=100000, help='무작위 샘플 수')
+        parser.add_argument('--seed', type=int, default=0, help='난수 seed')
+        parser.add_argument('--today', type=date.fromisoformat, default=None, help='평가 기준일 (YYYY-MM-DD)')
+        parser.add_argument('--from-db', action='store_true', help='무작위 샘플 대신 DB의 모든 Job으로 검증')
+
+    def handle(self, *args, **options):
+        today = options['today'] or date.today()
+        if options['from_db']:
+            jobs = [job_to_inputs(employee) for employee in Employee.objects.iterator(chunk_size=2000)]
+        else:
+            rng = random.Random(options['seed'])
+            jobs = [random_job_inputs(rng, today) for _ in range(options['samples'])]
+
+        started = time.perf_counter()
+        mismatches = parity_mismatches(jobs, today)
+        self.stdout.write(f"Job {len(jobs)}개 검증: {time.perf_counter() - started:.3f}s")
+        if mismatches:
+            for job, scalar, vector in mismatches[:10]:
+                self.stderr.write(f"불일치: {job}\n  scalar={scalar}\n  vector={vector}")
+            raise CommandError(f"결과 불일치 {len(mismatches)}건")
+        self.stdout.write(self.style.SUCCESS("모든 결과가 일치합니다."))
@@ -0,0 +1,57 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from labor.synthetic import BATCH_SIZE, DEFAULT_PASSWORD, PopulationSpec, generate_population
+
+
+class Command(BaseCommand):
+    help = (
+        "합성 데이터(사용자 x Job x 기간의 근로기록, 스케줄, 상담, 문서)를 bulk_create로 생성합니다. "
+        "같은 --seed와 --today면 같은 데이터가 만들어집니다."
+    )
+
+    def add_arguments(self, parser):
+        size = parser.add_mutually_exclusive_group(required=True)
+        size.add_argument('--users', type=int, help='생성할 사용자 수')
+        size.add_argument('--records', type=int, help='근로기록이 약 N건이 되도록 사용자 수 결정')
+        parser.add_argument('--jobs', type=int, default=3, help='사용자별 Job 수')
+        parser.add_argument('--years', type=float, default=3, help='근로기록 기간 (년, 기준일까지)')
+        parser.add_argument('--consultations', type=int, default=2, help='사용자별 상담 수')
+        parser.add_argument('--documents', type=int, default=1, help='사용자별 생성 문서 수')
+        parser.add_argument('--seed', type=int, default=0, help='난수 seed')
+        parser.add_argument('--today', type=date.fromisoformat, default=None, help='기준일 (YYYY-MM-DD)')
+        parser.add_argument('--prefix', default='synthetic-', help='생성할 사용자 username 접두사')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='bulk_create batch 크기')
+        parser.add_argument('--replace', action='store_true', help='같은 접두사의 기존 사용자(와 데이터)를 먼저 삭제')
+
+    def handle(self, *args, **options):
+        options_spec = dict(
+            jobs_per_user=options['jobs'], years=options['years'], seed=options['seed'],
+            consultations_per_user=options['consultations'], documents_per_user=options['documents'],
+            username_prefix=options['prefix'],
+        )
+        if options['records'] is not None:
+            spec = PopulationSpec.for_records(options['records'], **options_spec)
+        else:
+            spec = PopulationSpec(users=options['users'], **options_spec)
+
+        existing = get_user_model().objects.filter(username__startswith=spec.username_prefix)
+        if existing.exists():
+            if not options['replace']:
+                raise CommandError(
+                    f"'{spec.username_prefix}'로 시작하는 사용자가 이미 있습니다. (--replace 또는 다른 --prefix 사용)"
+                )
+            deleted, _ = existing.delete()
+            self.stdout.write(f"기존 데이터 {deleted}건 삭제")
+
+        stats = generate_population(spec, options['today'], batch_size=options['batch_size'])
+        self.stdout.write(
+            f"사용자 {stats['users']}명, Job {stats['employees']}개, 근로기록 {stats['work_records']}건, "
+            f"상담 {stats['consultations']}건, 문서 {stats['documents']}건 "
+            f"({stats['first_day']} ~ {stats['today']})"
+        )
+        for step, seconds in stats['seconds'].items():
+            self.stdout.write(f"  {step}: {seconds:.2f}s")
+        self.stdout.write(self.style.SUCCESS(f"생성 완료 (비밀번호: {DEFAULT_PASSWORD})"))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from labor.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "근로기록(WorkRecord)으로부터 일/월 집계 테이블을 처음부터 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--employee', type=int, action='append', dest='employee_ids',
+            help='재생성할 Job(Employee) id (여러 번 지정 가능, 생략 시 전체)',
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=2000,
+            help='근로기록을 읽어올 때의 chunk 크기',
+        )
+
+    def handle(self, *args, **options):
+        stats = rebuild_rollups(options['employee_ids'], chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"집계 재생성 완료: Job {stats['employees']}개, 근로기록 {stats['records']}건"
+        ))
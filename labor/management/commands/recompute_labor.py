@@ -0,0 +1,76 @@
+import os
+import time
+from datetime import date, datetime, time as dtime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from labor.recompute import read_checkpoint, recompute_evaluations, select_employees
+
+
+def parse_since(value: str) -> datetime:
+    """YYYY-MM-DD 또는 ISO datetime (시간대가 없으면 현재 시간대 기준)"""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"--changed-since 형식 오류: {value}")
+    if len(value) == 10:
+        parsed = datetime.combine(parsed.date(), dtime.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = "모든 Job(또는 조건에 맞는 Job)의 노동법 평가 결과를 다시 계산해 CalculationResult에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--today', type=date.fromisoformat, default=None, help='평가 기준일 (YYYY-MM-DD)')
+        parser.add_argument('--changed-since', type=parse_since, default=None,
+                            help='이 시각 이후 변경된 Job만 (YYYY-MM-DD 또는 ISO datetime)')
+        parser.add_argument('--law-version', type=date.fromisoformat, default=None,
+                            help='해당 법령 기준일(law_version_date)로 계산된 결과가 있는 Job만')
+        parser.add_argument('--employee', type=int, action='append', dest='employee_ids',
+                            help='재계산할 Job(Employee) id (여러 번 지정 가능)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='프로세스 수 (1이면 단일 프로세스)')
+        parser.add_argument('--chunk-size', type=int, default=500, help='Job을 읽고 저장하는 chunk 크기')
+        parser.add_argument('--force', action='store_true', help='유효한 스냅샷이 있어도 다시 계산')
+        parser.add_argument('--checkpoint', default=None,
+                            help='진행 상황 파일 경로 (있으면 같은 기준일의 마지막 처리 Job 다음부터 재개)')
+        parser.add_argument('--restart', action='store_true', help='checkpoint가 있어도 처음부터 실행')
+
+    def handle(self, *args, **options):
+        today = options['today'] or date.today()
+        checkpoint = options['checkpoint']
+        after_id = None if options['restart'] else read_checkpoint(checkpoint, today)
+        if after_id is not None:
+            self.stdout.write(f"checkpoint에서 재개: Job id {after_id} 이후")
+
+        employees = select_employees(
+            changed_since=options['changed_since'],
+            law_version=options['law_version'],
+            employee_ids=options['employee_ids'],
+            after_id=after_id,
+        )
+        started = time.perf_counter()
+
+        def progress(stats):
+            elapsed = time.perf_counter() - started
+            rate = stats['processed'] / elapsed if elapsed else 0
+            self.stdout.write(
+                f"  {stats['processed']}/{stats['total']} 처리 (저장 {stats['written']}, 건너뜀 {stats['skipped']}), "
+                f"{rate:.0f}개/s, 마지막 id {stats['last_id']}"
+            )
+
+        stats = recompute_evaluations(
+            employees, today,
+            workers=max(1, options['workers']),
+            chunk_size=max(1, options['chunk_size']),
+            force=options['force'],
+            checkpoint=checkpoint,
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"재계산 완료 ({today}): Job {stats['processed']}개, 저장 {stats['written']}건, "
+            f"건너뜀 {stats['skipped']}건, {time.perf_counter() - started:.1f}s"
+        ))
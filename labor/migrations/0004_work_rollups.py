@@ -0,0 +1,100 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:48
+
+from collections import defaultdict
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_rollups(apps, schema_editor):
+    """기존 근로기록으로 일/월 집계 채우기 (labor/rollups.py의 build_daily_rollup과 같은 규칙)
+
+    이 시점의 WorkRecord에는 worked_minutes가 없으므로 출퇴근 시각과 휴게시간으로 계산
+    야간/연장/휴일 분은 기록의 플래그 기준 (가산수당 구간 분할은 0011에서 다시 계산)
+    """
+    Employee = apps.get_model('labor', 'Employee')
+    WorkRecord = apps.get_model('labor', 'WorkRecord')
+    WorkDailyRollup = apps.get_model('labor', 'WorkDailyRollup')
+    WorkMonthlyRollup = apps.get_model('labor', 'WorkMonthlyRollup')
+
+    for employee_id, hourly_rate in Employee.objects.values_list('id', 'hourly_rate').iterator():
+        daily = []
+        months = defaultdict(lambda: defaultdict(Decimal))
+        records = WorkRecord.objects.filter(employee_id=employee_id).order_by('work_date')
+        for record in records.iterator(chunk_size=2000):
+            minutes = 0
+            if record.time_in and record.time_out:
+                minutes = int(round((record.time_out - record.time_in).total_seconds() / 60)) - record.break_minutes
+            rollup = WorkDailyRollup(
+                employee_id=employee_id,
+                work_date=record.work_date,
+                worked_minutes=minutes,
+                estimated_pay=(Decimal(minutes) * Decimal(hourly_rate) / 60).quantize(Decimal('0.01')),
+                night_minutes=minutes if record.is_night else 0,
+                overtime_minutes=minutes if record.is_overtime else 0,
+                holiday_minutes=minutes if record.is_holiday else 0,
+            )
+            daily.append(rollup)
+            month = months[record.work_date.replace(day=1)]
+            month['worked_minutes'] += rollup.worked_minutes
+            month['days_worked'] += 1
+            month['estimated_pay'] += rollup.estimated_pay
+            month['night_minutes'] += rollup.night_minutes
+            month['overtime_minutes'] += rollup.overtime_minutes
+            month['holiday_minutes'] += rollup.holiday_minutes
+        WorkDailyRollup.objects.bulk_create(daily, batch_size=1000)
+        WorkMonthlyRollup.objects.bulk_create([
+            WorkMonthlyRollup(
+                employee_id=employee_id, month=month,
+                estimated_pay=totals.pop('estimated_pay'),
+                **{field: int(value) for field, value in totals.items()},
+            )
+            for month, totals in months.items()
+        ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0003_workschedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('work_date', models.DateField()),
+                ('worked_minutes', models.IntegerField(default=0)),
+                ('estimated_pay', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('night_minutes', models.IntegerField(default=0)),
+                ('overtime_minutes', models.IntegerField(default=0)),
+                ('holiday_minutes', models.IntegerField(default=0)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='labor.employee')),
+            ],
+            options={
+                'ordering': ['work_date'],
+                'unique_together': {('employee', 'work_date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WorkMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('worked_minutes', models.IntegerField(default=0)),
+                ('days_worked', models.IntegerField(default=0)),
+                ('estimated_pay', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('night_minutes', models.IntegerField(default=0)),
+                ('overtime_minutes', models.IntegerField(default=0)),
+                ('holiday_minutes', models.IntegerField(default=0)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='labor.employee')),
+            ],
+            options={
+                'ordering': ['month'],
+                'unique_together': {('employee', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:49
+
+from django.db import migrations, models
+
+
+def backfill_worked_minutes(apps, schema_editor):
+    """기존 근로기록의 worked_minutes 채우기 (WorkRecord.get_worked_minutes와 동일한 규칙)"""
+    WorkRecord = apps.get_model('labor', 'WorkRecord')
+    batch = []
+    records = WorkRecord.objects.exclude(time_in=None).exclude(time_out=None)
+    for record in records.iterator(chunk_size=2000):
+        duration = record.time_out - record.time_in
+        record.worked_minutes = int(round(duration.total_seconds() / 60)) - record.break_minutes
+        batch.append(record)
+        if len(batch) >= 1000:
+            WorkRecord.objects.bulk_update(batch, ['worked_minutes'])
+            batch = []
+    WorkRecord.objects.bulk_update(batch, ['worked_minutes'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0004_work_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workrecord',
+            name='worked_minutes',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_worked_minutes, migrations.RunPython.noop),
+    ]
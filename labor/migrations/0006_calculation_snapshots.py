@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0005_workrecord_worked_minutes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calculationresult',
+            name='inputs_hash',
+            field=models.CharField(blank=True, max_length=40),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='data_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='calculationresult',
+            index=models.Index(fields=['employee', 'calculation_type', '-calculated_at'], name='labor_calcu_employe_ae1911_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+# 시행일별 최저임금 (그 외 기준은 모델 기본값)
+INITIAL_MIN_WAGES = [
+    ('2024-01-01', 9860),
+    ('2025-01-01', 10030),
+    ('2026-01-01', 10320),
+]
+
+
+def seed_law_parameters(apps, schema_editor):
+    LawParameterSet = apps.get_model('labor', 'LawParameterSet')
+    LawParameterSet.objects.bulk_create([
+        LawParameterSet(effective_from=effective_from, min_wage=min_wage)
+        for effective_from, min_wage in INITIAL_MIN_WAGES
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0006_calculation_snapshots'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LawParameterSet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('effective_from', models.DateField(unique=True)),
+                ('min_wage', models.IntegerField(help_text='최저임금 (시급)')),
+                ('weekly_holiday_min_hours', models.DecimalField(decimal_places=2, default=15, help_text='주휴수당 최소 주 소정근로시간', max_digits=5)),
+                ('severance_min_weekly_hours', models.DecimalField(decimal_places=2, default=15, help_text='퇴직금 최소 주 소정근로시간', max_digits=5)),
+                ('annual_leave_min_weekly_hours', models.DecimalField(decimal_places=2, default=15, help_text='연차 최소 주 소정근로시간', max_digits=5)),
+                ('annual_leave_min_attendance', models.DecimalField(decimal_places=2, default=0.8, help_text='연차 발생 최소 출근율', max_digits=4)),
+                ('annual_leave_base_days', models.IntegerField(default=15)),
+                ('annual_leave_max_days', models.IntegerField(default=25)),
+            ],
+            options={
+                'ordering': ['effective_from'],
+            },
+        ),
+        migrations.RunPython(seed_law_parameters, migrations.RunPython.noop),
+    ]
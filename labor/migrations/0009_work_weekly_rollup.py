@@ -0,0 +1,95 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:03
+
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# 이 마이그레이션 시점의 규칙을 그대로 고정 (이후 labor/law.py, labor/services.py가 바뀌어도 결과가 같도록 앱 코드를 import하지 않음)
+DEFAULT_WEEKLY_HOLIDAY_MIN_HOURS = 15.0
+
+
+def weekly_holiday_min_hours_lookup(rows):
+    """[(시행일, 주휴수당 최소 주 근로시간)] -> 기준일의 최소 시간 조회 함수 (가장 이른 시행일 이전이면 가장 이른 기준)"""
+    rows = sorted(rows)
+    starts = [effective_from for effective_from, _ in rows]
+
+    def lookup(on):
+        if not rows:
+            return DEFAULT_WEEKLY_HOLIDAY_MIN_HOURS
+        return rows[max(bisect_right(starts, on) - 1, 0)][1]
+
+    return lookup
+
+
+def weekly_holiday_pay(weekly_hours, hourly_rate, work_days, min_hours):
+    """주휴수당 (0009 시점의 calc_weekly_holiday_pay)"""
+    if weekly_hours < min_hours:
+        return 0
+    days = work_days
+    if not days or days <= 0:
+        estimated_daily_hours = weekly_hours if weekly_hours < 24 else weekly_hours / 5
+        days = max(1, int(round(weekly_hours / max(estimated_daily_hours, 1))))
+    return int(round(weekly_hours / days * hourly_rate))
+
+
+def backfill_weekly_rollups(apps, schema_editor):
+    """기존 일 집계로 주 집계/주휴수당 채우기 (labor/rollups.py의 _rebuild_weeks와 같은 규칙)
+
+    주휴수당 기준(주 15시간)은 이 시점의 LawParameterSet 행에서 해당 주 월요일 기준으로 조회
+    """
+    LawParameterSet = apps.get_model('labor', 'LawParameterSet')
+    Employee = apps.get_model('labor', 'Employee')
+    WorkDailyRollup = apps.get_model('labor', 'WorkDailyRollup')
+    WorkWeeklyRollup = apps.get_model('labor', 'WorkWeeklyRollup')
+
+    min_hours = weekly_holiday_min_hours_lookup(
+        (effective_from, float(hours))
+        for effective_from, hours in LawParameterSet.objects.values_list('effective_from', 'weekly_holiday_min_hours')
+    )
+    for employee_id, hourly_rate in Employee.objects.values_list('id', 'hourly_rate').iterator():
+        weeks = defaultdict(lambda: [0, 0])  # 주 월요일 -> [근로시간(분), 근로일수]
+        daily = WorkDailyRollup.objects.filter(employee_id=employee_id, worked_minutes__gt=0)
+        for work_date, minutes in daily.values_list('work_date', 'worked_minutes').iterator(chunk_size=2000):
+            week = weeks[work_date - timedelta(days=work_date.weekday())]
+            week[0] += minutes
+            week[1] += 1
+        WorkWeeklyRollup.objects.bulk_create([
+            WorkWeeklyRollup(
+                employee_id=employee_id,
+                week_start=week_start,
+                worked_minutes=worked,
+                days_worked=days,
+                weekly_holiday_pay=weekly_holiday_pay(worked / 60, float(hourly_rate), days, min_hours(week_start)),
+            )
+            for week_start, (worked, days) in sorted(weeks.items())
+        ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0008_employee_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkWeeklyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField()),
+                ('worked_minutes', models.IntegerField(default=0)),
+                ('days_worked', models.IntegerField(default=0)),
+                ('weekly_holiday_pay', models.IntegerField(default=0)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_rollups', to='labor.employee')),
+            ],
+            options={
+                'ordering': ['week_start'],
+                'unique_together': {('employee', 'week_start')},
+            },
+        ),
+        migrations.RunPython(backfill_weekly_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0009_work_weekly_rollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='leave_ledger_until',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='workrecord',
+            name='leave_days',
+            field=models.DecimalField(decimal_places=1, default=0, help_text='연차 사용 일수 (0, 반차 0.5, 1)', max_digits=2),
+        ),
+        migrations.CreateModel(
+            name='AnnualLeaveEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_date', models.DateField()),
+                ('kind', models.CharField(choices=[('accrual', '발생'), ('use', '사용'), ('expiry', '소멸')], max_length=10)),
+                ('days', models.DecimalField(decimal_places=1, help_text='발생은 +, 사용/소멸은 -', max_digits=4)),
+                ('expires_on', models.DateField(blank=True, help_text='발생 이벤트의 소멸 예정일', null=True)),
+                ('accrued_total', models.DecimalField(decimal_places=1, default=0, max_digits=6)),
+                ('used_total', models.DecimalField(decimal_places=1, default=0, max_digits=6)),
+                ('expired_total', models.DecimalField(decimal_places=1, default=0, max_digits=6)),
+                ('balance', models.DecimalField(decimal_places=1, default=0, max_digits=6)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leave_events', to='labor.employee')),
+            ],
+            options={
+                'ordering': ['event_date', 'id'],
+                'indexes': [models.Index(fields=['employee', '-event_date', '-id'], name='labor_annua_employe_11d924_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,209 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:08
+
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# 이 마이그레이션 시점의 구간 분할 규칙(labor/premiums.py)과 법령 기준 조회(labor/law.py)를 그대로 고정
+# (이후 앱 코드가 바뀌어도 결과가 같도록 앱 코드를 import하지 않음)
+PREMIUM_FIELDS = ['night_minutes', 'overtime_minutes', 'holiday_minutes', 'premium_pay']
+LAW_FIELDS = [
+    'daily_work_hours', 'weekly_work_hours', 'overtime_premium_rate', 'night_premium_rate',
+    'holiday_premium_rate', 'holiday_overtime_premium_rate',
+]
+# LawParameterSet 행이 없을 때의 기준 (0011 시점 기본값)
+DEFAULT_LAW = {
+    'daily_work_hours': Decimal('8'), 'weekly_work_hours': Decimal('40'), 'overtime_premium_rate': Decimal('0.5'),
+    'night_premium_rate': Decimal('0.5'), 'holiday_premium_rate': Decimal('0.5'),
+    'holiday_overtime_premium_rate': Decimal('1.0'),
+}
+
+NIGHT_START = time(22, 0)
+NIGHT_END = time(6, 0)
+
+
+def law_lookup(rows):
+    """[(시행일, 기준 dict)] -> 근로일의 기준 조회 함수 (가장 이른 시행일 이전이면 가장 이른 기준)"""
+    rows = sorted(rows, key=lambda row: row[0])
+    starts = [effective_from for effective_from, _ in rows]
+
+    def lookup(on):
+        if not rows:
+            return DEFAULT_LAW
+        return rows[max(bisect_right(starts, on) - 1, 0)][1]
+
+    return lookup
+
+
+def _local(value):
+    """현지 시각(naive)으로 변환"""
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.replace(tzinfo=None)
+
+
+def night_overlap_minutes(start, end):
+    """[start, end) 구간 중 22:00~06:00에 해당하는 분 (naive 현지 시각)"""
+    total = timedelta()
+    day = start.date() - timedelta(days=1)
+    while day <= end.date():
+        night_start = datetime.combine(day, NIGHT_START)
+        night_end = datetime.combine(day + timedelta(days=1), NIGHT_END)
+        overlap = min(end, night_end) - max(start, night_start)
+        if overlap > timedelta():
+            total += overlap
+        day += timedelta(days=1)
+    return int(round(total.total_seconds() / 60))
+
+
+def split_shift(time_in, time_out, break_minutes):
+    """(근로시간 분, 야간 분) - 휴게시간은 주간 구간에서 먼저 차감"""
+    if not time_in or not time_out or time_out <= time_in:
+        return 0, 0
+    start, end = _local(time_in), _local(time_out)
+    raw = int(round((end - start).total_seconds() / 60))
+    night = night_overlap_minutes(start, end)
+    break_minutes = max(0, break_minutes or 0)
+    day_minutes = raw - night
+    night -= max(0, break_minutes - day_minutes)
+    return max(0, raw - break_minutes), max(0, night)
+
+
+def premium_pay(overtime, night, holiday, holiday_overtime, hourly_rate, law):
+    """가산수당 (가산분만, 원 단위 소수점 2자리)"""
+    weighted = (
+        Decimal(overtime) * law['overtime_premium_rate']
+        + Decimal(night) * law['night_premium_rate']
+        + Decimal(holiday - holiday_overtime) * law['holiday_premium_rate']
+        + Decimal(holiday_overtime) * law['holiday_overtime_premium_rate']
+    )
+    return (weighted * Decimal(hourly_rate) / 60).quantize(Decimal('0.01'))
+
+
+def segment_records(records, hourly_rate, lookup):
+    """work_date 순으로 정렬된 한 Job의 근로기록 -> (record, 야간 분, 연장 분, 휴일 분, 가산수당)
+
+    연장: 1일 법정근로시간 초과분 + ISO 주 법정근로시간 초과분, 휴일근로는 주 누계에서 제외
+    """
+    week_key = None
+    week_regular = 0
+    for record in records:
+        worked, night = split_shift(record.time_in, record.time_out, record.break_minutes)
+        iso_year, iso_week, _ = record.work_date.isocalendar()
+        if (iso_year, iso_week) != week_key:
+            week_key, week_regular = (iso_year, iso_week), 0
+
+        law = lookup(record.work_date)
+        daily_limit = int(law['daily_work_hours'] * 60)
+        weekly_limit = int(law['weekly_work_hours'] * 60)
+        if record.is_holiday:
+            overtime, holiday, holiday_overtime = 0, worked, max(0, worked - daily_limit)
+        else:
+            regular = min(worked, daily_limit)
+            weekly_excess = max(0, week_regular + regular - weekly_limit) - max(0, week_regular - weekly_limit)
+            week_regular += regular
+            overtime, holiday, holiday_overtime = (worked - regular) + weekly_excess, 0, 0
+        pay = premium_pay(overtime, night, holiday, holiday_overtime, hourly_rate, law)
+        yield record, night, overtime, holiday, pay
+
+
+def backfill_premiums(apps, schema_editor):
+    """기존 일/월 집계의 야간/연장/휴일 분과 가산수당을 구간 분할 규칙으로 다시 계산
+
+    기준은 이 시점의 LawParameterSet 행 사용 (실행 중인 law_index는 사용하지 않음)
+    """
+    LawParameterSet = apps.get_model('labor', 'LawParameterSet')
+    Employee = apps.get_model('labor', 'Employee')
+    WorkRecord = apps.get_model('labor', 'WorkRecord')
+    WorkDailyRollup = apps.get_model('labor', 'WorkDailyRollup')
+    WorkMonthlyRollup = apps.get_model('labor', 'WorkMonthlyRollup')
+
+    lookup = law_lookup(
+        (row['effective_from'], {field: Decimal(row[field]) for field in LAW_FIELDS})
+        for row in LawParameterSet.objects.values('effective_from', *LAW_FIELDS)
+    )
+    for employee_id, hourly_rate in Employee.objects.values_list('id', 'hourly_rate').iterator():
+        daily = {rollup.work_date: rollup for rollup in WorkDailyRollup.objects.filter(employee_id=employee_id)}
+        if not daily:
+            continue
+        months = defaultdict(lambda: defaultdict(Decimal))
+        records = WorkRecord.objects.filter(employee_id=employee_id).order_by('work_date')
+        for record, night, overtime, holiday, pay in segment_records(
+            records.iterator(chunk_size=2000), hourly_rate, lookup
+        ):
+            rollup = daily.get(record.work_date)
+            if rollup is None:
+                continue
+            rollup.night_minutes = night
+            rollup.overtime_minutes = overtime
+            rollup.holiday_minutes = holiday
+            rollup.premium_pay = pay
+            month = months[record.work_date.replace(day=1)]
+            for field in PREMIUM_FIELDS:
+                month[field] += getattr(rollup, field)
+        WorkDailyRollup.objects.bulk_update(list(daily.values()), PREMIUM_FIELDS, batch_size=1000)
+
+        monthly = list(WorkMonthlyRollup.objects.filter(employee_id=employee_id))
+        for rollup in monthly:
+            totals = months[rollup.month]
+            rollup.night_minutes = int(totals['night_minutes'])
+            rollup.overtime_minutes = int(totals['overtime_minutes'])
+            rollup.holiday_minutes = int(totals['holiday_minutes'])
+            rollup.premium_pay = totals['premium_pay']
+        WorkMonthlyRollup.objects.bulk_update(monthly, PREMIUM_FIELDS, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0010_annual_leave_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lawparameterset',
+            name='daily_work_hours',
+            field=models.DecimalField(decimal_places=2, default=8, help_text='1일 법정근로시간 (초과분 연장근로)', max_digits=4),
+        ),
+        migrations.AddField(
+            model_name='lawparameterset',
+            name='holiday_overtime_premium_rate',
+            field=models.DecimalField(decimal_places=2, default=1.0, help_text='휴일근로 8시간 초과 가산율', max_digits=4),
+        ),
+        migrations.AddField(
+            model_name='lawparameterset',
+            name='holiday_premium_rate',
+            field=models.DecimalField(decimal_places=2, default=0.5, help_text='휴일근로 8시간 이내 가산율', max_digits=4),
+        ),
+        migrations.AddField(
+            model_name='lawparameterset',
+            name='night_premium_rate',
+            field=models.DecimalField(decimal_places=2, default=0.5, help_text='야간근로(22~06시) 가산율', max_digits=4),
+        ),
+        migrations.AddField(
+            model_name='lawparameterset',
+            name='overtime_premium_rate',
+            field=models.DecimalField(decimal_places=2, default=0.5, help_text='연장근로 가산율', max_digits=4),
+        ),
+        migrations.AddField(
+            model_name='lawparameterset',
+            name='weekly_work_hours',
+            field=models.DecimalField(decimal_places=2, default=40, help_text='1주 법정근로시간 (초과분 연장근로)', max_digits=5),
+        ),
+        migrations.AddField(
+            model_name='workdailyrollup',
+            name='premium_pay',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='연장/야간/휴일 가산수당', max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='workmonthlyrollup',
+            name='premium_pay',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='연장/야간/휴일 가산수당', max_digits=12),
+        ),
+        migrations.RunPython(backfill_premiums, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0011_premium_segments'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workrecord',
+            index=models.Index(fields=['employee', 'time_in'], name='labor_workr_employe_18563f_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:50
+
+from django.db import migrations, models
+
+
+def expire_leave_ledgers(apps, schema_editor):
+    """기존 ledger는 다시 생성할 날짜가 없으므로 다음 조회 때 다시 생성되도록 표시"""
+    Employee = apps.get_model('labor', 'Employee')
+    Employee.objects.filter(leave_ledger_until__isnull=False).update(leave_ledger_until=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0012_workrecord_time_in_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='leave_ledger_refresh_on',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(expire_leave_ledgers, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,8 @@
 # labor/models.py
 from django.db import models
+from django.db.models import F, Sum
 from django.conf import settings
+from django.utils import timezone
 from decimal import Decimal
 from datetime import datetime, timedelta
 
@@ -28,6 +30,14 @@ class Employee(models.Model):
     attendance_rate_last_year = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True, help_text="작년 출근율 0~1")
     total_wage_last_3m = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, help_text="최근 3개월 총임금")
     total_days_last_3m = models.IntegerField(null=True, blank=True, help_text="최근 3개월 총일수")
+    # Job / 근로기록 / 스케줄이 바뀔 때마다 1씩 증가 (계산 스냅샷 유효성 판단용, labor/signals.py)
+    data_version = models.PositiveIntegerField(default=0, editable=False)
+    # 마지막 변경 시각 (data_version과 함께 갱신, recompute_labor --changed-since 용)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # 연차 ledger(AnnualLeaveEvent)가 생성된 마지막 날짜 (None이면 다음 조회 때 생성, labor/leave.py)
+    leave_ledger_until = models.DateField(null=True, blank=True, editable=False)
+    # 이 날짜가 되면 ledger를 다시 생성 (생성 시점 다음 입사기념일 - 작년 출근율을 적용할 발생분이 바뀜)
+    leave_ledger_refresh_on = models.DateField(null=True, blank=True, editable=False)
 
     class Meta:
         verbose_name = "Job"
@@ -36,13 +46,19 @@ class Employee(models.Model):
     def __str__(self):
         return f"{self.workplace_name} ({self.user.username})"
 
+    @classmethod
+    def bump_data_version(cls, employee_ids):
+        """근로기록/스케줄 변경 시 해당 Job들의 data_version 증가 (bulk 작업 후 직접 호출)"""
+        cls.objects.filter(pk__in=list(employee_ids)).update(
+            data_version=F('data_version') + 1, updated_at=timezone.now()
+        )
+
     def get_total_hours_for_period(self, start_date, end_date):
-        """기간 내 근로시간 합계 (분 단위 break 제외)"""
-        records = self.work_records.filter(work_date__range=[start_date, end_date])
-        total = Decimal('0')
-        for record in records:
-            total += record.get_total_hours()
-        return total
+        """기간 내 근로시간 합계 (분 단위 break 제외, DB에서 worked_minutes 합산)"""
+        minutes = self.work_records.filter(
+            work_date__range=[start_date, end_date]
+        ).aggregate(total=Sum('worked_minutes'))['total']
+        return Decimal(minutes or 0) / 60
 
     def get_estimated_pay_for_period(self, start_date, end_date):
         """기간 내 예상 급여 (시급 * 근로시간)"""
@@ -60,28 +76,58 @@ class WorkRecord(models.Model):
     is_overtime = models.BooleanField(default=False)
     is_night = models.BooleanField(default=False)
     is_holiday = models.BooleanField(default=False)
+    leave_days = models.DecimalField(max_digits=2, decimal_places=1, default=0, help_text="연차 사용 일수 (0, 반차 0.5, 1)")
+    # 실제 근로시간(분, break 제외) - save() 시 time_in/time_out/break_minutes로부터 갱신
+    worked_minutes = models.IntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ['-work_date']
         unique_together = [['employee', 'work_date']]
+        indexes = [
+            # 여러 Job에 걸친 근로시간 중복 검사 (labor/overlaps.py)
+            models.Index(fields=['employee', 'time_in']),
+        ]
 
     def __str__(self):
         return f"{self.employee} - {self.work_date}"
 
+    def save(self, *args, **kwargs):
+        self.worked_minutes = self.get_worked_minutes()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'worked_minutes' not in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'worked_minutes'}
+        super().save(*args, **kwargs)
+
     def get_total_hours(self):
-        """실제 근로시간 (break 제외)"""
+        """실제 근로시간 (break 제외, 저장된 worked_minutes 기준)"""
+        return Decimal(self.worked_minutes) / 60
+
+    def get_worked_minutes(self):
+        """time_in/time_out/break_minutes로부터 근로시간(분 단위 정수, break 제외) 계산"""
         if not self.time_in or not self.time_out:
-            return Decimal('0')
-        
+            return 0
         duration = self.time_out - self.time_in
-        total_seconds = duration.total_seconds()
-        total_minutes = total_seconds / 60
-        work_minutes = total_minutes - self.break_minutes
-        
-        return Decimal(str(work_minutes / 60))  # 시간 단위로 변환
+        return int(round(duration.total_seconds() / 60)) - self.break_minutes
+
+
+def worked_aggregates(prefix, condition=None):
+    """근로시간 계산용 aggregate 표현식 (queryset.aggregate(**...)에 전달)
+
+    {prefix}_minutes: worked_minutes 합계
+    condition을 주면 해당 조건의 기록만 집계 (조건부 집계로 여러 구간을 한 쿼리에 계산)
+    """
+    return {f'{prefix}_minutes': Sum('worked_minutes', filter=condition)}
+
+
+def worked_hours_from_aggregates(values, prefix):
+    """worked_aggregates 결과로부터 근로시간(시간 단위, Decimal) 계산"""
+    return Decimal(values.get(f'{prefix}_minutes') or 0) / 60
 
 
 class CalculationResult(models.Model):
+    TYPE_EVALUATION = '전체권리요약'
+    TYPE_MONTHLY_SUMMARY = '월급'
+
     employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="calculation_results")
     period_start = models.DateField(null=True, blank=True)
     period_end = models.DateField(null=True, blank=True)
@@ -100,6 +146,13 @@ class CalculationResult(models.Model):
     detail_json = models.JSONField(null=True, blank=True)
     calculated_at = models.DateTimeField(auto_now_add=True)
     law_version_date = models.DateField(null=True, blank=True)
+    # 계산 입력값 해시 - 같은 입력/법령 기준이면 저장된 결과를 재사용 (labor/snapshots.py)
+    inputs_hash = models.CharField(max_length=40, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employee', 'calculation_type', '-calculated_at']),
+        ]
 
     def __str__(self):
         return f"{self.employee} / {self.calculation_type} ({self.period_start}~{self.period_end})"
@@ -128,3 +181,120 @@ class WorkSchedule(models.Model):
 
     def __str__(self):
         return f"{self.employee} - {self.get_weekday_display()} {self.start_time}-{self.end_time}"
+
+
+class WorkDailyRollup(models.Model):
+    """Job별 일 단위 근로 집계 (WorkRecord 변경 시 증분 갱신, labor/rollups.py 참고)"""
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='daily_rollups')
+    work_date = models.DateField()
+    worked_minutes = models.IntegerField(default=0)
+    estimated_pay = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    night_minutes = models.IntegerField(default=0)
+    overtime_minutes = models.IntegerField(default=0)
+    holiday_minutes = models.IntegerField(default=0)
+    premium_pay = models.DecimalField(max_digits=12, decimal_places=2, default=0, help_text="연장/야간/휴일 가산수당")
+
+    class Meta:
+        ordering = ['work_date']
+        unique_together = [['employee', 'work_date']]
+
+    def __str__(self):
+        return f"{self.employee} - {self.work_date} ({self.worked_minutes}분)"
+
+
+class WorkMonthlyRollup(models.Model):
+    """Job별 월 단위 근로 집계 (month는 해당 월 1일)"""
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='monthly_rollups')
+    month = models.DateField()
+    worked_minutes = models.IntegerField(default=0)
+    days_worked = models.IntegerField(default=0)
+    estimated_pay = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    night_minutes = models.IntegerField(default=0)
+    overtime_minutes = models.IntegerField(default=0)
+    holiday_minutes = models.IntegerField(default=0)
+    premium_pay = models.DecimalField(max_digits=12, decimal_places=2, default=0, help_text="연장/야간/휴일 가산수당")
+
+    class Meta:
+        ordering = ['month']
+        unique_together = [['employee', 'month']]
+
+    def __str__(self):
+        return f"{self.employee} - {self.month:%Y-%m} ({self.worked_minutes}분)"
+
+
+class WorkWeeklyRollup(models.Model):
+    """Job별 ISO 주 단위 근로 집계 + 실제 근로기록 기준 주휴수당 (week_start는 해당 주 월요일)"""
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='weekly_rollups')
+    week_start = models.DateField()
+    worked_minutes = models.IntegerField(default=0)
+    days_worked = models.IntegerField(default=0)
+    weekly_holiday_pay = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ['week_start']
+        unique_together = [['employee', 'week_start']]
+
+    def __str__(self):
+        year, week, _ = self.week_start.isocalendar()
+        return f"{self.employee} - {year}-W{week:02d} ({self.worked_minutes}분)"
+
+
+class AnnualLeaveEvent(models.Model):
+    """연차 ledger - 발생/사용/소멸 이벤트와 이벤트 시점의 누계 (labor/leave.py에서 생성)
+
+    특정 날짜의 잔여 연차는 그 날짜 이전 마지막 이벤트 한 행으로 조회
+    """
+    KIND_ACCRUAL = 'accrual'
+    KIND_USE = 'use'
+    KIND_EXPIRY = 'expiry'
+    KIND_CHOICES = [
+        (KIND_ACCRUAL, '발생'),
+        (KIND_USE, '사용'),
+        (KIND_EXPIRY, '소멸'),
+    ]
+
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='leave_events')
+    event_date = models.DateField()
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    days = models.DecimalField(max_digits=4, decimal_places=1, help_text="발생은 +, 사용/소멸은 -")
+    expires_on = models.DateField(null=True, blank=True, help_text="발생 이벤트의 소멸 예정일")
+    accrued_total = models.DecimalField(max_digits=6, decimal_places=1, default=0)
+    used_total = models.DecimalField(max_digits=6, decimal_places=1, default=0)
+    expired_total = models.DecimalField(max_digits=6, decimal_places=1, default=0)
+    balance = models.DecimalField(max_digits=6, decimal_places=1, default=0)
+
+    class Meta:
+        ordering = ['event_date', 'id']
+        indexes = [
+            models.Index(fields=['employee', '-event_date', '-id']),
+        ]
+
+    def __str__(self):
+        return f"{self.employee} - {self.event_date} {self.get_kind_display()} {self.days}일"
+
+
+class LawParameterSet(models.Model):
+    """시행일별 노동법 계산 기준 (최저임금, 15시간 기준, 연차 출근율/일수, 법정근로시간/가산율 등)
+
+    시행일(effective_from)부터 다음 시행일 전날까지 적용. 조회는 labor/law.py의 메모리 인덱스 사용.
+    """
+    effective_from = models.DateField(unique=True)
+    min_wage = models.IntegerField(help_text="최저임금 (시급)")
+    weekly_holiday_min_hours = models.DecimalField(max_digits=5, decimal_places=2, default=15, help_text="주휴수당 최소 주 소정근로시간")
+    severance_min_weekly_hours = models.DecimalField(max_digits=5, decimal_places=2, default=15, help_text="퇴직금 최소 주 소정근로시간")
+    annual_leave_min_weekly_hours = models.DecimalField(max_digits=5, decimal_places=2, default=15, help_text="연차 최소 주 소정근로시간")
+    annual_leave_min_attendance = models.DecimalField(max_digits=4, decimal_places=2, default=0.8, help_text="연차 발생 최소 출근율")
+    annual_leave_base_days = models.IntegerField(default=15)
+    annual_leave_max_days = models.IntegerField(default=25)
+    daily_work_hours = models.DecimalField(max_digits=4, decimal_places=2, default=8, help_text="1일 법정근로시간 (초과분 연장근로)")
+    weekly_work_hours = models.DecimalField(max_digits=5, decimal_places=2, default=40, help_text="1주 법정근로시간 (초과분 연장근로)")
+    overtime_premium_rate = models.DecimalField(max_digits=4, decimal_places=2, default=0.5, help_text="연장근로 가산율")
+    night_premium_rate = models.DecimalField(max_digits=4, decimal_places=2, default=0.5, help_text="야간근로(22~06시) 가산율")
+    holiday_premium_rate = models.DecimalField(max_digits=4, decimal_places=2, default=0.5, help_text="휴일근로 8시간 이내 가산율")
+    holiday_overtime_premium_rate = models.DecimalField(max_digits=4, decimal_places=2, default=1.0, help_text="휴일근로 8시간 초과 가산율")
+
+    class Meta:
+        ordering = ['effective_from']
+
+    def __str__(self):
+        return f"{self.effective_from} 시행 (최저임금 {self.min_wage:,}원)"
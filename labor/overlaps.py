@@ -0,0 +1,177 @@
+"""labor/overlaps.py
+
+사용자의 여러 Job에 걸친 근로시간 중복 검사
+- 저장 시: (employee, time_in) 인덱스 범위 조회로 겹치는 기록만 찾음
+  근무 1건은 MAX_SHIFT_HOURS를 넘지 않으므로 time_in이 (새 출근 - MAX_SHIFT_HOURS, 새 퇴근) 안인 기록만 후보
+  → Job마다 인덱스 탐색 1회 + 겹치는 기록 수 (기록 수 n에 대해 O(log n))
+- 전체 점검: time_in 순으로 정렬한 기록을 한 번 훑으며 진행 중인 근무를 퇴근 시각 힙으로 유지 (O(n log n))
+- ISO 주별로 구간을 병합해 합산 근로시간 계산 (겹친 시간은 한 번만 셈) → 사업장 합산 주 52시간 점검
+"""
+
+import heapq
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import F
+
+from .models import WorkRecord
+from .rollups import week_start
+
+
+RECENT_WEEKS = 4
+
+MAX_SHIFT_HOURS = 24
+MAX_SHIFT = timedelta(hours=MAX_SHIFT_HOURS)
+# 여러 사업장 합산 주 근로시간 경고 기준 (법정 40시간 + 연장 12시간)
+COMBINED_WEEKLY_LIMIT_HOURS = 52
+
+SCAN_FIELDS = ('id', 'employee_id', 'work_date', 'time_in', 'time_out', 'worked_minutes')
+
+Interval = Tuple[int, int, date, datetime, datetime, int]  # SCAN_FIELDS 순서
+
+
+def _minutes(delta: timedelta) -> int:
+    return int(round(delta.total_seconds() / 60))
+
+
+def find_conflicts(user, time_in: Optional[datetime], time_out: Optional[datetime],
+                   exclude_id: Optional[int] = None) -> List[WorkRecord]:
+    """[time_in, time_out)과 겹치는 사용자의 근로기록 (모든 Job 대상, 출근 시각 순)"""
+    if not time_in or not time_out or time_out <= time_in:
+        return []
+    conflicts = WorkRecord.objects.filter(
+        employee__user=user,
+        time_in__gt=time_in - MAX_SHIFT,
+        time_in__lt=time_out,
+        time_out__gt=time_in,
+    ).select_related('employee').order_by('time_in')
+    if exclude_id is not None:
+        conflicts = conflicts.exclude(pk=exclude_id)
+    return list(conflicts)
+
+
+def conflict_json(record: WorkRecord, time_in: datetime, time_out: datetime) -> Dict:
+    return {
+        'id': record.id,
+        'employee': record.employee_id,
+        'workplace_name': record.employee.workplace_name,
+        'work_date': record.work_date.isoformat(),
+        'time_in': record.time_in.isoformat(),
+        'time_out': record.time_out.isoformat(),
+        'overlap_minutes': _minutes(min(time_out, record.time_out) - max(time_in, record.time_in)),
+    }
+
+
+def sweep_overlaps(intervals: Iterable[Interval]) -> List[Tuple[Interval, Interval, int]]:
+    """time_in 순으로 정렬된 구간에서 겹치는 쌍 [(앞 구간, 뒤 구간, 겹친 분)]
+
+    진행 중인 구간을 퇴근 시각 힙으로 유지하고, 새 구간의 출근 전에 끝난 구간은 제거
+    """
+    active = []  # (time_out, id, interval)
+    pairs = []
+    for interval in intervals:
+        _, _, _, time_in, time_out, _ = interval
+        while active and active[0][0] <= time_in:
+            heapq.heappop(active)
+        for end, _, other in active:
+            pairs.append((other, interval, _minutes(min(end, time_out) - time_in)))
+        heapq.heappush(active, (time_out, interval[0], interval))
+    return pairs
+
+
+def union_minutes(spans: Iterable[Tuple[datetime, datetime]]) -> int:
+    """time_in 순으로 정렬된 [time_in, time_out) 구간들의 합집합 길이(분) - 겹치는 구간을 이어 붙여 한 번만 셈"""
+    total = 0
+    current_start = current_end = None
+    for time_in, time_out in spans:
+        if current_end is not None and time_in <= current_end:
+            current_end = max(current_end, time_out)
+            continue
+        if current_end is not None:
+            total += _minutes(current_end - current_start)
+        current_start, current_end = time_in, time_out
+    if current_end is not None:
+        total += _minutes(current_end - current_start)
+    return total
+
+
+def combined_weekly_minutes(intervals: List[Interval]) -> Dict[date, Dict]:
+    """ISO 주(월요일)별 합산 근로시간 - 겹친 시간은 한 번만 셈
+
+    주마다 근로일 기준 구간을 병합(합집합)하고, 출퇴근 구간 길이 합 - 합집합 길이를 중복 시간으로 차감
+    (3건 이상이 겹쳐도 같은 시간을 여러 번 빼지 않음, 휴게시간은 각 기록의 worked_minutes에서 이미 제외)
+    """
+    weeks = defaultdict(lambda: {'worked_minutes': 0, 'overlap_minutes': 0, 'jobs': set(), 'spans': []})
+    for _, employee_id, work_date, time_in, time_out, worked in intervals:
+        week = weeks[week_start(work_date)]
+        week['worked_minutes'] += worked
+        week['jobs'].add(employee_id)
+        week['spans'].append((time_in, time_out))
+    for week in weeks.values():
+        spans = week.pop('spans')
+        week['overlap_minutes'] = sum(_minutes(time_out - time_in) for time_in, time_out in spans) - union_minutes(spans)
+    return weeks
+
+
+def scan_intervals(user, start: Optional[date] = None, end: Optional[date] = None) -> List[Interval]:
+    """사용자의 출퇴근 시각이 있는 근로기록 (모든 Job, time_in 순, 쿼리 1회)"""
+    records = WorkRecord.objects.filter(employee__user=user, time_in__isnull=False, time_out__isnull=False)
+    if start:
+        records = records.filter(work_date__gte=start)
+    if end:
+        records = records.filter(work_date__lte=end)
+    return list(records.filter(time_out__gt=F('time_in')).order_by('time_in', 'id').values_list(*SCAN_FIELDS))
+
+
+def overlap_report(user, start: Optional[date] = None, end: Optional[date] = None) -> Dict:
+    """사용자의 전체(또는 기간 내) 근로기록 중복 점검 + 주별 합산 근로시간
+
+    반환: { records, conflict_count, conflicts: [...], weeks: [{ week_start, ... }], warnings }
+    """
+    intervals = scan_intervals(user, start, end)
+    pairs = sweep_overlaps(intervals)
+    conflicts = [
+        {
+            'records': [first[0], second[0]],
+            'employees': [first[1], second[1]],
+            'work_dates': [first[2].isoformat(), second[2].isoformat()],
+            'start': second[3].isoformat(),
+            'end': min(first[4], second[4]).isoformat(),
+            'overlap_minutes': minutes,
+        }
+        for first, second, minutes in pairs
+    ]
+
+    weeks = []
+    warnings: List[str] = []
+    for week, totals in sorted(combined_weekly_minutes(intervals).items()):
+        combined = max(0, totals['worked_minutes'] - totals['overlap_minutes'])
+        weeks.append({
+            'week_start': week.isoformat(),
+            'job_count': len(totals['jobs']),
+            'worked_hours': round(totals['worked_minutes'] / 60, 2),
+            'overlap_hours': round(totals['overlap_minutes'] / 60, 2),
+            'combined_hours': round(combined / 60, 2),
+            'over_limit': combined > COMBINED_WEEKLY_LIMIT_HOURS * 60,
+        })
+    if conflicts:
+        warnings.append(f"서로 겹치는 근로기록이 {len(conflicts)}건 있습니다.")
+    over = [week['week_start'] for week in weeks if week['over_limit']]
+    if over:
+        warnings.append(f"여러 사업장 합산 실제 근로시간이 주 {COMBINED_WEEKLY_LIMIT_HOURS}시간을 넘은 주가 {len(over)}개 있습니다.")
+
+    return {
+        'records': len(intervals),
+        'conflict_count': len(conflicts),
+        'conflicts': conflicts,
+        'weeks': weeks,
+        'warnings': warnings,
+    }
+
+
+def recent_combined_weeks(user, today: Optional[date] = None, weeks: int = RECENT_WEEKS) -> List[Dict]:
+    """오늘이 속한 주를 포함한 최근 weeks개 ISO 주의 합산 실제 근로시간 (평가 합산 지표용)"""
+    today = today or date.today()
+    start = week_start(today) - timedelta(weeks=weeks - 1)
+    return overlap_report(user, start, today)['weeks']
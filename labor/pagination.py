@@ -0,0 +1,83 @@
+"""labor/pagination.py
+
+근로기록 키셋(커서) 페이지네이션
+OFFSET 대신 마지막 행의 (employee_id, work_date)를 커서로 사용하므로
+깊은 페이지도 첫 페이지와 같은 비용으로 조회된다. (unique_together 인덱스 사용)
+"""
+
+import base64
+from datetime import date
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class WorkRecordCursorPagination(BasePagination):
+    """(employee_id, work_date) 내림차순 키셋 페이지네이션 (다음 페이지 방향만 지원)
+
+    ?page_size=N 으로 페이지 크기 지정 (최대 max_page_size)
+    응답: { "next": "<다음 페이지 URL 또는 null>", "results": [...] }
+    """
+    page_size = 50
+    max_page_size = 500
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by('-employee_id', '-work_date')
+        if position is not None:
+            employee_id, work_date = position
+            queryset = queryset.filter(
+                Q(employee_id__lt=employee_id) | Q(employee_id=employee_id, work_date__lt=work_date)
+            )
+
+        # 한 행을 더 읽어 다음 페이지 존재 여부 판단
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_position = (rows[-1].employee_id, rows[-1].work_date) if self.has_next else None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('ascii')
+            employee_id, work_date = raw.split(':')
+            return int(employee_id), date.fromisoformat(work_date)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, position):
+        employee_id, work_date = position
+        raw = f'{employee_id}:{work_date.isoformat()}'
+        return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
@@ -0,0 +1,123 @@
+"""labor/premiums.py
+
+연장/야간/휴일 가산수당 구간 분할 엔진
+- time_in/time_out 구간을 현지 시각(settings.TIME_ZONE) 기준으로 분할 (자정을 넘기는 근무 포함)
+- 야간: 22:00~06:00과 겹치는 분
+- 연장: 1일 법정근로시간(8시간) 초과분 + 주(ISO 주) 법정근로시간(40시간) 초과분 (1일 초과분은 주 누계에서 제외)
+- 휴일: is_holiday 기록의 근로시간 (8시간 초과분은 휴일 연장), 휴일근로는 주 40시간 누계에 넣지 않음
+- 휴게시간은 위치를 알 수 없으므로 주간 구간에서 먼저 차감하고 남으면 야간 구간에서 차감
+- 기준값(법정근로시간, 가산율)은 근로일에 시행 중인 LawParameterSet 값 사용
+- segment_records는 (Job, 근로일) 순으로 정렬된 기록을 한 번 순회하며 주 단위 누계만 유지 (기록 수에 선형)
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from django.utils import timezone
+
+from .law import LawParameters, law_parameters
+
+
+NIGHT_START = time(22, 0)
+NIGHT_END = time(6, 0)
+
+
+@dataclass(frozen=True)
+class ShiftSegments:
+    work_date: date
+    worked_minutes: int
+    night_minutes: int
+    overtime_minutes: int
+    holiday_minutes: int
+    holiday_overtime_minutes: int
+
+    def premium_pay(self, hourly_rate, params: Optional[LawParameters] = None) -> Decimal:
+        """가산수당 (가산분만, 기본 시급분 제외 / 원 단위 소수점 2자리, params가 없으면 근로일 기준)"""
+        params = params or law_parameters(self.work_date)
+        holiday_regular = self.holiday_minutes - self.holiday_overtime_minutes
+        weighted = (
+            Decimal(self.overtime_minutes) * Decimal(str(params.overtime_premium_rate))
+            + Decimal(self.night_minutes) * Decimal(str(params.night_premium_rate))
+            + Decimal(holiday_regular) * Decimal(str(params.holiday_premium_rate))
+            + Decimal(self.holiday_overtime_minutes) * Decimal(str(params.holiday_overtime_premium_rate))
+        )
+        return (weighted * Decimal(hourly_rate) / 60).quantize(Decimal('0.01'))
+
+
+def _local(value: datetime) -> datetime:
+    """현지 시각(naive)으로 변환"""
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.replace(tzinfo=None)
+
+
+def night_overlap_minutes(start: datetime, end: datetime) -> int:
+    """[start, end) 구간 중 22:00~06:00에 해당하는 분 (naive 현지 시각, 여러 날에 걸쳐도 가능)"""
+    total = timedelta()
+    day = start.date() - timedelta(days=1)
+    while day <= end.date():
+        night_start = datetime.combine(day, NIGHT_START)
+        night_end = datetime.combine(day + timedelta(days=1), NIGHT_END)
+        overlap = min(end, night_end) - max(start, night_start)
+        if overlap > timedelta():
+            total += overlap
+        day += timedelta(days=1)
+    return int(round(total.total_seconds() / 60))
+
+
+def split_shift(time_in, time_out, break_minutes: int) -> Tuple[int, int]:
+    """(근로시간 분, 야간 분) - 휴게시간은 주간 구간에서 먼저 차감"""
+    if not time_in or not time_out or time_out <= time_in:
+        return 0, 0
+    start, end = _local(time_in), _local(time_out)
+    raw = int(round((end - start).total_seconds() / 60))
+    night = night_overlap_minutes(start, end)
+    break_minutes = max(0, break_minutes or 0)
+    day_minutes = raw - night
+    night -= max(0, break_minutes - day_minutes)
+    return max(0, raw - break_minutes), max(0, night)
+
+
+def segment_records(records: Iterable, lookup: Callable[[date], LawParameters] = law_parameters
+                    ) -> Iterator[Tuple[object, ShiftSegments]]:
+    """(employee_id, work_date) 순으로 정렬된 근로기록을 분할해 (record, ShiftSegments) 순서대로 반환
+
+    주 40시간 초과분은 같은 ISO 주의 기록이 모두 포함되어 있어야 정확함 (labor/rollups.py에서 주 단위로 전달)
+    lookup: 근로일 -> 기준 (마이그레이션에서는 과거 모델 행으로 만든 LawParameterIndex.lookup)
+    """
+    week_key = None
+    week_regular = 0  # 이번 주 누계 (1일 8시간 이내, 휴일 제외)
+    for record in records:
+        worked, night = split_shift(record.time_in, record.time_out, record.break_minutes)
+        iso_year, iso_week, _ = record.work_date.isocalendar()
+        key = (record.employee_id, iso_year, iso_week)
+        if key != week_key:
+            week_key, week_regular = key, 0
+
+        params = lookup(record.work_date)
+        daily_limit = int(params.daily_work_hours * 60)
+        weekly_limit = int(params.weekly_work_hours * 60)
+        if record.is_holiday:
+            segments = ShiftSegments(
+                work_date=record.work_date,
+                worked_minutes=worked,
+                night_minutes=night,
+                overtime_minutes=0,
+                holiday_minutes=worked,
+                holiday_overtime_minutes=max(0, worked - daily_limit),
+            )
+        else:
+            regular = min(worked, daily_limit)
+            weekly_excess = max(0, week_regular + regular - weekly_limit) - max(0, week_regular - weekly_limit)
+            week_regular += regular
+            segments = ShiftSegments(
+                work_date=record.work_date,
+                worked_minutes=worked,
+                night_minutes=night,
+                overtime_minutes=(worked - regular) + weekly_excess,
+                holiday_minutes=0,
+                holiday_overtime_minutes=0,
+            )
+        yield record, segments
@@ -0,0 +1,145 @@
+"""labor/projection.py
+
+주간 스케줄(WorkSchedule) 전개 엔진
+- 활성화된 요일별 스케줄을 임의 기간의 예상 근무(ProjectedShift)로 전개
+- 날짜를 하루씩 돌지 않고 요일별 첫 해당일 + 7일 간격으로 계산
+- 종료 시각이 시작 시각 이전(또는 같으면)이면 다음날 종료(자정 넘김)로 처리
+- 근속 기간(Employee.start_date ~ end_date) 밖의 날짜는 전개하지 않음
+- 월 단위 전개 결과는 스케줄 버전(signature) + 시급 기준으로 프로세스 내 캐시
+  (calendar / summary / projection 엔드포인트에서 재사용)
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .rollups import month_start, next_month_start, pay_for_minutes
+
+
+# (weekday, start_time, end_time) 튜플 - 스케줄 내용이 바뀌면 값이 바뀌므로 캐시 버전으로 사용
+ScheduleSignature = Tuple[Tuple[int, time, time], ...]
+
+
+@dataclass(frozen=True)
+class ProjectedShift:
+    work_date: date
+    start: datetime
+    end: datetime
+    minutes: int
+    estimated_pay: Decimal
+
+
+def schedule_signature(schedules: Iterable) -> ScheduleSignature:
+    """활성화되어 있고 시작/종료 시각이 모두 있는 스케줄만 (weekday 순) 튜플로 변환"""
+    return tuple(sorted(
+        (s.weekday, s.start_time, s.end_time)
+        for s in schedules
+        if s.enabled and s.start_time is not None and s.end_time is not None
+    ))
+
+
+def shift_minutes(start_time: time, end_time: time) -> int:
+    """스케줄 1회 근무 시간(분). 종료 <= 시작이면 자정을 넘기는 근무."""
+    start = start_time.hour * 60 + start_time.minute
+    end = end_time.hour * 60 + end_time.minute
+    if end <= start:
+        end += 24 * 60
+    return end - start
+
+
+@lru_cache(maxsize=2048)
+def _project_month(signature: ScheduleSignature, hourly_rate: Decimal, first_day: date) -> Tuple[ProjectedShift, ...]:
+    end = next_month_start(first_day)
+    shifts = []
+    for weekday, start_time, end_time in signature:
+        minutes = shift_minutes(start_time, end_time)
+        pay = pay_for_minutes(minutes, hourly_rate)
+        day = first_day + timedelta(days=(weekday - first_day.weekday()) % 7)
+        while day < end:
+            start = datetime.combine(day, start_time)
+            shifts.append(ProjectedShift(day, start, start + timedelta(minutes=minutes), minutes, pay))
+            day += timedelta(days=7)
+    shifts.sort(key=lambda shift: shift.start)
+    return tuple(shifts)
+
+
+def project_shifts(signature: ScheduleSignature, hourly_rate, start: date, end: date,
+                   start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[ProjectedShift]:
+    """start~end(포함) 기간의 예상 근무 목록 (월 단위 캐시 결과를 이어 붙임)
+
+    start_date/end_date: 근속 기간 (주면 입사일 이전, 퇴사일 이후 날짜는 제외)
+    """
+    hourly_rate = Decimal(hourly_rate)
+    if start_date is not None:
+        start = max(start, start_date)
+    if end_date is not None:
+        end = min(end, end_date)
+    shifts = []
+    first_day = month_start(start)
+    while first_day <= end:
+        shifts.extend(
+            shift for shift in _project_month(signature, hourly_rate, first_day)
+            if start <= shift.work_date <= end
+        )
+        first_day = next_month_start(first_day)
+    return shifts
+
+
+def merge_with_records(shifts: Iterable[ProjectedShift], records: Iterable, start: date, end: date,
+                       today: Optional[date] = None) -> Dict:
+    """예상 근무와 실제 근로기록을 날짜별로 병합
+
+    expected_minutes: 근로기록이 있는 날은 실제 값, 없는 날은 오늘 이후에 한해 예상 값
+    """
+    today = today or date.today()
+    projected: Dict[date, ProjectedShift] = {shift.work_date: shift for shift in shifts}
+    actual = {record.work_date: record for record in records}
+
+    days = []
+    totals = {'projected_minutes': 0, 'actual_minutes': 0, 'expected_minutes': 0, 'projected_pay': Decimal('0')}
+    for work_date in sorted(set(projected) | set(actual)):
+        if not start <= work_date <= end:
+            continue
+        shift = projected.get(work_date)
+        record = actual.get(work_date)
+        if record is not None:
+            expected_minutes = record.worked_minutes
+        elif shift is not None and work_date >= today:
+            expected_minutes = shift.minutes
+        else:
+            expected_minutes = 0
+        days.append({
+            'date': work_date.isoformat(),
+            'scheduled_start': shift.start.isoformat() if shift else None,
+            'scheduled_end': shift.end.isoformat() if shift else None,
+            'projected_minutes': shift.minutes if shift else 0,
+            'actual_minutes': record.worked_minutes if record is not None else None,
+            'expected_minutes': expected_minutes,
+        })
+        totals['projected_minutes'] += shift.minutes if shift else 0
+        totals['projected_pay'] += shift.estimated_pay if shift else 0
+        totals['actual_minutes'] += record.worked_minutes if record is not None else 0
+        totals['expected_minutes'] += expected_minutes
+    return {'days': days, 'totals': totals}
+
+
+def project_employee(employee, start: date, end: date, today: Optional[date] = None,
+                     schedules=None, records=None) -> Dict:
+    """Job의 스케줄 전개 + 실제 근로기록 병합 (schedules/records를 주면 DB 조회 생략)"""
+    if schedules is None:
+        schedules = employee.schedules.all()
+    if records is None:
+        records = employee.work_records.filter(work_date__gte=start, work_date__lte=end).only(
+            'employee', 'work_date', 'worked_minutes'
+        )
+    shifts = project_shifts(
+        schedule_signature(schedules), employee.hourly_rate, start, end,
+        start_date=employee.start_date, end_date=employee.end_date,
+    )
+    merged = merge_with_records(shifts, records, start, end, today=today)
+    totals = merged['totals']
+    totals['actual_pay'] = pay_for_minutes(totals['actual_minutes'], employee.hourly_rate)
+    totals['expected_pay'] = pay_for_minutes(totals['expected_minutes'], employee.hourly_rate)
+    return merged
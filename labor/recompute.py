@@ -0,0 +1,186 @@
+"""labor/recompute.py
+
+전체(또는 일부) Job의 평가 결과(CalculationResult 스냅샷) 일괄 재계산 (manage.py recompute_labor)
+- Employee를 id 기준 keyset 페이지(chunk_size건)로 읽어 chunk 단위로 프로세스 풀에 분배
+  (chunk 사이에 열린 커서가 없으므로 fork 직전에 DB 연결을 닫아도 안전)
+- 워커는 DB에 접근하지 않는 순수 계산만 수행: 평가는 chunk 단위 NumPy 배열 계산(labor/vectorized.py)
+  (법령 기준 인덱스는 fork 전에 부모 프로세스에서 미리 읽어 둠)
+- 연차 잔여는 부모 프로세스에서 chunk마다 연차 ledger로 조회 (leave_balances, API 스냅샷과 같은 값)
+- 결과는 부모 프로세스에서 chunk마다 bulk_create (Job의 이전 스냅샷은 정리)
+- 이미 유효한 스냅샷이 있는 Job은 건너뛰므로 중단 후 다시 실행해도 같은 결과
+- checkpoint 파일에 마지막으로 저장한 Job id를 기록해 중단 지점부터 재개
+"""
+
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.db import connections
+from django.db.models import Exists, OuterRef
+
+from .law import law_index
+from .leave import leave_balances
+from .models import CalculationResult, Employee
+from .services import JobInputs
+from .severance import job_inputs_with_wages
+from .snapshots import evaluation_hash, evaluation_result, save_evaluation_results, valid_evaluation_snapshots
+from .vectorized import JobInputArrays, evaluate_labor_arrays, result_at
+
+
+INPUT_FIELDS = (
+    'id', 'hourly_rate', 'weekly_hours', 'daily_hours', 'work_days_per_week', 'employment_type',
+    'start_date', 'end_date', 'is_current', 'has_paid_weekly_holiday',
+    'attendance_rate_last_year', 'total_wage_last_3m', 'total_days_last_3m',
+    'leave_ledger_until', 'leave_ledger_refresh_on',
+)
+
+# (Job id, 평가 입력값, 연차 ledger 잔여)
+Job = Tuple[int, JobInputs, Dict]
+
+
+def evaluate_chunk(jobs: List[Tuple[int, JobInputs]], today: date) -> List[Tuple[int, Dict]]:
+    """워커 프로세스에서 실행: [(Job id, JobInputs)] -> [(Job id, 평가 결과)]
+
+    evaluate_labor_arrays로 chunk 전체를 한 번에 계산 (evaluate_labor와 같은 결과, labor/tests/test_parity.py)
+    """
+    if not jobs:
+        return []
+    results = evaluate_labor_arrays(JobInputArrays.from_inputs([inputs for _, inputs in jobs]), today)
+    return [(employee_id, result_at(results, index)) for index, (employee_id, _) in enumerate(jobs)]
+
+
+def _init_worker() -> None:
+    """워커 시작 시 부모에게서 복제된 DB 연결 객체를 버리고, 법령 기준도 다시 읽지 않도록 고정 (워커는 DB를 쓰지 않음)"""
+    connections.close_all()
+    law_index.reload_seconds = None
+
+
+def select_employees(changed_since: Optional[datetime] = None, law_version: Optional[date] = None,
+                     employee_ids: Optional[List[int]] = None, after_id: Optional[int] = None):
+    """재계산 대상 Job queryset (id 순)
+
+    changed_since: 그 이후 Job/근로기록/스케줄이 바뀐 Job (Employee.updated_at)
+    law_version: 해당 법령 기준일로 계산된 평가 스냅샷이 있는 Job
+    after_id: checkpoint 재개 시 마지막으로 처리한 Job id
+    """
+    employees = Employee.objects.order_by('id')
+    if employee_ids:
+        employees = employees.filter(id__in=employee_ids)
+    if changed_since is not None:
+        employees = employees.filter(updated_at__gte=changed_since)
+    if law_version is not None:
+        employees = employees.filter(Exists(CalculationResult.objects.filter(
+            employee=OuterRef('pk'),
+            calculation_type=CalculationResult.TYPE_EVALUATION,
+            law_version_date=law_version,
+        )))
+    if after_id is not None:
+        employees = employees.filter(id__gt=after_id)
+    return employees
+
+
+def _iter_chunks(employees, chunk_size: int, today: date) -> Iterator[List[Job]]:
+    def to_inputs(batch):
+        inputs = job_inputs_with_wages(batch, today)
+        balances = leave_balances(batch, today)
+        return [(employee.id, inputs[employee.id], balances[employee.id]) for employee in batch]
+
+    # .iterator()는 chunk 사이에도 커서를 열어 두므로 id 기준 keyset 페이지로 읽음
+    employees = employees.only(*INPUT_FIELDS).order_by('id')
+    last_id = None
+    while True:
+        page = employees if last_id is None else employees.filter(id__gt=last_id)
+        batch = list(page[:chunk_size])
+        if not batch:
+            return
+        yield to_inputs(batch)
+        last_id = batch[-1].id
+
+
+def read_checkpoint(path: Optional[str], today: date) -> Optional[int]:
+    """같은 기준일의 checkpoint가 있으면 마지막으로 처리한 Job id"""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        state = json.load(f)
+    if state.get('today') != today.isoformat():
+        return None
+    return state.get('last_id')
+
+
+def write_checkpoint(path: Optional[str], today: date, stats: Dict[str, int]) -> None:
+    if not path:
+        return
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'today': today.isoformat(), **stats}, f)
+    os.replace(tmp_path, path)
+
+
+def recompute_evaluations(employees, today: date, workers: int = 1, chunk_size: int = 500,
+                          force: bool = False, checkpoint: Optional[str] = None,
+                          progress: Optional[Callable[[Dict[str, int]], None]] = None) -> Dict[str, int]:
+    """employees(queryset)의 평가 스냅샷을 재계산해 저장
+
+    workers > 1이면 fork 프로세스 풀 사용. chunk 결과는 제출 순서대로 저장되므로
+    checkpoint의 last_id 이전 Job은 모두 저장이 끝난 상태.
+    반환: total / processed / skipped / written / last_id
+    """
+    stats = {'total': employees.count(), 'processed': 0, 'skipped': 0, 'written': 0, 'last_id': None}
+    law_index.all()  # fork 전에 법령 기준을 메모리에 올려 워커가 DB를 조회하지 않도록 함
+
+    def save(chunk: List[Job], computed: List[Tuple[int, Dict]]) -> None:
+        inputs_by_id = {employee_id: inputs for employee_id, inputs, _ in chunk}
+        leave_by_id = {employee_id: annual_leave for employee_id, _, annual_leave in chunk}
+        results = [
+            evaluation_result(employee_id, inputs_by_id[employee_id], evaluation, leave_by_id[employee_id], today)
+            for employee_id, evaluation in computed
+        ]
+        save_evaluation_results(results, batch_size=chunk_size)
+        stats['written'] += len(results)
+        stats['processed'] += len(chunk)
+        stats['last_id'] = chunk[-1][0]
+        write_checkpoint(checkpoint, today, stats)
+        if progress:
+            progress(stats)
+
+    def pending_jobs(chunk: List[Job]) -> List[Tuple[int, JobInputs]]:
+        if force:
+            return [(employee_id, inputs) for employee_id, inputs, _ in chunk]
+        valid = valid_evaluation_snapshots({
+            employee_id: evaluation_hash(inputs, annual_leave) for employee_id, inputs, annual_leave in chunk
+        }, today)
+        stats['skipped'] += len(valid)
+        return [(employee_id, inputs) for employee_id, inputs, _ in chunk if employee_id not in valid]
+
+    chunks = _iter_chunks(employees, chunk_size, today)
+    if workers <= 1:
+        for chunk in chunks:
+            save(chunk, evaluate_chunk(pending_jobs(chunk), today))
+        return stats
+
+    # 첫 chunk의 조회(Job, 임금 집계, 유효 스냅샷)를 마친 뒤 fork 직전에 DB 연결을 닫음
+    # (fork 시작 방식의 풀은 첫 submit에서 워커를 모두 fork, 부모는 다음 chunk 조회에서 다시 연결)
+    first = next(chunks, None)
+    if first is None:
+        return stats
+    first_pending = pending_jobs(first)
+    connections.close_all()
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                             initializer=_init_worker) as pool:
+        in_flight.append((first, pool.submit(evaluate_chunk, first_pending, today)))
+        for chunk in chunks:
+            in_flight.append((chunk, pool.submit(evaluate_chunk, pending_jobs(chunk), today)))
+            # 제출해 둔 chunk 수를 워커 수의 2배로 제한 (메모리 사용량 고정)
+            if len(in_flight) >= workers * 2:
+                done_chunk, future = in_flight.popleft()
+                save(done_chunk, future.result())
+        while in_flight:
+            done_chunk, future = in_flight.popleft()
+            save(done_chunk, future.result())
+    return stats
@@ -0,0 +1,166 @@
+"""labor/response_cache.py
+
+Job 단위 조회 API(summary, calendar, evaluation) 응답 캐시
+- Django cache framework 사용 (CACHES 미설정 시 프로세스 내 LocMemCache, Redis/Memcached 등 공유 캐시로 교체 가능)
+- 키: 사용자 + Job + Job 세대(generation) + 액션 + 쿼리 파라미터 (+ 법령 기준 fingerprint, 기준일이 오늘인 액션은 오늘 날짜)
+- 캐시 적중 시 DB를 조회하지 않음 (Job 소유권은 항목을 저장할 때 get_object()로 확인된 상태)
+  저장해 둔 ETag/Last-Modified로 조건부 GET(labor/conditional.py)도 DB 없이 304 응답
+- 무효화: 근로기록(WorkRecordViewSet, 일괄 업로드)·스케줄(schedules 액션)·Job 수정(EmployeeUpdateSerializer) 시
+  해당 Job의 세대 값만 바꿔 이전 키를 모두 무효화 (트랜잭션 커밋 후)
+  세대 키가 캐시에서 밀려나도 새 값(시각 기반)으로 시작하므로 이전 항목이 다시 살아나지 않음
+- admin/셸 등 위 경로를 거치지 않은 수정은 TIMEOUT 이후 반영
+
+settings 예:
+    LABOR_RESPONSE_CACHE = {'BACKEND': 'default', 'TIMEOUT': 600}
+"""
+
+import hashlib
+import threading
+import time
+from datetime import date
+from functools import wraps
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date
+from rest_framework.response import Response
+
+from .conditional import set_validators
+from .law import law_index
+
+
+DEFAULT_BACKEND = 'default'
+DEFAULT_TIMEOUT = 60 * 10
+KEY_PREFIX = 'labor:resp'
+
+
+class ResponseCache:
+    def __init__(self, backend: str = DEFAULT_BACKEND, timeout: int = DEFAULT_TIMEOUT):
+        self.backend = backend
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls) -> "ResponseCache":
+        config = getattr(settings, 'LABOR_RESPONSE_CACHE', {})
+        return cls(
+            backend=config.get('BACKEND', DEFAULT_BACKEND),
+            timeout=config.get('TIMEOUT', DEFAULT_TIMEOUT),
+        )
+
+    @property
+    def cache(self):
+        return caches[self.backend]
+
+    def _generation_key(self, employee_id) -> str:
+        return f'{KEY_PREFIX}:gen:{employee_id}'
+
+    def generation(self, employee_id) -> int:
+        key = self._generation_key(employee_id)
+        value = self.cache.get(key)
+        if value is None:
+            self.cache.add(key, time.time_ns(), None)
+            value = self.cache.get(key)
+        return value
+
+    def make_key(self, user_id, employee_id, action: str, request, today: Optional[date] = None) -> str:
+        params = sorted((key, value) for key, values in request.query_params.lists() for value in values)
+        raw = f'{params!r}:{law_index.fingerprint()}:{today.isoformat() if today else ""}'
+        digest = hashlib.sha1(raw.encode('utf-8')).hexdigest()
+        return f'{KEY_PREFIX}:{user_id}:{employee_id}:{self.generation(employee_id)}:{action}:{digest}'
+
+    def get(self, key: str) -> Optional[Dict]:
+        entry = self.cache.get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, key: str, entry: Dict) -> None:
+        self.cache.set(key, entry, self.timeout)
+
+    def invalidate(self, employee_ids: Iterable[int]) -> None:
+        """해당 Job들의 캐시 항목을 모두 무효화 (트랜잭션 안이면 커밋 후)"""
+        employee_ids = list(employee_ids)
+
+        def bump():
+            for employee_id in employee_ids:
+                key = self._generation_key(employee_id)
+                try:
+                    self.cache.incr(key)
+                except ValueError:
+                    self.cache.set(key, time.time_ns(), None)
+            with self._lock:
+                self.invalidations += len(employee_ids)
+
+        transaction.on_commit(bump)
+
+    def clear_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'backend': self.backend,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0,
+                'invalidations': self.invalidations,
+            }
+
+
+response_cache = ResponseCache.from_settings()
+
+
+def cached_employee_response(depends_on_today: bool = False):
+    """EmployeeViewSet detail GET 액션용 응답 캐시 데코레이터 (conditional_employee_get 바깥에 적용)
+
+    응답 헤더 X-Cache: HIT / MISS
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(self, request, *args, **kwargs):
+            if request.method != 'GET':
+                return view(self, request, *args, **kwargs)
+            try:
+                # 무효화는 정수 Job id 기준이므로 키도 정수로 정규화 ('01' 등은 캐시하지 않음)
+                employee_id = int(kwargs.get('pk'))
+            except (TypeError, ValueError):
+                return view(self, request, *args, **kwargs)
+            if str(employee_id) != kwargs.get('pk'):
+                return view(self, request, *args, **kwargs)
+
+            today = date.today() if depends_on_today else None
+            key = response_cache.make_key(request.user.pk, employee_id, view.__name__, request, today)
+            entry = response_cache.get(key)
+            if entry is not None:
+                response = get_conditional_response(
+                    request, etag=entry['etag'], last_modified=entry['last_modified']
+                ) or Response(entry['data'])
+                set_validators(response, entry['etag'], entry['last_modified'])
+                response['X-Cache'] = 'HIT'
+                return response
+
+            response = view(self, request, *args, **kwargs)
+            if response.status_code == 200 and isinstance(response, Response) and response.has_header('ETag'):
+                response_cache.set(key, {
+                    'data': response.data,
+                    'etag': response['ETag'],
+                    'last_modified': parse_http_date(response['Last-Modified']),
+                })
+            response['X-Cache'] = 'MISS'
+            return response
+        return wrapped
+    return decorator
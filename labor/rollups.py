@@ -0,0 +1,253 @@
+"""labor/rollups.py
+
+WorkRecord 일/주/월 집계 테이블(WorkDailyRollup, WorkWeeklyRollup, WorkMonthlyRollup) 유지 로직
+- refresh_rollups: 변경된 날짜와 그 날짜가 속한 주/월만 다시 계산 (labor/signals.py에서 호출)
+- rebuild_rollups: 전체 재생성 (manage.py rebuild_labor_rollups), 기간을 주면 그 기간만 (법령 기준 변경 시)
+- ensure_rollups: 집계를 읽기 전에 기간 내 근로기록 수와 일 집계 수가 다른 Job만 재생성
+  (bulk_create 등 signal을 거치지 않은 기록이 있어도 집계 기반 계산이 0으로 나오지 않도록)
+- 야간/연장/휴일 분과 가산수당은 labor/premiums.py의 구간 분할 결과 사용
+  (주 40시간 초과 연장은 같은 주의 다른 날에 영향을 주므로 변경된 날짜가 속한 ISO 주 전체를 다시 계산)
+"""
+
+import calendar
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncMonth, TruncWeek
+
+from .law import law_parameters
+from .models import Employee, WorkRecord, WorkDailyRollup, WorkMonthlyRollup, WorkWeeklyRollup
+from .premiums import ShiftSegments, segment_records
+from .services import calc_weekly_holiday_pay
+
+
+BATCH_SIZE = 1000
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def next_month_start(d: date) -> date:
+    if d.month == 12:
+        return date(d.year + 1, 1, 1)
+    return date(d.year, d.month + 1, 1)
+
+
+def add_months(d: date, months: int) -> date:
+    """d의 months개월 뒤(음수면 앞) 같은 날 (말일을 넘으면 그 달 말일)"""
+    month_index = d.month - 1 + months
+    year, month = d.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(d.day, calendar.monthrange(year, month)[1]))
+
+
+def week_start(d: date) -> date:
+    """ISO 주의 월요일"""
+    return d - timedelta(days=d.weekday())
+
+
+def pay_for_minutes(minutes: int, hourly_rate) -> Decimal:
+    """근로시간(분) * 시급 (원 단위 소수점 2자리)"""
+    return (Decimal(minutes) * Decimal(hourly_rate) / 60).quantize(Decimal('0.01'))
+
+
+def build_daily_rollup(record: WorkRecord, segments: ShiftSegments, hourly_rate) -> WorkDailyRollup:
+    """WorkRecord 한 건과 구간 분할 결과를 일 집계 행으로 변환"""
+    minutes = record.worked_minutes
+    return WorkDailyRollup(
+        employee_id=record.employee_id,
+        work_date=record.work_date,
+        worked_minutes=minutes,
+        estimated_pay=pay_for_minutes(minutes, hourly_rate),
+        night_minutes=segments.night_minutes,
+        overtime_minutes=segments.overtime_minutes,
+        holiday_minutes=segments.holiday_minutes,
+        premium_pay=segments.premium_pay(hourly_rate),
+    )
+
+
+def build_daily_rollups(records: Iterable[WorkRecord], hourly_rate) -> Iterable[WorkDailyRollup]:
+    """(employee, work_date) 순 근로기록을 일 집계 행으로 변환 (주 단위 연장근로 누계 포함)"""
+    for record, segments in segment_records(records):
+        yield build_daily_rollup(record, segments, hourly_rate)
+
+
+def _rebuild_months(employee_id: int, months: Optional[Iterable[date]] = None) -> None:
+    """일 집계 테이블에서 월 집계를 다시 계산 (months가 None이면 전체 월)"""
+    daily = WorkDailyRollup.objects.filter(employee_id=employee_id)
+    monthly = WorkMonthlyRollup.objects.filter(employee_id=employee_id)
+    if months is not None:
+        months = set(months)
+        if not months:
+            return
+        in_months = Q()
+        for m in months:
+            in_months |= Q(work_date__gte=m, work_date__lt=next_month_start(m))
+        daily = daily.filter(in_months)
+        monthly = monthly.filter(month__in=months)
+
+    rows = (
+        daily.annotate(rollup_month=TruncMonth('work_date'))
+        .values('rollup_month')
+        .annotate(
+            worked=Sum('worked_minutes'),
+            days=Count('id'),
+            pay=Sum('estimated_pay'),
+            night=Sum('night_minutes'),
+            overtime=Sum('overtime_minutes'),
+            holiday=Sum('holiday_minutes'),
+            premium=Sum('premium_pay'),
+        )
+        .order_by()
+    )
+    objs = [
+        WorkMonthlyRollup(
+            employee_id=employee_id,
+            month=row['rollup_month'],
+            worked_minutes=row['worked'],
+            days_worked=row['days'],
+            estimated_pay=row['pay'],
+            night_minutes=row['night'],
+            overtime_minutes=row['overtime'],
+            holiday_minutes=row['holiday'],
+            premium_pay=row['premium'],
+        )
+        for row in rows
+    ]
+    monthly.delete()
+    WorkMonthlyRollup.objects.bulk_create(objs, batch_size=BATCH_SIZE)
+
+
+def weekly_holiday_pay_for(week: date, worked_minutes: int, days_worked: int, hourly_rate) -> int:
+    """실제 근로기록 기준 주휴수당 (해당 주 월요일에 시행 중인 15시간 기준, 1일 평균 근로시간 * 시급)"""
+    if not days_worked:
+        return 0
+    return calc_weekly_holiday_pay(worked_minutes / 60, float(hourly_rate), days_worked, law_parameters(week))
+
+
+def _rebuild_weeks(employee_id: int, hourly_rate, weeks: Optional[Iterable[date]] = None) -> None:
+    """일 집계 테이블에서 주 집계/주휴수당을 다시 계산 (weeks가 None이면 전체 주)"""
+    daily = WorkDailyRollup.objects.filter(employee_id=employee_id)
+    weekly = WorkWeeklyRollup.objects.filter(employee_id=employee_id)
+    if weeks is not None:
+        weeks = set(weeks)
+        if not weeks:
+            return
+        in_weeks = Q()
+        for w in weeks:
+            in_weeks |= Q(work_date__gte=w, work_date__lt=w + timedelta(days=7))
+        daily = daily.filter(in_weeks)
+        weekly = weekly.filter(week_start__in=weeks)
+
+    rows = (
+        daily.filter(worked_minutes__gt=0)
+        .annotate(rollup_week=TruncWeek('work_date'))
+        .values('rollup_week')
+        .annotate(worked=Sum('worked_minutes'), days=Count('id'))
+        .order_by()
+    )
+    objs = [
+        WorkWeeklyRollup(
+            employee_id=employee_id,
+            week_start=row['rollup_week'],
+            worked_minutes=row['worked'],
+            days_worked=row['days'],
+            weekly_holiday_pay=weekly_holiday_pay_for(row['rollup_week'], row['worked'], row['days'], hourly_rate),
+        )
+        for row in rows
+    ]
+    weekly.delete()
+    WorkWeeklyRollup.objects.bulk_create(objs, batch_size=BATCH_SIZE)
+
+
+def refresh_rollups(employee_id: int, dates: Iterable[date]) -> None:
+    """지정한 날짜들이 속한 ISO 주의 일 집계와 해당 주/월 집계만 증분 갱신"""
+    dates = set(dates)
+    if not dates:
+        return
+    hourly_rate = (
+        Employee.objects.filter(pk=employee_id).values_list('hourly_rate', flat=True).first()
+    )
+    if hourly_rate is None:
+        # Job이 삭제되는 중이면 집계도 CASCADE로 함께 삭제됨
+        return
+
+    weeks = {week_start(d) for d in dates}
+    in_weeks = Q()
+    for w in weeks:
+        in_weeks |= Q(work_date__gte=w, work_date__lt=w + timedelta(days=7))
+    records = WorkRecord.objects.filter(in_weeks, employee_id=employee_id).order_by('work_date')
+    with transaction.atomic():
+        WorkDailyRollup.objects.filter(in_weeks, employee_id=employee_id).delete()
+        WorkDailyRollup.objects.bulk_create(list(build_daily_rollups(records, hourly_rate)), batch_size=BATCH_SIZE)
+        _rebuild_weeks(employee_id, hourly_rate, weeks)
+        # 주가 월 경계에 걸치면 양쪽 월 모두 갱신
+        _rebuild_months(employee_id, {month_start(w + timedelta(days=i)) for w in weeks for i in (0, 6)})
+
+
+def rebuild_rollups(employee_ids: Optional[Iterable[int]] = None, chunk_size: int = 2000,
+                    start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, int]:
+    """일/주/월 집계를 근로기록에서 처음부터 다시 생성
+
+    employee_ids를 주면 해당 Job만 재생성. start~end(미포함)를 주면 그 기간이 걸친 ISO 주의 일 집계만 다시 만들고
+    (그 기간에 근로기록이 있는 Job만) 주/월 집계는 일 집계에서 전체 재계산. 처리한 Job/기록 수를 반환.
+    """
+    in_range = Q()
+    if start is not None:
+        in_range &= Q(work_date__gte=week_start(start))
+    if end is not None:
+        in_range &= Q(work_date__lt=week_start(end - timedelta(days=1)) + timedelta(days=7))
+
+    employees = Employee.objects.all().order_by('id')
+    if employee_ids is not None:
+        employees = employees.filter(id__in=list(employee_ids))
+    if start is not None or end is not None:
+        employees = employees.filter(Exists(WorkRecord.objects.filter(in_range, employee=OuterRef('pk'))))
+
+    stats = {'employees': 0, 'records': 0}
+    for employee_id, hourly_rate in employees.values_list('id', 'hourly_rate').iterator():
+        with transaction.atomic():
+            WorkDailyRollup.objects.filter(in_range, employee_id=employee_id).delete()
+            batch = []
+            records = WorkRecord.objects.filter(in_range, employee_id=employee_id).order_by('work_date')
+            for rollup in build_daily_rollups(records.iterator(chunk_size=chunk_size), hourly_rate):
+                batch.append(rollup)
+                if len(batch) >= BATCH_SIZE:
+                    WorkDailyRollup.objects.bulk_create(batch)
+                    stats['records'] += len(batch)
+                    batch = []
+            WorkDailyRollup.objects.bulk_create(batch)
+            stats['records'] += len(batch)
+            _rebuild_weeks(employee_id, hourly_rate)
+            _rebuild_months(employee_id)
+        stats['employees'] += 1
+    return stats
+
+
+def _count_in(model, start: date, end: date):
+    return Subquery(
+        model.objects.filter(employee=OuterRef('pk'), work_date__gte=start, work_date__lt=end)
+        .values('employee').annotate(n=Count('id')).values('n')
+    )
+
+
+def ensure_rollups(employee_ids: Iterable[int], start: date, end: date) -> List[int]:
+    """start~end(미포함) 기간의 근로기록 수와 일 집계 수가 다른 Job의 집계를 재생성 (확인은 쿼리 1회)
+
+    일 집계는 근로기록 1건당 1행이므로 수가 같으면 최신 상태. 재생성한 Job id 목록을 반환.
+    """
+    stale = list(
+        Employee.objects.filter(id__in=list(employee_ids))
+        .annotate(
+            record_count=Coalesce(_count_in(WorkRecord, start, end), 0),
+            rollup_count=Coalesce(_count_in(WorkDailyRollup, start, end), 0),
+        )
+        .exclude(record_count=F('rollup_count'))
+        .values_list('id', flat=True)
+    )
+    if stale:
+        rebuild_rollups(stale)
+    return stale
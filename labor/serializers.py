@@ -3,6 +3,26 @@ from rest_framework import serializers
 from datetime import datetime, timedelta
 from decimal import Decimal
 from .models import Employee, WorkRecord, CalculationResult, WorkSchedule
+from .evaluation_cache import evaluation_cache
+from .response_cache import response_cache
+from .services import job_to_inputs
+from .overlaps import MAX_SHIFT, MAX_SHIFT_HOURS
+
+
+def validate_shift(time_in, time_out):
+    """출퇴근 시각 순서와 근무 1건의 최대 길이 (중복 검사 인덱스 조회 범위) 검증 후 퇴근 시각 반환
+
+    퇴근 시각이 출근 시각보다 이르고 하루를 더하면 24시간 미만 근무가 되면 자정을 넘긴 근무로 보고
+    다음 날로 옮김 (근무일 날짜로 출퇴근 시각을 만드는 클라이언트의 22:00~06:00 야간 근무)
+    """
+    if time_in and time_out:
+        if time_out < time_in and time_out + timedelta(days=1) - time_in < MAX_SHIFT:
+            time_out += timedelta(days=1)
+        if time_out < time_in:
+            raise serializers.ValidationError({"time_out": "퇴근 시각은 출근 시각 이후여야 합니다."})
+        if time_out - time_in > MAX_SHIFT:
+            raise serializers.ValidationError({"time_out": f"근무 1건은 {MAX_SHIFT_HOURS}시간을 넘을 수 없습니다."})
+    return time_out
 
 
 class WorkRecordSerializer(serializers.ModelSerializer):
@@ -12,13 +32,49 @@ class WorkRecordSerializer(serializers.ModelSerializer):
         model = WorkRecord
         fields = [
             'id', 'work_date', 'time_in', 'time_out', 'break_minutes',
-            'total_hours', 'is_overtime', 'is_night', 'is_holiday'
+            'worked_minutes', 'total_hours', 'is_overtime', 'is_night', 'is_holiday', 'leave_days'
         ]
 
     def get_total_hours(self, obj):
         """실제 근로시간 계산"""
         return float(obj.get_total_hours())
 
+    def validate_leave_days(self, value):
+        """연차 사용 일수는 0~1일 (반차 0.5)"""
+        if value < 0 or value > 1:
+            raise serializers.ValidationError("연차 사용 일수는 0 이상 1 이하여야 합니다.")
+        return value
+
+    def validate(self, data):
+        # 부분 수정(PATCH) 시 빠진 값은 기존 기록 값 사용
+        time_in = data.get('time_in', getattr(self.instance, 'time_in', None))
+        time_out = data.get('time_out', getattr(self.instance, 'time_out', None))
+        checked_out = validate_shift(time_in, time_out)
+        if checked_out != time_out:
+            data['time_out'] = checked_out
+        return data
+
+
+class WorkRecordImportRowSerializer(serializers.Serializer):
+    """근로기록 일괄 업로드(CSV/JSON Lines)의 한 행 검증용 (DB 조회 없음, 소유권은 labor/imports.py에서 확인)"""
+    employee = serializers.IntegerField()
+    work_date = serializers.DateField()
+    time_in = serializers.DateTimeField(required=False, allow_null=True)
+    time_out = serializers.DateTimeField(required=False, allow_null=True)
+    break_minutes = serializers.IntegerField(required=False, default=0, min_value=0)
+    is_overtime = serializers.BooleanField(required=False, default=False)
+    is_night = serializers.BooleanField(required=False, default=False)
+    is_holiday = serializers.BooleanField(required=False, default=False)
+    leave_days = serializers.DecimalField(max_digits=2, decimal_places=1, required=False, default=0,
+                                          min_value=0, max_value=1)
+
+    def validate(self, data):
+        time_in = data.get('time_in')
+        time_out = data.get('time_out')
+        if time_out:
+            data['time_out'] = validate_shift(time_in, time_out)
+        return data
+
 
 class JobSummarySerializer(serializers.Serializer):
     """특정 월의 근로 요약 정보"""
@@ -45,8 +101,18 @@ class WorkScheduleSerializer(serializers.ModelSerializer):
 
 
 class EmployeeSerializer(serializers.ModelSerializer):
-    work_records = WorkRecordSerializer(many=True, read_only=True)
+    """Job 목록/상세용 Serializer
+
+    기본은 근로기록 수와 최근 근로일만 포함하는 간략 표현이며,
+    context['expand']에 'work_records' / 'schedules'가 있을 때만 중첩 목록을 포함한다.
+    (EmployeeViewSet에서 ?expand=work_records,schedules&records_limit=N 으로 전달)
+    """
+    EXPANDABLE_FIELDS = ('work_records', 'schedules')
+
+    work_records = serializers.SerializerMethodField()
     schedules = WorkScheduleSerializer(many=True, read_only=True)
+    work_record_count = serializers.SerializerMethodField()
+    latest_work_date = serializers.SerializerMethodField()
 
     class Meta:
         model = Employee
@@ -56,10 +122,36 @@ class EmployeeSerializer(serializers.ModelSerializer):
             'hourly_rate', 'weekly_hours', 'daily_hours',
             'has_paid_weekly_holiday', 'is_severance_eligible', 'is_current',
             'work_days_per_week', 'attendance_rate_last_year', 'total_wage_last_3m', 'total_days_last_3m',
+            'work_record_count', 'latest_work_date',
             'work_records', 'schedules'
         ]
         read_only_fields = ['id']
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        expand = self.context.get('expand', ())
+        for name in self.EXPANDABLE_FIELDS:
+            if name not in expand:
+                self.fields.pop(name)
+
+    def get_work_records(self, obj):
+        """최근 근로기록 (records_limit개, EmployeeViewSet에서 Prefetch로 미리 로드)"""
+        records = getattr(obj, 'expanded_work_records', None)
+        if records is None:
+            records = obj.work_records.order_by('-work_date')[:self.context.get('records_limit')]
+        return WorkRecordSerializer(records, many=True).data
+
+    def get_work_record_count(self, obj):
+        count = getattr(obj, 'work_record_count', None)
+        return count if count is not None else obj.work_records.count()
+
+    def get_latest_work_date(self, obj):
+        if hasattr(obj, 'latest_work_date'):
+            latest = obj.latest_work_date
+        else:
+            latest = obj.work_records.order_by('-work_date').values_list('work_date', flat=True).first()
+        return latest.isoformat() if latest else None
+
 
 class EmployeeUpdateSerializer(serializers.ModelSerializer):
     """Employee 근로정보 수정용 Serializer (PATCH/PUT)"""
@@ -74,6 +166,12 @@ class EmployeeUpdateSerializer(serializers.ModelSerializer):
             'work_days_per_week', 'attendance_rate_last_year', 'total_wage_last_3m', 'total_days_last_3m'
         ]
 
+    def update(self, instance, validated_data):
+        # 수정 전 입력값으로 계산된 평가/연차 캐시와 Job 응답 캐시 삭제
+        evaluation_cache.invalidate(job_to_inputs(instance))
+        response_cache.invalidate([instance.pk])
+        return super().update(instance, validated_data)
+
     def validate_hourly_rate(self, value):
         """시급은 0 이상이어야 함"""
         if value < 0:
@@ -9,8 +9,7 @@ from datetime import date
 from math import floor
 from typing import Optional, Dict, Any, List
 
-
-MIN_WAGE_2025 = 10030  # 2025년 최저임금 (시급)
+from .law import LawParameters, law_index, law_parameters
 
 
 @dataclass
@@ -33,15 +32,38 @@ def calc_service_days(start: date, today: date) -> int:
     return (today - start).days
 
 
-def check_minimum_wage(hourly_rate: float) -> Dict[str, Any]:
+def law_reference_date(job: JobInputs, today: date) -> date:
+    """적용 법령 기준일 - 이미 퇴사한 Job은 퇴사일, 그 외는 기준일(today)"""
+    if job.end_date is not None and job.end_date < today:
+        return job.end_date
+    return today
+
+
+def check_minimum_wage(hourly_rate: float, params: Optional[LawParameters] = None) -> Dict[str, Any]:
+    params = params or law_parameters()
     return {
-        "min_wage_ok": hourly_rate >= MIN_WAGE_2025,
-        "min_wage_required": MIN_WAGE_2025,
+        "min_wage_ok": hourly_rate >= params.min_wage,
+        "min_wage_required": params.min_wage,
     }
 
 
-def calc_weekly_holiday_pay(weekly_hours: float, hourly_rate: float, work_days_per_week: Optional[int]) -> int:
-    if weekly_hours < 15:
+def min_wage_periods(hourly_rate: float, start: date, end: date) -> List[Dict[str, Any]]:
+    """start~end 기간을 최저임금 시행일 경계로 나누어 구간별 충족 여부 반환"""
+    return [
+        {
+            "start": segment_start.isoformat(),
+            "end": segment_end.isoformat(),
+            "effective_from": params.effective_from.isoformat(),
+            **check_minimum_wage(hourly_rate, params),
+        }
+        for segment_start, segment_end, params in law_index.split(start, end)
+    ]
+
+
+def calc_weekly_holiday_pay(weekly_hours: float, hourly_rate: float, work_days_per_week: Optional[int],
+                            params: Optional[LawParameters] = None) -> int:
+    params = params or law_parameters()
+    if weekly_hours < params.weekly_holiday_min_hours:
         return 0
     days = work_days_per_week
     if not days or days <= 0:
@@ -54,7 +76,9 @@ def calc_weekly_holiday_pay(weekly_hours: float, hourly_rate: float, work_days_p
     return int(round(pay))
 
 
-def calc_annual_leave(start_date: date, attendance_rate_last_year: Optional[float], today: date) -> float:
+def calc_annual_leave(start_date: date, attendance_rate_last_year: Optional[float], today: date,
+                      params: Optional[LawParameters] = None) -> float:
+    params = params or law_parameters(today)
     service_days = calc_service_days(start_date, today)
     service_years = floor(service_days / 365)
 
@@ -63,19 +87,21 @@ def calc_annual_leave(start_date: date, attendance_rate_last_year: Optional[floa
         return float(months)
 
     # 1년 이상
-    if attendance_rate_last_year is not None and attendance_rate_last_year < 0.8:
+    if attendance_rate_last_year is not None and attendance_rate_last_year < params.annual_leave_min_attendance:
         return 0.0
 
-    base = 15
+    base = params.annual_leave_base_days
     if service_years >= 3:
         extra_years = service_years - 1
         extra_days = extra_years // 2
-        return float(min(25, base + extra_days))
+        return float(min(params.annual_leave_max_days, base + extra_days))
     return float(base)
 
 
-def calc_severance(service_years: int, weekly_hours: float, total_wage_last_3m: Optional[float], total_days_last_3m: Optional[int]) -> int:
-    if service_years < 1 or weekly_hours < 15:
+def calc_severance(service_years: int, weekly_hours: float, total_wage_last_3m: Optional[float], total_days_last_3m: Optional[int],
+                   params: Optional[LawParameters] = None) -> int:
+    params = params or law_parameters()
+    if service_years < 1 or weekly_hours < params.severance_min_weekly_hours:
         return 0
     if not total_wage_last_3m or not total_days_last_3m or total_days_last_3m <= 0:
         return 0
@@ -88,22 +114,28 @@ def evaluate_labor(job: JobInputs, today: Optional[date] = None) -> Dict[str, An
     today = today or date.today()
     service_days = calc_service_days(job.start_date, today)
     service_years = floor(service_days / 365)
+    # 기준일(퇴사한 Job은 퇴사일)에 시행 중인 법령 기준 적용
+    reference_date = law_reference_date(job, today)
+    params = law_parameters(reference_date)
 
-    min_wage = check_minimum_wage(job.hourly_rate)
-    weekly_holiday_pay = calc_weekly_holiday_pay(job.weekly_hours, job.hourly_rate, job.work_days_per_week)
-    annual_leave_days = calc_annual_leave(job.start_date, job.attendance_rate_last_year, today)
-    severance_estimate = calc_severance(service_years, job.weekly_hours, job.total_wage_last_3m, job.total_days_last_3m)
+    min_wage = check_minimum_wage(job.hourly_rate, params)
+    weekly_holiday_pay = calc_weekly_holiday_pay(job.weekly_hours, job.hourly_rate, job.work_days_per_week, params)
+    annual_leave_days = calc_annual_leave(job.start_date, job.attendance_rate_last_year, today, params)
+    severance_estimate = calc_severance(service_years, job.weekly_hours, job.total_wage_last_3m, job.total_days_last_3m, params)
 
     warnings: List[str] = []
     if not min_wage["min_wage_ok"]:
-        warnings.append("최저임금(10,030원) 미달 가능성이 있습니다.")
-    if job.weekly_hours >= 15 and weekly_holiday_pay == 0:
-        warnings.append("주 15시간 이상인데 주휴수당이 반영되지 않았을 수 있습니다.")
+        warnings.append(f"최저임금({params.min_wage:,}원) 미달 가능성이 있습니다.")
+    if job.weekly_hours >= params.weekly_holiday_min_hours and weekly_holiday_pay == 0:
+        warnings.append(f"주 {params.weekly_holiday_min_hours:g}시간 이상인데 주휴수당이 반영되지 않았을 수 있습니다.")
     if service_days >= 365 and severance_estimate == 0:
         warnings.append("1년 이상 근속인데 퇴직금 계산 정보(최근 3개월 임금 등)가 부족합니다.")
 
     return {
         **min_wage,
+        "law_effective_from": params.effective_from.isoformat(),
+        # 근속 기간이 여러 시행 구간에 걸치면 구간별 최저임금 기준
+        "min_wage_periods": min_wage_periods(job.hourly_rate, job.start_date, reference_date),
         "weekly_holiday_pay": weekly_holiday_pay,
         "annual_leave_days": annual_leave_days,
         "severance_estimate": severance_estimate,
@@ -111,6 +143,38 @@ def evaluate_labor(job: JobInputs, today: Optional[date] = None) -> Dict[str, An
     }
 
 
+def combined_job_totals(jobs: List[tuple], actual_weeks: Optional[List[Dict]] = None) -> Dict[str, Any]:
+    """여러 Job의 합산 지표 (jobs: [(JobInputs, evaluate_labor 결과), ...], 재직 중인 Job 기준)
+
+    주휴수당·연차·퇴직금의 15시간 기준은 사업장별로 판단하므로,
+    합산 시간은 참고용 지표와 경고 메시지로만 제공한다.
+    actual_weeks: 근로기록 기반 주별 합산 실제 근로시간 (labor/overlaps.py, 겹친 시간은 한 번만 셈)
+    """
+    actual_weeks = actual_weeks or []
+    combined_weekly_hours = sum(job.weekly_hours for job, _ in jobs)
+    jobs_over_15h = sum(1 for job, _ in jobs if job.weekly_hours >= 15)
+    max_actual_weekly_hours = max((week['combined_hours'] for week in actual_weeks), default=0)
+
+    warnings: List[str] = []
+    if combined_weekly_hours >= 15 and jobs_over_15h < len(jobs):
+        warnings.append("합산 주 15시간 이상이지만 주휴수당·연차·퇴직금은 사업장별 근로시간 기준으로 판단됩니다.")
+    if combined_weekly_hours > 52:
+        warnings.append("여러 사업장 합산 주 근로시간이 52시간을 넘습니다. 건강 관리에 유의하세요.")
+    if max_actual_weekly_hours > 52:
+        warnings.append("최근 근로기록 기준 여러 사업장 합산 실제 근로시간이 주 52시간을 넘은 주가 있습니다.")
+
+    return {
+        "job_count": len(jobs),
+        "combined_weekly_hours": combined_weekly_hours,
+        "jobs_over_15h": jobs_over_15h,
+        "actual_weekly_hours": actual_weeks,
+        "max_actual_weekly_hours": max_actual_weekly_hours,
+        "weekly_holiday_pay_total": sum(result["weekly_holiday_pay"] for _, result in jobs),
+        "severance_estimate_total": sum(result["severance_estimate"] for _, result in jobs),
+        "warnings": warnings,
+    }
+
+
 def job_to_inputs(employee) -> JobInputs:
     """Employee 모델 인스턴스를 평가 입력 구조로 변환"""
     return JobInputs(
@@ -129,22 +193,23 @@ def job_to_inputs(employee) -> JobInputs:
     )
 
 
-def calculate_annual_leave(job: JobInputs, today: Optional[date] = None) -> Dict[str, float]:
+def calculate_annual_leave(job: JobInputs, today: Optional[date] = None, used: float = 0.0) -> Dict[str, float]:
     """
     연차휴가 요약 계산 (단순화 규칙)
     - 주 15시간 미만: 0일 처리
     - 1년 미만: 월 1일 발생 (개근 가정)
     - 1년 이상: 출근율 0.8 미만 0일, 그 외 15일 + (2년마다 1일) 최대 25일
-    - 사용 연차는 현재 0일로 가정 (추후 실제 데이터로 대체)
+    - 위 기준값은 기준일에 시행 중인 LawParameterSet 값 사용
+    - used: 사용 일수 (실제 발생/사용/소멸 잔여는 연차 ledger, labor/leave.py의 leave_balance 참고)
     """
     today = today or date.today()
+    params = law_parameters(law_reference_date(job, today))
 
-    if job.weekly_hours < 15:
+    if job.weekly_hours < params.annual_leave_min_weekly_hours:
         total = 0.0
     else:
-        total = calc_annual_leave(job.start_date, job.attendance_rate_last_year, today)
+        total = calc_annual_leave(job.start_date, job.attendance_rate_last_year, today, params)
 
-    used = 0.0  # placeholder, 추후 실제 사용 연차 집계로 대체 예정
     available = max(0.0, float(total) - float(used))
     return {
         "total": float(total),
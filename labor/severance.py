@@ -0,0 +1,179 @@
+"""labor/severance.py
+
+퇴직금 계산용 최근 3개월 임금 (근로기록 집계 기반)
+- 기준일(as_of) 이전 3개월 [as_of - 3개월, as_of) 동안의 임금 총액과 총일수(달력 일수)
+- 임금 총액 = 기본 급여(estimated_pay) + 연장/야간/휴일 가산수당(premium_pay) + 주휴수당
+  (주휴수당은 주 집계 WorkWeeklyRollup에서 주휴일(일요일)이 구간 안에 있는 주만 포함)
+- 완전히 포함되는 달은 월 집계(WorkMonthlyRollup), 걸쳐 있는 앞뒤 달만 일 집계(WorkDailyRollup) 사용
+  (근로기록 원본은 읽지 않음, 기간 내 집계가 근로기록과 맞지 않는 Job은 ensure_rollups로 먼저 재생성)
+- 월초 기준일 시계열은 월 집계를 한 번 읽어 3개월 슬라이딩 합으로 계산
+- Employee의 total_wage_last_3m / total_days_last_3m을 직접 입력했으면 입력값 우선
+"""
+
+from collections import defaultdict, deque
+from dataclasses import replace
+from datetime import date, timedelta
+from decimal import Decimal
+from math import floor
+from typing import Dict, Iterable, List, Tuple
+
+from django.db.models import Q, Sum
+
+from .law import law_parameters
+from .models import Employee, WorkDailyRollup, WorkMonthlyRollup, WorkWeeklyRollup
+from .rollups import add_months, ensure_rollups, month_start, next_month_start
+from .services import JobInputs, calc_service_days, calc_severance, job_to_inputs, law_reference_date
+
+
+WINDOW_MONTHS = 3
+
+Wage = Tuple[Decimal, int]  # (임금 총액, 총일수)
+
+# 주 월요일 + 6일 = 주휴일(일요일) - 주휴수당은 주휴일이 속한 기간의 임금으로 봄
+HOLIDAY_OFFSET = timedelta(days=6)
+
+
+def wage_window(as_of: date) -> Tuple[date, date]:
+    """as_of 이전 3개월 구간 [시작, 끝) """
+    return add_months(as_of, -WINDOW_MONTHS), as_of
+
+
+def three_month_wages(employee_ids: Iterable[int], as_of: date) -> Dict[int, Wage]:
+    """여러 Job의 as_of 기준 최근 3개월 임금 (집계 확인 1회 + 월 집계 1회 + 경계 달 일 집계 최대 1회 + 주 집계 1회 조회)
+
+    임금 = 기본 급여 + 가산수당 + 주휴일이 [시작, 끝) 안에 있는 주의 주휴수당
+    """
+    employee_ids = list(employee_ids)
+    start, end = wage_window(as_of)
+    ensure_rollups(employee_ids, start - HOLIDAY_OFFSET, end)
+    days = (end - start).days
+    first_full = start if start.day == 1 else next_month_start(start)
+    last_full_end = month_start(end)  # 이 날짜 이전 달까지 월 단위
+
+    pay = defaultdict(Decimal)
+    monthly = (
+        WorkMonthlyRollup.objects.filter(employee_id__in=employee_ids, month__gte=first_full, month__lt=last_full_end)
+        .values('employee_id')
+        .annotate(pay=Sum('estimated_pay'), premium=Sum('premium_pay'))
+        .order_by()
+    )
+    for row in monthly:
+        pay[row['employee_id']] += row['pay'] + row['premium']
+
+    partial = Q()
+    if start < first_full:
+        partial |= Q(work_date__gte=start, work_date__lt=first_full)
+    if last_full_end < end:
+        partial |= Q(work_date__gte=last_full_end, work_date__lt=end)
+    if partial:
+        daily = (
+            WorkDailyRollup.objects.filter(partial, employee_id__in=employee_ids)
+            .values('employee_id')
+            .annotate(pay=Sum('estimated_pay'), premium=Sum('premium_pay'))
+            .order_by()
+        )
+        for row in daily:
+            pay[row['employee_id']] += row['pay'] + row['premium']
+
+    weekly = (
+        WorkWeeklyRollup.objects.filter(
+            employee_id__in=employee_ids, week_start__gte=start - HOLIDAY_OFFSET, week_start__lt=end - HOLIDAY_OFFSET,
+        )
+        .values('employee_id')
+        .annotate(pay=Sum('weekly_holiday_pay'))
+        .order_by()
+    )
+    for row in weekly:
+        pay[row['employee_id']] += row['pay']
+
+    return {employee_id: (pay[employee_id], days) for employee_id in employee_ids}
+
+
+def with_derived_wages(inputs: JobInputs, wage: Wage) -> JobInputs:
+    """최근 3개월 임금을 직접 입력하지 않은 경우 근로기록 기반 값으로 채움"""
+    if inputs.total_wage_last_3m or not wage[0]:
+        return inputs
+    return replace(inputs, total_wage_last_3m=float(wage[0]), total_days_last_3m=wage[1])
+
+
+def job_inputs_with_wages(employees: Iterable[Employee], today: date) -> Dict[int, JobInputs]:
+    """평가 입력값 (최근 3개월 임금은 기준일 - 퇴사한 Job은 퇴사일 - 별로 묶어 조회)"""
+    inputs = {employee.id: job_to_inputs(employee) for employee in employees}
+    by_as_of = defaultdict(list)
+    for employee_id, job in inputs.items():
+        if not job.total_wage_last_3m:
+            by_as_of[law_reference_date(job, today)].append(employee_id)
+    for as_of, employee_ids in by_as_of.items():
+        for employee_id, wage in three_month_wages(employee_ids, as_of).items():
+            inputs[employee_id] = with_derived_wages(inputs[employee_id], wage)
+    return inputs
+
+
+def severance_as_of(employee: Employee, as_of: date) -> Dict:
+    """as_of에 퇴직한다고 가정한 퇴직금 추정"""
+    job = job_to_inputs(employee)
+    source = 'manual'
+    if not job.total_wage_last_3m:
+        job = with_derived_wages(job, three_month_wages([employee.id], as_of)[employee.id])
+        source = 'records'
+    service_days = calc_service_days(job.start_date, as_of)
+    service_years = floor(service_days / 365)
+    wage = job.total_wage_last_3m or 0
+    days = job.total_days_last_3m or 0
+    return {
+        'as_of': as_of.isoformat(),
+        'source': source,
+        'service_days': service_days,
+        'service_years': service_years,
+        'wage_last_3m': float(wage),
+        'days_last_3m': days,
+        'average_daily_wage': round(wage / days, 2) if days > 0 else 0,
+        'severance_estimate': calc_severance(
+            service_years, job.weekly_hours, job.total_wage_last_3m, job.total_days_last_3m, law_parameters(as_of)
+        ),
+    }
+
+
+def rolling_severance_series(employee: Employee, start: date, end: date) -> List[Dict]:
+    """start~end 사이 매월 1일 기준 퇴직금 추정 시계열 (집계 확인 1회 + 월/주 집계 각 1회 조회, 3개월 슬라이딩 합)
+
+    월 임금 = 월 집계의 기본 급여 + 가산수당 + 주휴일이 그 달에 있는 주의 주휴수당 (three_month_wages와 같은 규칙)
+    """
+    first = month_start(start) if start.day == 1 else next_month_start(start)
+    window_start = add_months(first, -WINDOW_MONTHS)
+    ensure_rollups([employee.id], window_start - HOLIDAY_OFFSET, next_month_start(end))
+    pays = defaultdict(Decimal)
+    monthly = WorkMonthlyRollup.objects.filter(employee=employee, month__gte=window_start, month__lt=end)
+    for month, estimated_pay, premium_pay in monthly.values_list('month', 'estimated_pay', 'premium_pay'):
+        pays[month] += estimated_pay + premium_pay
+    weekly = WorkWeeklyRollup.objects.filter(
+        employee=employee, week_start__gte=window_start - HOLIDAY_OFFSET, week_start__lt=end,
+    )
+    for week, holiday_pay in weekly.values_list('week_start', 'weekly_holiday_pay'):
+        pays[month_start(week + HOLIDAY_OFFSET)] += holiday_pay
+    job = job_to_inputs(employee)
+
+    series = []
+    window = deque()
+    total = Decimal(0)
+    month = window_start
+    while month <= end:
+        if len(window) == WINDOW_MONTHS and month >= first:
+            days = (month - add_months(month, -WINDOW_MONTHS)).days
+            wage = (job.total_wage_last_3m, job.total_days_last_3m) if job.total_wage_last_3m else (float(total), days)
+            service_years = floor(calc_service_days(job.start_date, month) / 365)
+            series.append({
+                'as_of': month.isoformat(),
+                'wage_last_3m': float(wage[0] or 0),
+                'days_last_3m': wage[1] or 0,
+                'severance_estimate': calc_severance(
+                    service_years, job.weekly_hours, wage[0], wage[1], law_parameters(month)
+                ),
+            })
+        pay = pays.get(month, Decimal(0))
+        window.append(pay)
+        total += pay
+        if len(window) > WINDOW_MONTHS:
+            total -= window.popleft()
+        month = next_month_start(month)
+    return series
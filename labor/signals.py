@@ -0,0 +1,139 @@
+"""labor/signals.py
+
+WorkRecord / Employee 변경 시 일·월 집계(labor/rollups.py)를 증분 갱신하고,
+WorkRecord / WorkSchedule / Employee 변경 시 Employee.data_version을 올린다.
+LawParameterSet 변경 시 법령 기준 인덱스(labor/law.py)를 다시 읽도록 비우고,
+바뀐 기준이 적용되는 기간의 집계(가산수당, 주휴수당)를 다시 계산한다.
+연차 사용 기록이나 Job 근속정보가 바뀌면 해당 Job의 연차 ledger(labor/leave.py)를 다시 생성한다.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .law import law_index
+from .leave import rebuild_leave_ledger, rebuild_leave_ledgers
+from .models import Employee, LawParameterSet, WorkRecord, WorkSchedule
+from .rollups import rebuild_rollups, refresh_rollups
+
+
+@receiver(pre_save, sender=WorkRecord)
+def remember_previous_work_date(sender, instance, raw=False, **kwargs):
+    """수정 시 이전 (employee, work_date)를 기억 (날짜/Job이 바뀌면 이전 날짜 집계도 갱신)"""
+    instance._rollup_previous = None
+    instance._previous_leave_days = 0
+    if instance.pk and not raw:
+        previous = (
+            WorkRecord.objects.filter(pk=instance.pk)
+            .values_list('employee_id', 'work_date', 'leave_days')
+            .first()
+        )
+        if previous:
+            instance._rollup_previous = previous[:2]
+            instance._previous_leave_days = previous[2]
+
+
+@receiver(post_save, sender=WorkRecord)
+def refresh_rollups_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    touched = {(instance.employee_id, instance.work_date)}
+    previous = getattr(instance, '_rollup_previous', None)
+    if previous:
+        touched.add(previous)
+    employee_ids = {employee_id for employee_id, _ in touched}
+    for employee_id in employee_ids:
+        refresh_rollups(employee_id, [d for e, d in touched if e == employee_id])
+    if instance.leave_days or getattr(instance, '_previous_leave_days', 0):
+        rebuild_leave_ledgers(employee_ids)
+    Employee.bump_data_version(employee_ids)
+
+
+@receiver(post_delete, sender=WorkRecord)
+def refresh_rollups_on_delete(sender, instance, origin=None, **kwargs):
+    # Job/User 삭제에 따른 CASCADE라면 집계도 함께 삭제되므로 건너뜀
+    if not (isinstance(origin, WorkRecord) or getattr(origin, 'model', None) is WorkRecord):
+        return
+    refresh_rollups(instance.employee_id, [instance.work_date])
+    if instance.leave_days:
+        rebuild_leave_ledgers([instance.employee_id])
+    Employee.bump_data_version([instance.employee_id])
+
+
+@receiver(post_save, sender=WorkSchedule)
+@receiver(post_delete, sender=WorkSchedule)
+def bump_version_on_schedule_change(sender, instance, raw=False, origin=None, **kwargs):
+    if raw or (origin is not None and not (
+            isinstance(origin, WorkSchedule) or getattr(origin, 'model', None) is WorkSchedule)):
+        return
+    Employee.bump_data_version([instance.employee_id])
+
+
+# 연차 발생에 영향을 주는 Job 필드
+LEAVE_FIELDS = ('start_date', 'end_date', 'weekly_hours', 'attendance_rate_last_year')
+
+
+@receiver(pre_save, sender=Employee)
+def remember_previous_employee_state(sender, instance, raw=False, **kwargs):
+    instance._rollup_previous_rate = None
+    instance._leave_inputs_changed = False
+    if instance.pk and not raw:
+        previous = (
+            Employee.objects.filter(pk=instance.pk)
+            .values_list('hourly_rate', 'data_version', *LEAVE_FIELDS)
+            .first()
+        )
+        if previous:
+            instance._rollup_previous_rate, version = previous[:2]
+            # 메모리의 값이 아닌 DB 값 기준으로 증가 (그 사이 근로기록 변경으로 올라간 버전 보존)
+            instance.data_version = version + 1
+            instance._leave_inputs_changed = previous[2:] != tuple(getattr(instance, f) for f in LEAVE_FIELDS)
+
+
+@receiver(post_save, sender=Employee)
+def rebuild_rollups_on_rate_change(sender, instance, created=False, raw=False, **kwargs):
+    """시급이 바뀌면 예상 급여 집계를 다시 계산, 근속정보가 바뀌면 연차 ledger 재생성"""
+    if raw or created:
+        return
+    previous = getattr(instance, '_rollup_previous_rate', None)
+    if previous is not None and previous != instance.hourly_rate:
+        rebuild_rollups([instance.pk])
+    if getattr(instance, '_leave_inputs_changed', False):
+        rebuild_leave_ledger(instance)
+
+
+@receiver(pre_save, sender=LawParameterSet)
+def remember_previous_effective_from(sender, instance, raw=False, **kwargs):
+    instance._previous_effective_from = None
+    if instance.pk and not raw:
+        instance._previous_effective_from = (
+            LawParameterSet.objects.filter(pk=instance.pk).values_list('effective_from', flat=True).first()
+        )
+
+
+def law_change_range(instance, previous_from=None):
+    """기준 행 하나가 추가/수정/삭제될 때 적용 기준이 바뀔 수 있는 기간 (start, end 미포함, None은 제한 없음)
+
+    수정 전후 시행일 중 이른 날부터 그 뒤 다음 기준의 시행일 전까지.
+    가장 이른 기준이면 그 이전 날짜에도 적용되므로 start는 None.
+    """
+    dates = [d for d in (previous_from, instance.effective_from) if d is not None]
+    others = LawParameterSet.objects.exclude(pk=instance.pk)
+    start = min(dates)
+    if not others.filter(effective_from__lt=start).exists():
+        start = None
+    end = (
+        others.filter(effective_from__gt=max(dates))
+        .order_by('effective_from').values_list('effective_from', flat=True).first()
+    )
+    return start, end
+
+
+@receiver(post_save, sender=LawParameterSet)
+@receiver(post_delete, sender=LawParameterSet)
+def refresh_rollups_on_law_change(sender, instance, raw=False, **kwargs):
+    """인덱스를 비우고 바뀐 기준이 적용되는 기간의 집계를 다시 계산 (다른 프로세스는 LABOR_LAW_INDEX_TTL 후 반영)"""
+    law_index.reset()
+    if raw:
+        return
+    start, end = law_change_range(instance, getattr(instance, '_previous_effective_from', None))
+    rebuild_rollups(start=start, end=end)
@@ -0,0 +1,188 @@
+"""labor/snapshots.py
+
+계산 결과 스냅샷 (CalculationResult) 저장/조회
+- 평가(evaluate_labor + 연차 ledger 잔여, labor/leave.py)와 월별 요약 결과를 CalculationResult에 저장
+- 같은 입력값 해시(inputs_hash)의 스냅샷이 있으면 재계산 없이 반환
+  (평가/월별 요약 inputs_hash 모두 법령 기준 fingerprint를 포함하므로 LawParameterSet이 수정되면 다시 계산)
+- 평가 스냅샷은 Job마다 최신 1건만 유지 (새로 저장할 때 이전 기준일의 스냅샷도 삭제)
+- 평가 입력값: JobInputs 필드(최근 3개월 임금은 근로기록 집계로 보완) + 연차 잔여 + 기준일
+  (연차 사용 기록이 바뀌면 잔여가 달라져 다시 저장) / 월별 요약 입력값: Employee.data_version + 기간
+"""
+
+import hashlib
+from dataclasses import asdict
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from django.db.models import OuterRef, Subquery
+
+from .evaluation_cache import evaluation_cache, inputs_hash
+from .leave import leave_balances
+from .models import CalculationResult, Employee
+from .law import law_index, law_parameters
+from .services import law_reference_date
+from .severance import job_inputs_with_wages
+
+
+# 월별 요약 응답 형식 버전 (필드가 추가되면 올려서 이전 스냅샷을 다시 계산)
+SUMMARY_FORMAT = 3
+
+
+def _inputs_json(inputs) -> Dict[str, Any]:
+    return {
+        key: value.isoformat() if isinstance(value, date) else value
+        for key, value in asdict(inputs).items()
+    }
+
+
+def evaluation_hash(inputs, annual_leave: Dict[str, Any]) -> str:
+    """평가 입력값 해시(법령 기준 fingerprint 포함) + 연차 ledger 잔여"""
+    raw = f'{inputs_hash(inputs)}:{sorted(annual_leave.items())!r}'
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def evaluation_result(employee_id: int, inputs, evaluation: Dict[str, Any], annual_leave: Dict[str, Any],
+                      today: date) -> CalculationResult:
+    """계산된 평가 결과와 연차 잔여(leave_balance)를 저장 전 CalculationResult 객체로 변환"""
+    return CalculationResult(
+        employee_id=employee_id,
+        period_start=inputs.start_date,
+        period_end=today,
+        calculation_type=CalculationResult.TYPE_EVALUATION,
+        input_data_json=_inputs_json(inputs),
+        inputs_hash=evaluation_hash(inputs, annual_leave),
+        total_annual_leave=annual_leave['total'],
+        used_annual_leave=annual_leave['used'],
+        remaining_annual_leave=annual_leave['available'],
+        detail_json={'evaluation': evaluation, 'annual_leave': annual_leave},
+        law_version_date=law_parameters(law_reference_date(inputs, today)).effective_from,
+    )
+
+
+def _build_evaluation_snapshot(employee: Employee, inputs, annual_leave: Dict[str, Any],
+                               today: date) -> CalculationResult:
+    evaluation = evaluation_cache.evaluate(inputs, today)
+    return evaluation_result(employee.id, inputs, evaluation, annual_leave, today)
+
+
+def valid_evaluation_snapshots(hashes: Dict[int, str], today: date) -> Dict[int, CalculationResult]:
+    """Job id -> inputs_hash 중 기준일(today) 스냅샷이 이미 있는 것 (한 번의 쿼리)"""
+    snapshots: Dict[int, CalculationResult] = {}
+    existing = CalculationResult.objects.filter(
+        employee_id__in=list(hashes),
+        calculation_type=CalculationResult.TYPE_EVALUATION,
+        period_end=today,
+        inputs_hash__in=set(hashes.values()),
+    ).order_by('calculated_at')
+    for snapshot in existing:
+        if hashes[snapshot.employee_id] == snapshot.inputs_hash:
+            snapshots[snapshot.employee_id] = snapshot
+    return snapshots
+
+
+def save_evaluation_results(results: List[CalculationResult], batch_size: Optional[int] = None) -> List[CalculationResult]:
+    """해당 Job의 이전 평가 스냅샷(이전 기준일 포함)을 삭제하고 새 결과를 bulk_create (Job마다 1건 유지)"""
+    if not results:
+        return []
+    CalculationResult.objects.filter(
+        employee_id__in=[result.employee_id for result in results],
+        calculation_type=CalculationResult.TYPE_EVALUATION,
+    ).delete()
+    return CalculationResult.objects.bulk_create(results, batch_size=batch_size)
+
+
+def evaluation_snapshots(employees: Iterable[Employee], today: Optional[date] = None) -> Dict[int, CalculationResult]:
+    """여러 Job의 평가 스냅샷 (유효한 스냅샷은 한 번의 쿼리로 조회, 없는 것만 계산 후 bulk_create)
+
+    detail_json['annual_leave']와 연차 필드는 연차 ledger 잔여 (annual-leave 엔드포인트와 같은 값)
+    """
+    today = today or date.today()
+    employees = list(employees)
+    # 최근 3개월 임금이 비어 있으면 근로기록 집계로 채운 입력값 (labor/severance.py)
+    inputs = job_inputs_with_wages(employees, today)
+    balances = leave_balances(employees, today)
+    hashes = {employee.id: evaluation_hash(inputs[employee.id], balances[employee.id]) for employee in employees}
+
+    snapshots = valid_evaluation_snapshots(hashes, today)
+    missing = [
+        _build_evaluation_snapshot(employee, inputs[employee.id], balances[employee.id], today)
+        for employee in employees if employee.id not in snapshots
+    ]
+    for snapshot in save_evaluation_results(missing):
+        snapshots[snapshot.employee_id] = snapshot
+    return snapshots
+
+
+def evaluation_snapshot(employee: Employee, today: Optional[date] = None) -> CalculationResult:
+    """Job 하나의 평가 스냅샷"""
+    return evaluation_snapshots([employee], today)[employee.id]
+
+
+def summary_inputs_hash(employee: Employee, period_start: date, period_end: date) -> str:
+    raw = (
+        f'summary:{SUMMARY_FORMAT}:{employee.data_version}:{period_start.isoformat()}:{period_end.isoformat()}:'
+        f'{law_index.fingerprint()}'
+    )
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def monthly_summary_snapshot(employee: Employee, period_start: date, period_end: date,
+                             compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """월별 요약 스냅샷 - data_version과 법령 기준이 그대로면 저장된 결과 반환, 아니면 compute() 결과 저장"""
+    return monthly_summary_snapshots(
+        [employee], period_start, period_end, lambda missing: {employee.id: compute()}
+    )[employee.id]
+
+
+def monthly_summary_snapshots(employees: Iterable[Employee], period_start: date, period_end: date,
+                              compute_many: Callable[[List[Employee]], Dict[int, Dict[str, Any]]]) -> Dict[int, Dict[str, Any]]:
+    """여러 Job의 월별 요약 스냅샷 (조회 1회, 없는 Job만 compute_many로 계산 후 삭제 1회 + bulk_create 1회)"""
+    employees = list(employees)
+    digests = {employee.id: summary_inputs_hash(employee, period_start, period_end) for employee in employees}
+    law_version_date = law_parameters(period_end).effective_from
+    snapshots = CalculationResult.objects.filter(
+        employee_id__in=list(digests),
+        calculation_type=CalculationResult.TYPE_MONTHLY_SUMMARY,
+        period_start=period_start,
+        period_end=period_end,
+    )
+    summaries = {
+        snapshot.employee_id: snapshot.detail_json
+        for snapshot in snapshots.filter(inputs_hash__in=set(digests.values()))
+        if digests[snapshot.employee_id] == snapshot.inputs_hash
+    }
+    missing = [employee for employee in employees if employee.id not in summaries]
+    if not missing:
+        return summaries
+
+    computed = compute_many(missing)
+    snapshots.filter(employee_id__in=[employee.id for employee in missing]).delete()
+    CalculationResult.objects.bulk_create([
+        CalculationResult(
+            employee=employee,
+            period_start=period_start,
+            period_end=period_end,
+            calculation_type=CalculationResult.TYPE_MONTHLY_SUMMARY,
+            input_data_json={'data_version': employee.data_version, 'hourly_rate': float(employee.hourly_rate)},
+            inputs_hash=digests[employee.id],
+            expected_base_wage=computed[employee.id]['estimated_salary'],
+            expected_total_pay=computed[employee.id]['estimated_salary'],
+            detail_json=computed[employee.id],
+            law_version_date=law_version_date,
+        )
+        for employee in missing
+    ])
+    summaries.update(computed)
+    return summaries
+
+
+def latest_results(queryset, employee_queryset, calculation_type: Optional[str] = None) -> List[CalculationResult]:
+    """Job별 최신 CalculationResult (Job마다 인덱스를 타는 서브쿼리 1회, 전체 쿼리 2회)"""
+    latest = CalculationResult.objects.filter(employee=OuterRef('pk'))
+    if calculation_type:
+        latest = latest.filter(calculation_type=calculation_type)
+    latest_ids = employee_queryset.annotate(
+        latest_result_id=Subquery(latest.order_by('-calculated_at', '-id').values('id')[:1])
+    ).values_list('latest_result_id', flat=True)
+    ids = [result_id for result_id in latest_ids if result_id is not None]
+    return list(queryset.filter(id__in=ids).order_by('employee_id'))
@@ -0,0 +1,277 @@
+"""labor/synthetic.py
+
+개발/벤치마크용 합성 데이터 (사용자 x Job x 기간의 근로기록, 스케줄, 상담, 문서)
+- random.Random(seed)만 사용하므로 seed와 기준일이 같으면 같은 데이터
+- 모든 모델을 bulk_create로 저장, 근로기록은 batch_size 단위로 만들어 저장 (100만 건도 한꺼번에 메모리에 올리지 않음)
+- 한 사용자의 Job끼리 근무 시간이 겹치지 않음 (labor/overlaps.py 검사 대상이 되지 않도록)
+  하루를 SLOT_HOURS시간 칸 SLOTS_PER_DAY개로 나눠 Job마다 한 칸을 쓰고, 칸이 모자라면 날짜를 번갈아 배정
+- bulk_create는 save()/signal을 거치지 않으므로 worked_minutes는 직접 계산하고, 마지막에 집계·연차 ledger를 재생성
+- random_job_inputs: 평가 동일성 검증용 무작위 JobInputs (경계값 위주, DB 저장 없음)
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from itertools import islice
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from .leave import rebuild_leave_ledgers
+from .models import Employee, WorkRecord, WorkSchedule
+from .rollups import add_months, rebuild_rollups
+from .services import JobInputs
+
+
+BATCH_SIZE = 2000
+SLOT_HOURS = 6
+SLOTS_PER_DAY = 4
+ABSENCE_RATE = 0.05
+LEAVE_RATE = 0.01
+DEFAULT_PASSWORD = 'synthetic-Pass-1234'
+
+HOURLY_RATES = [Decimal('9860'), Decimal('10030'), Decimal('10500'), Decimal('11000'), Decimal('12000'), Decimal('15000')]
+WORKPLACES = [('편의점', '소매'), ('카페', '음식료'), ('음식점', '음식료'), ('물류센터', '운수'), ('학원', '교육'), ('PC방', '서비스')]
+CONSULTATION_TOPICS = [
+    ('주휴수당 문의', '주 15시간 이상 일하는데 주휴수당을 받지 못했습니다.', '임금'),
+    ('연차 문의', '1년 넘게 일했는데 연차가 몇 일인가요?', '휴가'),
+    ('퇴직금 문의', '1년 근무 후 그만두면 퇴직금을 받을 수 있나요?', '퇴직금'),
+    ('야간수당 문의', '밤 10시 이후 근무에 가산수당이 붙나요?', '임금'),
+]
+DOCUMENT_TYPES = [('근로계약서', 'contract'), ('진정서', 'complaint'), ('임금체불 확인서', 'statement')]
+
+# 평가 검증용 경계값 (주 15/24시간, 근속 1/3년 등)
+EDGE_WEEKLY_HOURS = [0, 14.99, 15, 15.5, 23.99, 24, 40, 52.5, 168]
+EDGE_SERVICE_DAYS = [-10, 0, 29, 30, 364, 365, 366, 729, 730, 1094, 1095, 1096, 3650, 9000]
+
+
+@dataclass
+class PopulationSpec:
+    """생성할 데이터 규모 (사용자 수 x 사용자별 Job 수 x 기간)"""
+    users: int
+    jobs_per_user: int = 3
+    years: float = 3
+    seed: int = 0
+    consultations_per_user: int = 2
+    documents_per_user: int = 1
+    username_prefix: str = 'synthetic-'
+
+    @staticmethod
+    def records_per_job(jobs_per_user: int, years: float) -> float:
+        """Job 하나의 예상 근로기록 수 (주 2~6일 근무, 결근 ABSENCE_RATE, Job이 많으면 날짜를 번갈아 씀)"""
+        rotation = math.ceil(jobs_per_user / SLOTS_PER_DAY)
+        return 4 / 7 * 365.25 * years * (1 - ABSENCE_RATE) / rotation
+
+    @classmethod
+    def for_records(cls, records: int, jobs_per_user: int = 3, years: float = 3, **kwargs) -> "PopulationSpec":
+        """근로기록이 약 records건이 되도록 사용자 수를 정한 spec"""
+        users = math.ceil(records / (cls.records_per_job(jobs_per_user, years) * jobs_per_user))
+        return cls(users=max(1, users), jobs_per_user=jobs_per_user, years=years, **kwargs)
+
+
+def random_job_inputs(rng: random.Random, today: date) -> JobInputs:
+    """경계값 위주 무작위 평가 입력값 (출근율 0.8, 0/None/음수 입력, 법령 시행일 전후 퇴사일 포함)"""
+    weekly_hours = rng.choice(EDGE_WEEKLY_HOURS) if rng.random() < 0.3 else round(rng.uniform(0, 60), 2)
+    service_days = rng.choice(EDGE_SERVICE_DAYS) if rng.random() < 0.3 else rng.randint(0, 8000)
+    return JobInputs(
+        hourly_rate=rng.choice([0, 9860, 10030, 10029.99, round(rng.uniform(5000, 30000), 2)]),
+        weekly_hours=weekly_hours,
+        daily_hours=round(rng.uniform(0, 12), 2),
+        work_days_per_week=rng.choice([None, 0, -1, 1, 2, 3, 5, 6, 7]),
+        employment_type='',
+        start_date=today - timedelta(days=service_days),
+        # 퇴사일이 있으면 퇴사일 기준 법령 적용 (시행일 경계 전후 포함)
+        end_date=rng.choice([None, None, today - timedelta(days=rng.randint(0, 1200)), today + timedelta(days=30)]),
+        is_current=True,
+        has_paid_weekly_holiday=True,
+        attendance_rate_last_year=rng.choice([None, 0.0, 0.79, 0.8, 0.95, 1.0]),
+        total_wage_last_3m=rng.choice([None, 0.0, round(rng.uniform(1, 12000000), 2)]),
+        total_days_last_3m=rng.choice([None, 0, -5, 89, 90, 92]),
+    )
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _slot_start(index: int) -> time:
+    return time(index % SLOTS_PER_DAY * SLOT_HOURS)
+
+
+def _works_on(day: date, weekdays: Sequence[int], index: int, rotation: int) -> bool:
+    return day.weekday() in weekdays and day.toordinal() % rotation == index // SLOTS_PER_DAY
+
+
+def _work_records(employee: Employee, index: int, rotation: int, weekdays: Sequence[int], shift_minutes: int,
+                  first_day: date, last_day: date, rng: Optional[random.Random],
+                  absence_rate: float) -> Iterator[WorkRecord]:
+    """Job 하나의 근로기록 (rng가 없으면 결근/연차 없이 스케줄대로, 퇴근 시각만 날짜별로 조금씩 다름)
+
+    출근은 칸 시작 + 30분(±15분), 근무는 shift_minutes(±30분, 4시간 이하) → 칸(SLOT_HOURS) 안에서 끝남
+    """
+    scheduled_in = datetime.combine(first_day, _slot_start(index)) + timedelta(minutes=30)
+    day = first_day
+    while day <= last_day:
+        if _works_on(day, weekdays, index, rotation):
+            if rng is None:
+                jitter, length = 0, shift_minutes - 30 + day.day % 30
+            else:
+                jitter, length = rng.randint(-15, 15), shift_minutes + rng.randint(-30, 30)
+            if rng is not None and rng.random() < absence_rate:
+                day += timedelta(days=1)
+                continue
+            if rng is not None and rng.random() < LEAVE_RATE:
+                record = WorkRecord(employee=employee, work_date=day, leave_days=Decimal('1'))
+            else:
+                time_in = timezone.make_aware(datetime.combine(day, scheduled_in.time()) + timedelta(minutes=jitter))
+                record = WorkRecord(
+                    employee=employee, work_date=day, time_in=time_in,
+                    time_out=time_in + timedelta(minutes=length), break_minutes=30 if length >= 240 else 0,
+                )
+                record.worked_minutes = record.get_worked_minutes()
+            yield record
+        day += timedelta(days=1)
+
+
+def create_jobs(users: Iterable, jobs_per_user: int, first_day: date, last_day: date,
+                rng: Optional[random.Random] = None, weekdays: Optional[Sequence[int]] = None,
+                absence_rate: float = ABSENCE_RATE, batch_size: int = BATCH_SIZE) -> List[Employee]:
+    """사용자마다 Job jobs_per_user개와 스케줄, first_day~last_day 근로기록 생성
+
+    weekdays를 주면 모든 Job이 그 요일에 근무, 없으면 Job마다 rng로 주 2~6일 선택
+    rng가 없으면 결근/연차 없이 스케줄대로 생성 (쿼리 수 예산 테스트 seed 등)
+    """
+    users = list(users)
+    pick = rng or random.Random(0)
+    plans = []
+    for user in users:
+        for index in range(jobs_per_user):
+            days = sorted(weekdays if weekdays is not None else pick.sample(range(7), pick.randint(2, 6)))
+            shift_minutes = pick.choice([180, 210, 240])
+            name, industry = WORKPLACES[pick.randrange(len(WORKPLACES))]
+            employee = Employee(
+                user=user, workplace_name=f'{name} {user.username}-{index + 1}', industry=industry,
+                employment_type='알바', start_date=first_day - timedelta(days=pick.randint(0, 400)),
+                hourly_rate=pick.choice(HOURLY_RATES),
+                weekly_hours=Decimal(len(days) * shift_minutes) / 60,
+                daily_hours=Decimal(shift_minutes) / 60,
+                work_days_per_week=len(days),
+            )
+            plans.append((employee, index, days, shift_minutes))
+
+    employees = Employee.objects.bulk_create([plan[0] for plan in plans], batch_size=batch_size)
+    schedules = []
+    for employee, index, days, shift_minutes in plans:
+        start = datetime.combine(first_day, _slot_start(index)) + timedelta(minutes=30)
+        schedules.extend(
+            WorkSchedule(employee=employee, weekday=weekday, start_time=start.time(),
+                         end_time=(start + timedelta(minutes=shift_minutes)).time())
+            for weekday in days
+        )
+    WorkSchedule.objects.bulk_create(schedules, batch_size=batch_size)
+
+    rotation = math.ceil(jobs_per_user / SLOTS_PER_DAY)
+    records = (
+        record
+        for employee, index, days, shift_minutes in plans
+        for record in _work_records(employee, index, rotation, days, shift_minutes, first_day, last_day, rng,
+                                    absence_rate)
+    )
+    for chunk in _chunks(records, batch_size):
+        WorkRecord.objects.bulk_create(chunk)
+    return employees
+
+
+def create_users(usernames: Iterable[str], password: str = DEFAULT_PASSWORD, batch_size: int = BATCH_SIZE) -> List:
+    """사용자 일괄 생성 (비밀번호 해시는 한 번만 계산해 모든 사용자에 사용)"""
+    User = get_user_model()
+    hashed = make_password(password)
+    return User.objects.bulk_create(
+        [User(username=username, email=f'{username}@example.com', password=hashed) for username in usernames],
+        batch_size=batch_size,
+    )
+
+
+def create_consultations_and_documents(users: Iterable, consultations_per_user: int, documents_per_user: int,
+                                       rng: random.Random, batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    from consultations.models import Consultation
+    from documents.models import DocumentTemplate, GeneratedDocument
+
+    templates = [
+        DocumentTemplate.objects.get_or_create(doc_type=doc_type, defaults={'name': name})[0]
+        for name, doc_type in DOCUMENT_TYPES
+    ]
+    jobs_by_user: Dict[int, List[int]] = {}
+    for employee_id, user_id in Employee.objects.filter(user__in=users).values_list('id', 'user_id'):
+        jobs_by_user.setdefault(user_id, []).append(employee_id)
+
+    consultations, documents = [], []
+    for user in users:
+        jobs = jobs_by_user.get(user.id) or [None]
+        for _ in range(consultations_per_user):
+            title, content, category = rng.choice(CONSULTATION_TOPICS)
+            consultations.append(Consultation(
+                user=user, employee_id=rng.choice(jobs), title=title, content=content, category=category,
+            ))
+        for _ in range(documents_per_user):
+            documents.append(GeneratedDocument(
+                template=rng.choice(templates), user=user, employee_id=rng.choice(jobs),
+                filled_data_json={'name': user.username}, status=rng.choice(['작성중', '완료']),
+            ))
+    Consultation.objects.bulk_create(consultations, batch_size=batch_size)
+    GeneratedDocument.objects.bulk_create(documents, batch_size=batch_size)
+    return {'consultations': len(consultations), 'documents': len(documents)}
+
+
+def generate_population(spec: PopulationSpec, today: Optional[date] = None,
+                        batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
+    """spec 규모의 데이터를 생성하고 생성 건수와 단계별 소요 시간(초)을 반환"""
+    today = today or date.today()
+    rng = random.Random(spec.seed)
+    first_day = add_months(today.replace(day=1), -round(spec.years * 12))
+    seconds = {}
+
+    started = perf_counter()
+    users = create_users(
+        (f'{spec.username_prefix}{index:06d}' for index in range(spec.users)), batch_size=batch_size
+    )
+    seconds['users'] = perf_counter() - started
+
+    started = perf_counter()
+    employees = create_jobs(users, spec.jobs_per_user, first_day, today, rng, batch_size=batch_size)
+    seconds['records'] = perf_counter() - started
+
+    started = perf_counter()
+    counts = create_consultations_and_documents(
+        users, spec.consultations_per_user, spec.documents_per_user, rng, batch_size=batch_size
+    )
+    seconds['consultations_documents'] = perf_counter() - started
+
+    employee_ids = [employee.id for employee in employees]
+    started = perf_counter()
+    rebuild_rollups(employee_ids)
+    seconds['rollups'] = perf_counter() - started
+
+    started = perf_counter()
+    rebuild_leave_ledgers(employee_ids, today)
+    seconds['leave_ledgers'] = perf_counter() - started
+
+    return {
+        'users': len(users),
+        'employees': len(employees),
+        'work_records': WorkRecord.objects.filter(employee__user__username__startswith=spec.username_prefix).count(),
+        **counts,
+        'first_day': first_day.isoformat(),
+        'today': today.isoformat(),
+        'seconds': {key: round(value, 3) for key, value in seconds.items()},
+    }
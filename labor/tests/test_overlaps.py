@@ -0,0 +1,53 @@
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.test import TestCase
+
+from accounts.models import User
+from labor.models import Employee, WorkRecord
+from labor.overlaps import overlap_report
+
+
+class CombinedWeeklyHoursTests(TestCase):
+    """주별 합산 근로시간은 겹친 구간을 병합한 합집합 기준"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='overlaps', password='pass1234')
+
+    def record(self, job, day, start_hour, end_hour, break_minutes=0):
+        return WorkRecord.objects.create(
+            employee=job, work_date=day, break_minutes=break_minutes,
+            time_in=datetime(day.year, day.month, day.day, start_hour, tzinfo=dt_timezone.utc),
+            time_out=datetime(day.year, day.month, day.day, end_hour, tzinfo=dt_timezone.utc),
+        )
+
+    def job(self, name):
+        return Employee.objects.create(
+            user=self.user, workplace_name=name, start_date=date(2025, 1, 1),
+            hourly_rate=Decimal('10030'), weekly_hours=Decimal('40'),
+        )
+
+    def test_three_overlapping_records_are_not_double_subtracted(self):
+        day = date(2025, 3, 4)
+        # 09-17, 10-18, 11-19 → 합집합 09-19 (10시간)
+        for index, start_hour in enumerate([9, 10, 11]):
+            self.record(self.job(f'job{index}'), day, start_hour, start_hour + 8)
+
+        report = overlap_report(self.user)
+        self.assertEqual(report['conflict_count'], 3)
+        [week] = report['weeks']
+        self.assertEqual(week['worked_hours'], 24)
+        self.assertEqual(week['overlap_hours'], 14)
+        self.assertEqual(week['combined_hours'], 10)
+        self.assertEqual(week['job_count'], 3)
+
+    def test_nested_and_separate_records(self):
+        outer, inner, other = self.job('outer'), self.job('inner'), self.job('other')
+        self.record(outer, date(2025, 3, 4), 8, 20, break_minutes=60)
+        self.record(inner, date(2025, 3, 4), 10, 12)
+        self.record(other, date(2025, 3, 5), 9, 13)
+
+        [week] = overlap_report(self.user)['weeks']
+        # 근로 11 + 2 + 4 = 17시간, 중복 2시간 (08-20 안의 10-12)
+        self.assertEqual(week['overlap_hours'], 2)
+        self.assertEqual(week['combined_hours'], 15)
@@ -0,0 +1,61 @@
+import random
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from accounts.models import User
+from labor.law import law_index
+from labor.models import Employee
+from labor.recompute import evaluate_chunk
+from labor.services import evaluate_labor, job_to_inputs
+from labor.synthetic import random_job_inputs
+from labor.vectorized import parity_mismatches
+
+
+SEED = 20240101
+SAMPLES = 500
+# 법령 시행일(2024/2025/2026-01-01) 전후 기준일
+REFERENCE_DATES = [date(2024, 6, 30), date(2025, 1, 1), date(2026, 10, 18)]
+
+
+class VectorizedParityTests(TestCase):
+    """evaluate_labor(스칼라)와 evaluate_labor_arrays(NumPy) 결과가 값과 타입까지 같은지 (고정 seed 소량 샘플)
+
+    대량 샘플 검증은 python manage.py check_labor_parity --samples N
+    """
+
+    def setUp(self):
+        law_index.reset()
+
+    def assertNoMismatches(self, jobs, today):
+        mismatches = parity_mismatches(jobs, today)
+        self.assertEqual(mismatches, [], f'{len(mismatches)}건 불일치 (기준일 {today})')
+
+    def test_random_samples(self):
+        for today in REFERENCE_DATES:
+            with self.subTest(today=today):
+                rng = random.Random(SEED)
+                self.assertNoMismatches([random_job_inputs(rng, today) for _ in range(SAMPLES)], today)
+
+    def test_database_jobs(self):
+        user = User.objects.create_user(username='parity', password='pass1234')
+        for index, weekly_hours in enumerate(['14.99', '15', '24', '40']):
+            Employee.objects.create(
+                user=user, workplace_name=f'job{index}', start_date=date(2022 + index, 3, 1),
+                end_date=date(2025, 12, 31) if index % 2 else None,
+                hourly_rate=Decimal('10030'), weekly_hours=Decimal(weekly_hours), work_days_per_week=5,
+                total_wage_last_3m=Decimal('2500000') if index else None, total_days_last_3m=91 if index else None,
+            )
+        jobs = [job_to_inputs(employee) for employee in Employee.objects.order_by('id')]
+        self.assertNoMismatches(jobs, date(2026, 10, 18))
+
+    def test_recompute_chunk(self):
+        """recompute_labor 워커 계산(evaluate_chunk)도 Job별 evaluate_labor와 같음"""
+        today = date(2026, 10, 18)
+        rng = random.Random(SEED)
+        jobs = [(index, random_job_inputs(rng, today)) for index in range(50)]
+        self.assertEqual(
+            evaluate_chunk(jobs, today),
+            [(index, evaluate_labor(inputs, today)) for index, inputs in jobs],
+        )
@@ -0,0 +1,66 @@
+from datetime import date, time
+from decimal import Decimal
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from labor.models import Employee, WorkSchedule
+from labor.projection import project_shifts, schedule_signature
+
+
+class ProjectionTenureTests(TestCase):
+    """근속 기간(입사일 ~ 퇴사일) 밖의 날짜는 예상 근무로 전개하지 않음"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='projection', password='pass1234')
+        cls.job = Employee.objects.create(
+            user=cls.user, workplace_name='cafe', start_date=date(2024, 3, 15), end_date=date(2024, 6, 10),
+            hourly_rate=Decimal('10000'), weekly_hours=Decimal('40'), work_days_per_week=5,
+        )
+        for weekday in range(5):
+            WorkSchedule.objects.create(employee=cls.job, weekday=weekday, start_time=time(9), end_time=time(18))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def shifts(self, start, end):
+        return project_shifts(
+            schedule_signature(self.job.schedules.all()), self.job.hourly_rate, start, end,
+            start_date=self.job.start_date, end_date=self.job.end_date,
+        )
+
+    def test_month_before_start_date(self):
+        self.assertEqual(self.shifts(date(2024, 1, 1), date(2024, 1, 31)), [])
+
+        response = self.client.get(f'/api/labor/jobs/{self.job.id}/projection/?start=2024-01-01&end=2024-01-31')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['days'], [])
+        self.assertEqual(response.data['totals']['projected_hours'], 0)
+
+        response = self.client.get(f'/api/labor/jobs/{self.job.id}/summary/?month=2024-01')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['projected_hours'], 0)
+        self.assertEqual(response.data['projected_salary'], 0)
+
+    def test_month_after_end_date(self):
+        self.assertEqual(self.shifts(date(2024, 7, 1), date(2024, 7, 31)), [])
+
+        response = self.client.get(f'/api/labor/jobs/{self.job.id}/summary/?month=2024-07')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['projected_hours'], 0)
+
+    def test_start_and_end_months_are_clipped(self):
+        march = self.shifts(date(2024, 3, 1), date(2024, 3, 31))
+        self.assertEqual(march[0].work_date, date(2024, 3, 15))
+        # 3/15(금) ~ 3/29(금) 평일 11일
+        self.assertEqual(len(march), 11)
+
+        june = self.shifts(date(2024, 6, 1), date(2024, 6, 30))
+        self.assertEqual(june[-1].work_date, date(2024, 6, 10))
+        self.assertEqual(len(june), 6)
+
+        response = self.client.get(f'/api/labor/jobs/{self.job.id}/summary/?month=2024-03')
+        self.assertEqual(response.data['projected_hours'], 11 * 9)
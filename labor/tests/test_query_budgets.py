@@ -0,0 +1,293 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import TestCase
+from django.urls import URLResolver, get_resolver, resolve
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from consultations.models import Consultation
+from documents.models import DocumentTemplate, GeneratedDocument
+from labor.law import law_index
+from labor.leave import rebuild_leave_ledgers
+from labor.models import CalculationResult, Employee, WorkRecord
+from labor.rollups import add_months, rebuild_rollups
+from labor.synthetic import create_jobs, create_users
+
+
+PASSWORD = 'budget-Pass-1234'
+IMPORT_ROWS = 20
+JOBS = 5
+MONTHS = 12
+OTHER_USERS = 1
+
+# 예산 점검에서 제외하는 URL (API가 아닌 관리자/미디어 파일)
+EXCLUDED_PREFIXES = ('admin/', '^media/')
+
+
+@dataclass
+class Case:
+    """API 호출 한 건과 쿼리 수 예산 (path의 {job} 등은 seed 데이터 id로 치환)"""
+    method: str
+    path: str
+    queries: int
+    data: Optional[Dict[str, Any]] = None
+    status: int = 200
+    auth: bool = True
+    format: str = 'json'
+    upload: Optional[str] = None  # multipart 'file' 필드로 보낼 파일 내용
+
+
+ACCOUNT_CASES: List[Case] = [
+    Case('get', '/api/accounts/me/', 1),
+    Case('get', '/api/accounts/profile/me/', 1),
+    Case('patch', '/api/accounts/profile/me/', 2, {'phone_number': '010-0000-0000'}, format='multipart'),
+    Case('post', '/api/accounts/upload-image/', 1, {}, status=400),
+    Case('post', '/api/accounts/signup/', 2,
+         {'username': 'budget-signup', 'email': 'signup@example.com', 'password': PASSWORD}, status=201, auth=False),
+    Case('post', '/api/accounts/token/', 1, {'username': '{username}', 'password': PASSWORD}, auth=False),
+    Case('post', '/api/accounts/token/refresh/', 1, {'refresh': '{refresh}'}, auth=False),
+    Case('post', '/api/accounts/profile/change-password/', 2, {
+        'current_password': PASSWORD, 'new_password': PASSWORD + '!', 'new_password_confirm': PASSWORD + '!',
+    }),
+]
+
+# jobs/ 와 employees/ 는 같은 ViewSet을 두 경로로 등록한 것이므로 GET 요청은 두 경로 모두 같은 예산으로 점검
+# summary/evaluation/dashboard는 스냅샷이 없는 상태(스냅샷 저장 포함) 기준, Job 수와 무관해야 함
+JOB_READ_CASES: List[Case] = [
+    Case('get', '/api/labor/jobs/', 2),
+    Case('get', '/api/labor/jobs/?expand=work_records,schedules&records_limit=20', 4),
+    Case('get', '/api/labor/jobs/{job}/', 2),
+    Case('get', '/api/labor/jobs/{job}/summary/?month={month}', 8),
+    Case('get', '/api/labor/jobs/{job}/yearly-summary/?year={year}', 3),
+    Case('get', '/api/labor/jobs/{job}/weekly-holiday-pay/?from={month_start}&to={month_end}', 4),
+    Case('get', '/api/labor/jobs/{job}/projection/?start={month_start}&end={month_end}', 4),
+    Case('get', '/api/labor/jobs/{job}/evaluation/', 10),
+    Case('get', '/api/labor/jobs/evaluations/', 11),
+    Case('get', '/api/labor/jobs/dashboard/?month={month}', 18),
+    Case('get', '/api/labor/jobs/cache-stats/', 1),
+    Case('get', '/api/labor/jobs/{job}/annual-leave/', 3),
+    Case('get', '/api/labor/jobs/{job}/severance/?as_of={today}&from={year_start}', 9),
+    Case('get', '/api/labor/jobs/{job}/work_records/?start={month_start}&end={month_end}', 3),
+    Case('get', '/api/labor/jobs/{job}/schedules/', 3),
+    Case('get', '/api/labor/jobs/{job}/calendar/?month={month}', 4),
+    Case('get', '/api/labor/jobs/{job}/calendar/?from={year_first_month}&to={month}', 4),
+]
+
+JOB_WRITE_CASES: List[Case] = [
+    Case('post', '/api/labor/jobs/', 4, {
+        'workplace_name': '예산 점검 편의점', 'start_date': '{year_start}', 'hourly_rate': '10030', 'weekly_hours': '20',
+    }, status=201),
+    Case('patch', '/api/labor/jobs/{job}/', 17, {'hourly_rate': '12500'}),
+    Case('put', '/api/labor/jobs/{job}/schedules/', 12, {'schedules': [
+        {'weekday': 0, 'start_time': '09:00', 'end_time': '18:00', 'enabled': True},
+        {'weekday': 2, 'start_time': '09:00', 'end_time': '18:00', 'enabled': True},
+    ]}),
+    Case('delete', '/api/labor/jobs/{spare_job}/', 20, status=204),
+]
+
+WORK_RECORD_CASES: List[Case] = [
+    Case('get', '/api/labor/work-records/', 2),
+    Case('get', '/api/labor/work-records/{record}/', 2),
+    Case('get', '/api/labor/work-records/overlaps/', 2),
+    Case('get', '/api/labor/calculation-results/', 2),
+    Case('get', '/api/labor/calculation-results/latest/', 3),
+    Case('get', '/api/labor/calculation-results/{calculation}/', 2),
+    Case('post', '/api/labor/work-records/', 17, {
+        'employee': '{job}', 'work_date': '{free_day}',
+        'time_in': '{free_day}T09:00:00Z', 'time_out': '{free_day}T13:00:00Z', 'break_minutes': 0,
+    }, status=201),
+    Case('post', '/api/labor/work-records/import/', 26, {'employee': '{job}'}, format='multipart',
+         upload='{import_csv}'),
+    Case('patch', '/api/labor/work-records/{record}/', 20, {'break_minutes': 30}),
+    Case('delete', '/api/labor/work-records/{spare_record}/', 18, status=204),
+    Case('get', '/api/labor/', 1),
+]
+
+CONSULTATION_DOCUMENT_CASES: List[Case] = [
+    Case('get', '/api/consultations/', 2),
+    Case('get', '/api/consultations/{consultation}/', 2),
+    Case('post', '/api/consultations/', 2, {'title': '주휴수당 문의', 'content': '주 20시간 근무', 'category': '임금'},
+         status=201),
+    # content 없이 호출해 OpenAI 요청 전 검증 단계만 측정 (외부 API 호출 없음)
+    Case('post', '/api/consultations/ai-consult/', 1, {'title': 'AI 상담'}, status=400),
+    Case('delete', '/api/consultations/{spare_consultation}/', 4, status=204),
+    Case('get', '/api/documents/templates/', 2),
+    Case('get', '/api/documents/templates/{template}/', 2),
+    Case('get', '/api/documents/generated/', 2),
+    Case('get', '/api/documents/generated/{document}/', 2),
+    Case('post', '/api/documents/generated/', 3, {'template': '{template}', 'status': '작성중'}, status=201),
+    Case('patch', '/api/documents/generated/{document}/', 3, {'status': '완료'}),
+    Case('delete', '/api/documents/generated/{spare_document}/', 3, status=204),
+    Case('get', '/api/documents/', 1),
+]
+
+
+def employees_case(case: Case) -> Case:
+    return Case(case.method, case.path.replace('/api/labor/jobs/', '/api/labor/employees/', 1), case.queries,
+                case.data, case.status, case.auth, case.format, case.upload)
+
+
+CASES: List[Case] = (
+    ACCOUNT_CASES + JOB_READ_CASES + [employees_case(case) for case in JOB_READ_CASES] + JOB_WRITE_CASES
+    + WORK_RECORD_CASES + CONSULTATION_DOCUMENT_CASES
+)
+
+
+def normalize_route(route: str) -> str:
+    """include()로 이어 붙인 router 정규식의 ^/$ 제거 (resolve().route와 비교용)"""
+    return route.replace('^', '').replace('$', '')
+
+
+def api_routes() -> List[str]:
+    """config/urls.py의 모든 API route (format suffix / admin / media 제외)"""
+    routes = []
+
+    def walk(patterns, prefix=''):
+        for pattern in patterns:
+            route = prefix + str(pattern.pattern)
+            if isinstance(pattern, URLResolver):
+                walk(pattern.url_patterns, route)
+            elif 'format' not in route and not route.startswith(EXCLUDED_PREFIXES):
+                routes.append(normalize_route(route))
+
+    walk(get_resolver().url_patterns)
+    return routes
+
+
+def seed(today: date) -> Dict[str, Any]:
+    """예산 점검용 데이터 (사용자 1명 x Job JOBS개 x MONTHS개월 평일 근로기록 + 다른 사용자 데이터)"""
+    first_day = add_months(today.replace(day=1), -MONTHS)
+
+    user, *others = create_users(['budget'] + [f'budget-other-{index}' for index in range(OTHER_USERS)], PASSWORD)
+    User.objects.filter(pk=user.pk).update(is_staff=True)
+    # 결근/연차 없이 평일 근무, 삭제용 Job은 주말만 근무 (같은 사용자의 근로기록끼리 겹치지 않음)
+    employees = create_jobs([user], JOBS, first_day, today, weekdays=range(5))
+    create_jobs(others, JOBS, first_day, today, weekdays=range(5))
+    spare_job = create_jobs([user], 1, first_day, today, weekdays=(5, 6))[0]
+    rebuild_rollups()
+    rebuild_leave_ledgers(Employee.objects.values_list('id', flat=True), today)
+
+    job = employees[0]
+    free_day = today + timedelta(days=1)
+    while free_day.weekday() >= 5:
+        free_day += timedelta(days=1)
+    # 일괄 업로드용 CSV (free_day 다음 날부터 IMPORT_ROWS일)
+    import_days = [free_day + timedelta(days=offset) for offset in range(1, IMPORT_ROWS + 1)]
+    import_csv = 'work_date,time_in,time_out,break_minutes\n' + ''.join(
+        f'{day.isoformat()},{day.isoformat()}T09:00:00Z,{day.isoformat()}T13:00:00Z,0\n' for day in import_days
+    )
+    records = list(WorkRecord.objects.filter(employee=job).order_by('-work_date')[:2])
+    calculation = CalculationResult.objects.create(
+        employee=job, calculation_type=CalculationResult.TYPE_MONTHLY_SUMMARY, period_start=first_day, period_end=today,
+    )
+    consultation = Consultation.objects.create(user=user, employee=job, title='연차 문의', content='연차가 몇 일인가요?')
+    spare_consultation = Consultation.objects.create(user=user, title='삭제용', content='삭제용')
+    template = DocumentTemplate.objects.create(name='근로계약서', doc_type='contract')
+    document = GeneratedDocument.objects.create(template=template, user=user, employee=job)
+    spare_document = GeneratedDocument.objects.create(template=template, user=user)
+
+    refresh = RefreshToken.for_user(user)
+    return {
+        'access': str(refresh.access_token),
+        'placeholders': {
+            'username': user.username,
+            'refresh': str(refresh),
+            'job': job.id,
+            'spare_job': spare_job.id,
+            'record': records[0].id,
+            'spare_record': records[1].id,
+            'calculation': calculation.id,
+            'consultation': consultation.id,
+            'spare_consultation': spare_consultation.id,
+            'template': template.id,
+            'document': document.id,
+            'spare_document': spare_document.id,
+            'today': today.isoformat(),
+            'free_day': free_day.isoformat(),
+            'import_csv': import_csv,
+            'month': today.strftime('%Y-%m'),
+            'month_start': today.replace(day=1).isoformat(),
+            'month_end': (add_months(today.replace(day=1), 1) - timedelta(days=1)).isoformat(),
+            'year': today.year,
+            'year_start': add_months(today.replace(day=1), -11).isoformat(),
+            'year_first_month': add_months(today.replace(day=1), -11).strftime('%Y-%m'),
+        },
+    }
+
+
+def fill(value, placeholders):
+    if isinstance(value, str):
+        return value.format(**placeholders)
+    if isinstance(value, dict):
+        return {key: fill(item, placeholders) for key, item in value.items()}
+    if isinstance(value, list):
+        return [fill(item, placeholders) for item in value]
+    return value
+
+
+class QueryBudgetTests(TestCase):
+    """API 요청별 SQL 쿼리 수 예산
+
+    - 요청마다 savepoint를 롤백하므로 모든 요청이 같은 seed 데이터 상태에서 시작 (호출 순서와 무관)
+    - 응답 캐시(labor/response_cache.py)가 없는 상태 기준
+    - 평가/연차 API가 오늘 날짜 기준이므로 seed도 오늘 기준으로 생성
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seeded = seed(date.today())
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def assertBudget(self, case: Case):
+        placeholders = self.seeded['placeholders']
+        path = fill(case.path, placeholders)
+        data = fill(case.data, placeholders)
+        if case.upload is not None:
+            data['file'] = SimpleUploadedFile('records.csv', fill(case.upload, placeholders).encode('utf-8'))
+        self.client.credentials(**({'HTTP_AUTHORIZATION': f"Bearer {self.seeded['access']}"} if case.auth else {}))
+        caches['default'].clear()
+        # 법령 기준 인덱스의 주기적 재조회(LABOR_LAW_INDEX_TTL)가 측정 중에 끼지 않도록 미리 읽어 둠
+        law_index.all()
+
+        with transaction.atomic():
+            with self.assertNumQueries(case.queries):
+                response = getattr(self.client, case.method)(path, data, format=case.format)
+            transaction.set_rollback(True)
+        self.assertEqual(response.status_code, case.status, getattr(response, 'data', None))
+
+    def assertBudgets(self, cases: List[Case]):
+        for case in cases:
+            with self.subTest(method=case.method, path=case.path):
+                self.assertBudget(case)
+
+    def test_accounts(self):
+        self.assertBudgets(ACCOUNT_CASES)
+
+    def test_job_reads(self):
+        self.assertBudgets(JOB_READ_CASES)
+
+    def test_employee_route_reads(self):
+        self.assertBudgets([employees_case(case) for case in JOB_READ_CASES])
+
+    def test_job_writes(self):
+        self.assertBudgets(JOB_WRITE_CASES)
+
+    def test_work_records_and_results(self):
+        self.assertBudgets(WORK_RECORD_CASES)
+
+    def test_consultations_and_documents(self):
+        self.assertBudgets(CONSULTATION_DOCUMENT_CASES)
+
+    def test_every_route_has_budget(self):
+        placeholders = self.seeded['placeholders']
+        covered = {normalize_route(resolve(fill(case.path, placeholders).split('?')[0]).route) for case in CASES}
+        self.assertEqual([route for route in api_routes() if route not in covered], [])
+        self.assertEqual(len(CASES), 70)
@@ -0,0 +1,55 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.db.models import Sum
+from django.test import TestCase
+
+from accounts.models import User
+from labor.models import Employee, WorkDailyRollup, WorkRecord, WorkWeeklyRollup
+from labor.severance import rolling_severance_series, three_month_wages
+
+
+class SeveranceWageTests(TestCase):
+    """최근 3개월 임금 = 기본 급여 + 가산수당 + 주휴수당"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username='severance', password='pass1234')
+        cls.job = Employee.objects.create(
+            user=user, workplace_name='물류센터', start_date=date(2024, 1, 1),
+            hourly_rate=Decimal('10000'), weekly_hours=Decimal('20'), work_days_per_week=4,
+        )
+        # 2025-01-06(월) ~ 2025-04-27 매주 월~목 20:00-01:00 (야간 3시간 포함, 주 20시간)
+        day = date(2025, 1, 6)
+        while day < date(2025, 4, 28):
+            if day.weekday() < 4:
+                time_in = datetime(day.year, day.month, day.day, 20, tzinfo=dt_timezone.utc)
+                WorkRecord.objects.create(
+                    employee=cls.job, work_date=day, time_in=time_in, time_out=time_in + timedelta(hours=5),
+                )
+            day += timedelta(days=1)
+
+    def test_wage_includes_premium_and_weekly_holiday_pay(self):
+        as_of = date(2025, 4, 1)
+        wage, days = three_month_wages([self.job.id], as_of)[self.job.id]
+
+        daily = WorkDailyRollup.objects.filter(employee=self.job, work_date__gte=date(2025, 1, 1), work_date__lt=as_of)
+        totals = daily.aggregate(pay=Sum('estimated_pay'), premium=Sum('premium_pay'))
+        self.assertGreater(totals['premium'], 0)
+        # 주휴일(일요일)이 1/1~3/31 안에 있는 주: 1/6 주 ~ 3/24 주 (12주)
+        holiday_pay = WorkWeeklyRollup.objects.filter(
+            employee=self.job, week_start__gte=date(2025, 1, 6), week_start__lte=date(2025, 3, 24),
+        ).aggregate(pay=Sum('weekly_holiday_pay'))['pay']
+        self.assertEqual(holiday_pay, 12 * 50000)
+
+        self.assertEqual(days, 90)
+        self.assertEqual(wage, totals['pay'] + totals['premium'] + holiday_pay)
+
+    def test_rolling_series_matches_three_month_wages(self):
+        series = rolling_severance_series(self.job, date(2025, 4, 1), date(2025, 6, 1))
+        self.assertEqual([point['as_of'] for point in series], ['2025-04-01', '2025-05-01', '2025-06-01'])
+        for point in series:
+            as_of = date.fromisoformat(point['as_of'])
+            wage, days = three_month_wages([self.job.id], as_of)[self.job.id]
+            self.assertEqual(point['wage_last_3m'], float(wage))
+            self.assertEqual(point['days_last_3m'], days)
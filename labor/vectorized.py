@@ -0,0 +1,208 @@
+"""labor/vectorized.py
+
+evaluate_labor의 열(column) 단위 NumPy 버전 (대량 재계산용)
+- JobInputs 목록을 열 배열(JobInputArrays)로 바꾼 뒤 Job별 Python 루프 없이 한 번에 계산
+- 결과는 labor/services.py의 스칼라 함수와 비트 단위로 동일해야 함
+  (같은 float64 연산 순서, round()와 같은 half-even 반올림 사용)
+- 법령 기준(LawParameterSet)은 Job별 기준일로 시행일 배열을 searchsorted 하여 행마다 적용
+- 동일성 검증: labor/tests/test_parity.py (대량 샘플은 python manage.py check_labor_parity)
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .law import law_index
+from .services import JobInputs, evaluate_labor, min_wage_periods
+
+
+# 경고 코드 (비트 플래그) - evaluate_labor의 warnings 메시지와 같은 순서
+WARN_MIN_WAGE = 1
+WARN_WEEKLY_HOLIDAY_PAY = 2
+WARN_SEVERANCE_DATA = 4
+
+WARNING_MESSAGES = [
+    (WARN_MIN_WAGE, "최저임금({min_wage:,}원) 미달 가능성이 있습니다."),
+    (WARN_WEEKLY_HOLIDAY_PAY, "주 {weekly_holiday_min_hours:g}시간 이상인데 주휴수당이 반영되지 않았을 수 있습니다."),
+    (WARN_SEVERANCE_DATA, "1년 이상 근속인데 퇴직금 계산 정보(최근 3개월 임금 등)가 부족합니다."),
+]
+
+
+@dataclass
+class JobInputArrays:
+    """JobInputs의 열 배열 표현 (None은 nan 또는 0으로 표현)"""
+    hourly_rate: np.ndarray            # float64
+    weekly_hours: np.ndarray           # float64
+    work_days_per_week: np.ndarray     # int64, None은 0
+    start_ordinal: np.ndarray          # int64, date.toordinal()
+    end_ordinal: np.ndarray            # int64, None은 0
+    attendance_rate_last_year: np.ndarray  # float64, None은 nan
+    total_wage_last_3m: np.ndarray     # float64, None은 nan
+    total_days_last_3m: np.ndarray     # int64, None은 0
+
+    def __len__(self):
+        return len(self.hourly_rate)
+
+    @classmethod
+    def from_inputs(cls, jobs: Sequence[JobInputs]) -> "JobInputArrays":
+        nan = float('nan')
+        return cls(
+            hourly_rate=np.array([job.hourly_rate for job in jobs], dtype=np.float64),
+            weekly_hours=np.array([job.weekly_hours for job in jobs], dtype=np.float64),
+            work_days_per_week=np.array([job.work_days_per_week or 0 for job in jobs], dtype=np.int64),
+            start_ordinal=np.array([job.start_date.toordinal() for job in jobs], dtype=np.int64),
+            end_ordinal=np.array([job.end_date.toordinal() if job.end_date else 0 for job in jobs], dtype=np.int64),
+            attendance_rate_last_year=np.array(
+                [nan if job.attendance_rate_last_year is None else job.attendance_rate_last_year for job in jobs],
+                dtype=np.float64,
+            ),
+            total_wage_last_3m=np.array(
+                [nan if job.total_wage_last_3m is None else job.total_wage_last_3m for job in jobs],
+                dtype=np.float64,
+            ),
+            total_days_last_3m=np.array([job.total_days_last_3m or 0 for job in jobs], dtype=np.int64),
+        )
+
+
+def law_parameter_arrays(reference_ordinal: np.ndarray) -> Dict[str, np.ndarray]:
+    """Job별 기준일(ordinal)에 시행 중인 LawParameters를 필드별 배열로 (index: 기준 목록 위치)"""
+    params = law_index.all()
+    boundaries = np.array(law_index.boundaries(), dtype=np.int64)
+    index = np.maximum(np.searchsorted(boundaries, reference_ordinal, side='right') - 1, 0)
+    columns = {
+        field: np.array([getattr(p, field) for p in params])[index]
+        for field in ('min_wage', 'weekly_holiday_min_hours', 'severance_min_weekly_hours',
+                      'annual_leave_min_attendance', 'annual_leave_base_days', 'annual_leave_max_days')
+    }
+    columns['index'] = index
+    return columns
+
+
+def calc_weekly_holiday_pay_array(weekly_hours: np.ndarray, hourly_rate: np.ndarray,
+                                  work_days_per_week: np.ndarray, min_hours=15) -> np.ndarray:
+    """calc_weekly_holiday_pay의 배열 버전"""
+    estimated_daily_hours = np.where(weekly_hours < 24, weekly_hours, weekly_hours / 5)
+    estimated_days = np.maximum(1, np.rint(weekly_hours / np.maximum(estimated_daily_hours, 1)))
+    days = np.where(work_days_per_week > 0, work_days_per_week, estimated_days)
+    pay = np.rint((weekly_hours / days) * hourly_rate)
+    return np.where(weekly_hours < min_hours, 0, pay).astype(np.int64)
+
+
+def calc_annual_leave_array(service_days: np.ndarray, attendance_rate_last_year: np.ndarray,
+                            min_attendance=0.8, base_days=15, max_days=25) -> np.ndarray:
+    """calc_annual_leave의 배열 버전 (service_days는 정수 배열)"""
+    service_years = np.floor(service_days / 365)
+    months = np.floor(service_days / 30)
+    # nan < 0.8 은 False이므로 출근율 정보가 없으면 차감하지 않음
+    low_attendance = attendance_rate_last_year < min_attendance
+    tenure_days = np.where(
+        service_years >= 3,
+        np.minimum(max_days, base_days + (service_years - 1) // 2),
+        base_days,
+    )
+    leave = np.where(low_attendance, 0.0, tenure_days)
+    return np.where(service_years < 1, months, leave).astype(np.float64)
+
+
+def calc_severance_array(service_years: np.ndarray, weekly_hours: np.ndarray,
+                         total_wage_last_3m: np.ndarray, total_days_last_3m: np.ndarray,
+                         min_hours=15) -> np.ndarray:
+    """calc_severance의 배열 버전"""
+    has_data = (np.nan_to_num(total_wage_last_3m) != 0) & (total_days_last_3m > 0)
+    eligible = (service_years >= 1) & (weekly_hours >= min_hours) & has_data
+    safe_days = np.where(total_days_last_3m > 0, total_days_last_3m, 1)
+    avg_daily_wage = np.where(eligible, total_wage_last_3m, 0.0) / safe_days
+    severance = np.rint(avg_daily_wage * 30 * service_years)
+    return np.where(eligible, severance, 0).astype(np.int64)
+
+
+def evaluate_labor_arrays(jobs: JobInputArrays, today: Optional[date] = None) -> Dict[str, np.ndarray]:
+    """evaluate_labor의 배열 버전
+
+    반환: min_wage_ok(bool), weekly_holiday_pay(int64), annual_leave_days(float64),
+          severance_estimate(int64), warning_codes(int64, WARN_* 비트 조합),
+          reference_ordinal(int64, 법령 기준일), law_index(int64, law_index.all() 위치)
+    """
+    today = today or date.today()
+    service_days = today.toordinal() - jobs.start_ordinal
+    service_years = np.floor(service_days / 365).astype(np.int64)
+    # law_reference_date와 동일: 이미 퇴사한 Job은 퇴사일 기준
+    reference_ordinal = np.where(
+        (jobs.end_ordinal > 0) & (jobs.end_ordinal < today.toordinal()), jobs.end_ordinal, today.toordinal()
+    )
+    law = law_parameter_arrays(reference_ordinal)
+
+    min_wage_ok = jobs.hourly_rate >= law['min_wage']
+    weekly_holiday_pay = calc_weekly_holiday_pay_array(
+        jobs.weekly_hours, jobs.hourly_rate, jobs.work_days_per_week, law['weekly_holiday_min_hours']
+    )
+    annual_leave_days = calc_annual_leave_array(
+        service_days, jobs.attendance_rate_last_year,
+        law['annual_leave_min_attendance'], law['annual_leave_base_days'], law['annual_leave_max_days'],
+    )
+    severance_estimate = calc_severance_array(
+        service_years, jobs.weekly_hours, jobs.total_wage_last_3m, jobs.total_days_last_3m,
+        law['severance_min_weekly_hours'],
+    )
+
+    warning_codes = (
+        np.where(~min_wage_ok, WARN_MIN_WAGE, 0)
+        | np.where((jobs.weekly_hours >= law['weekly_holiday_min_hours']) & (weekly_holiday_pay == 0),
+                   WARN_WEEKLY_HOLIDAY_PAY, 0)
+        | np.where((service_days >= 365) & (severance_estimate == 0), WARN_SEVERANCE_DATA, 0)
+    ).astype(np.int64)
+
+    return {
+        "min_wage_ok": min_wage_ok,
+        "weekly_holiday_pay": weekly_holiday_pay,
+        "annual_leave_days": annual_leave_days,
+        "severance_estimate": severance_estimate,
+        "warning_codes": warning_codes,
+        "hourly_rate": jobs.hourly_rate,
+        "start_ordinal": jobs.start_ordinal,
+        "reference_ordinal": reference_ordinal,
+        "law_index": law['index'],
+    }
+
+
+def warning_messages(code: int, params=None) -> List[str]:
+    """경고 코드를 evaluate_labor와 같은 메시지 목록으로 변환 (params: 적용된 LawParameters)"""
+    params = params or law_index.lookup(date.today())
+    return [
+        message.format(min_wage=params.min_wage, weekly_holiday_min_hours=params.weekly_holiday_min_hours)
+        for flag, message in WARNING_MESSAGES if code & flag
+    ]
+
+
+def result_at(results: Dict[str, np.ndarray], index: int) -> Dict:
+    """배열 결과의 index번째 Job을 evaluate_labor와 같은 dict 형태로 변환"""
+    params = law_index.all()[int(results["law_index"][index])]
+    hourly_rate = float(results["hourly_rate"][index])
+    return {
+        "min_wage_ok": bool(results["min_wage_ok"][index]),
+        "min_wage_required": params.min_wage,
+        "law_effective_from": params.effective_from.isoformat(),
+        "min_wage_periods": min_wage_periods(
+            hourly_rate,
+            date.fromordinal(int(results["start_ordinal"][index])),
+            date.fromordinal(int(results["reference_ordinal"][index])),
+        ),
+        "weekly_holiday_pay": int(results["weekly_holiday_pay"][index]),
+        "annual_leave_days": float(results["annual_leave_days"][index]),
+        "severance_estimate": int(results["severance_estimate"][index]),
+        "warnings": warning_messages(int(results["warning_codes"][index]), params),
+    }
+
+
+def parity_mismatches(jobs: Sequence[JobInputs], today: date) -> List[Tuple[JobInputs, Dict, Dict]]:
+    """evaluate_labor와 evaluate_labor_arrays 결과가 다른 Job 목록 [(입력값, 스칼라 결과, 배열 결과)] (값과 타입 모두 비교)"""
+    results = evaluate_labor_arrays(JobInputArrays.from_inputs(jobs), today)
+    mismatches = []
+    for index, job in enumerate(jobs):
+        scalar = evaluate_labor(job, today)
+        vector = result_at(results, index)
+        if vector != scalar or any(type(vector[k]) is not type(scalar[k]) for k in scalar):
+            mismatches.append((job, scalar, vector))
+    return mismatches
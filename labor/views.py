@@ -2,37 +2,251 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import APIException
+from rest_framework.parsers import MultiPartParser, FormParser
 from datetime import datetime, timedelta, date
 from decimal import Decimal
-from .models import Employee, WorkRecord, CalculationResult
-from .services import job_to_inputs, evaluate_labor, calculate_annual_leave
+from django.db.models import Count, Max, Prefetch, Q, Sum
+from .models import Employee, WorkRecord, WorkSchedule, WorkDailyRollup, CalculationResult, worked_aggregates, worked_hours_from_aggregates
+from .conditional import conditional_employee_get
+from .evaluation_cache import evaluation_cache
+from .imports import ImportFormatError, detect_format, import_work_records
+from .response_cache import cached_employee_response, response_cache
+from .projection import project_employee, project_shifts, schedule_signature
+from .leave import leave_balance
+from .overlaps import conflict_json, find_conflicts, overlap_report, recent_combined_weeks
+from .rollups import ensure_rollups
+from .severance import rolling_severance_series, severance_as_of
+from .snapshots import (
+    evaluation_snapshot, evaluation_snapshots, latest_results, monthly_summary_snapshot, monthly_summary_snapshots,
+)
+from .pagination import WorkRecordCursorPagination
+from .services import job_to_inputs, combined_job_totals
 from .serializers import (
     EmployeeSerializer,
     EmployeeUpdateSerializer,
     WorkRecordSerializer,
     CalculationResultSerializer,
-    JobSummarySerializer
+    JobSummarySerializer,
+    WorkScheduleSerializer,
 )
+from django.db import transaction
 from django.http import Http404
+import calendar as pycal
 import logging
+from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Job 목록/상세에서 expand=work_records 시 Job별 근로기록 개수 (기본/최대)
+DEFAULT_RECORDS_LIMIT = 50
+MAX_RECORDS_LIMIT = 500
+
+# projection 조회 최대 기간 (일)
+MAX_PROJECTION_DAYS = 366 * 3
+
+# calendar 다중 월 조회 시 한 번에 반환할 최대 개월 수
+MAX_CALENDAR_MONTHS = 12
+
+
+def _parse_month(value):
+    """'YYYY-MM' 문자열을 (year, month)로 변환 (형식 오류 시 ValueError)"""
+    year, month = map(int, value.split('-'))
+    if not 1 <= month <= 12:
+        raise ValueError(value)
+    return year, month
+
+
+def _build_month_summary(job, period_start, period_end):
+    """월별 요약 계산 (summary 액션, 스냅샷 미스 시 호출)"""
+    return _build_month_summaries([job], period_start, period_end)[job.id]
+
+
+def _build_month_summaries(jobs, period_start, period_end):
+    """여러 Job의 월별 요약 계산 (Job 수와 관계없이 집계 쿼리 2회 + 스케줄, prefetch 시 0회)"""
+    # 주별 구간 (1일부터 7일 단위, 마지막 주는 월말까지)
+    weeks = []
+    current_week_start = period_start
+    while current_week_start <= period_end:
+        week_end = min(current_week_start + timedelta(days=6), period_end)
+        weeks.append((current_week_start, week_end))
+        current_week_start = week_end + timedelta(days=1)
+
+    # 월 합계와 주별 합계를 Job별 한 번의 집계 쿼리로 계산
+    job_ids = [job.id for job in jobs]
+    records = WorkRecord.objects.filter(
+        employee_id__in=job_ids,
+        work_date__gte=period_start,
+        work_date__lte=period_end
+    )
+    aggregates = {'total_days': Count('id')}
+    aggregates.update(worked_aggregates('month'))
+    for index, (week_start, week_end) in enumerate(weeks):
+        aggregates.update(worked_aggregates(
+            f'week{index}',
+            Q(work_date__gte=week_start, work_date__lte=week_end)
+        ))
+    totals_by_job = {
+        row['employee_id']: row
+        for row in records.values('employee_id').annotate(**aggregates).order_by()
+    }
+
+    # 연장/야간/휴일 분과 가산수당 (일 집계 테이블, labor/premiums.py로 분할된 값)
+    premiums_by_job = {
+        row['employee_id']: row
+        for row in WorkDailyRollup.objects.filter(
+            employee_id__in=job_ids,
+            work_date__gte=period_start,
+            work_date__lte=period_end
+        ).values('employee_id').annotate(
+            night=Sum('night_minutes'),
+            overtime=Sum('overtime_minutes'),
+            holiday=Sum('holiday_minutes'),
+            premium=Sum('premium_pay'),
+        ).order_by()
+    }
+
+    summaries = {}
+    for job in jobs:
+        totals = totals_by_job.get(job.id, {})
+        premiums = premiums_by_job.get(job.id, {})
+        total_hours = worked_hours_from_aggregates(totals, 'month')
+        total_days = totals.get('total_days', 0)
+        estimated_salary = total_hours * job.hourly_rate
+
+        # 주별 통계
+        week_stats = []
+        for index, (week_start, week_end) in enumerate(weeks):
+            week_hours = worked_hours_from_aggregates(totals, f'week{index}')
+            week_stats.append({
+                'start_date': week_start.isoformat(),
+                'end_date': week_end.isoformat(),
+                'hours': float(week_hours),
+                'pay': float(week_hours * job.hourly_rate)
+            })
+
+        # 주간 스케줄 기준 해당 월 예상 근무
+        shifts = project_shifts(
+            schedule_signature(job.schedules.all()), job.hourly_rate, period_start, period_end,
+            start_date=job.start_date, end_date=job.end_date,
+        )
+        projected_minutes = sum(shift.minutes for shift in shifts)
+
+        summaries[job.id] = {
+            'job_id': job.id,
+            'job_name': job.workplace_name,
+            'workplace_name': job.workplace_name,
+            'hourly_wage': float(job.hourly_rate),
+            'month': period_start.strftime('%Y-%m'),
+            'total_hours': float(total_hours),
+            'total_days': total_days,
+            'estimated_salary': float(estimated_salary),
+            'night_hours': (premiums.get('night') or 0) / 60,
+            'overtime_hours': (premiums.get('overtime') or 0) / 60,
+            'holiday_hours': (premiums.get('holiday') or 0) / 60,
+            'premium_pay': float(premiums.get('premium') or 0),
+            'projected_hours': projected_minutes / 60,
+            'projected_salary': float(sum(shift.estimated_pay for shift in shifts)),
+            'week_stats': week_stats
+        }
+
+    return summaries
+
+
+def _build_calendar_months(schedules, hourly_rate, months, records, start_date=None, end_date=None):
+    """달력 데이터 [{ month, dates }] (schedules: WorkSchedule 목록, records: 직렬화된 근로기록 목록,
+    start_date/end_date: 근속 기간 - 밖의 날짜는 예상 근무 0)"""
+    range_start = date(*months[0], 1)
+    range_end = date(*months[-1], pycal.monthrange(*months[-1])[1])
+    schedule_weekdays = {s.weekday for s in schedules if s.enabled}
+    projected = {
+        shift.work_date: shift
+        for shift in project_shifts(
+            schedule_signature(schedules), hourly_rate, range_start, range_end,
+            start_date=start_date, end_date=end_date,
+        )
+    }
+    records_by_date = {record['work_date']: record for record in records}
+
+    result = []
+    for year, mon in months:
+        _, lastday = pycal.monthrange(year, mon)
+        dates = []
+        for day in range(1, lastday + 1):
+            d = date(year, mon, day)
+            iso = d.isoformat()
+            dates.append({
+                'date': iso,
+                'day': day,
+                'is_scheduled': d.weekday() in schedule_weekdays,
+                'projected_minutes': projected[d].minutes if d in projected else 0,
+                'record': records_by_date.get(iso),
+            })
+        result.append({'month': f'{year:04d}-{mon:02d}', 'dates': dates})
+    return result
+
 
 class EmployeeViewSet(viewsets.ModelViewSet):
     """Job(알바) 관련 API
     
-    GET /api/labor/employees/ - 사용자의 모든 Job 목록
-    GET /api/labor/employees/<id>/ - 특정 Job 상세
+    GET /api/labor/employees/ - 사용자의 모든 Job 목록 (근로기록 수/최근 근로일만 포함)
+    GET /api/labor/employees/?expand=work_records,schedules&records_limit=20 - 중첩 목록 포함
+    GET /api/labor/employees/<id>/ - 특정 Job 상세 (expand/records_limit 동일)
     GET /api/labor/employees/<id>/summary/?month=2025-11 - 월별 요약
-    GET /api/labor/employees/<id>/work-records/?start=2025-11-01&end=2025-11-30 - 기간별 근로기록
+    GET /api/labor/employees/evaluations/?ids=1,2 - 여러 Job 평가 일괄 조회 (합산 주간 근로시간 포함)
+    GET /api/labor/employees/dashboard/?month=2025-11 - 대시보드용 Job별 요약/평가/연차/달력 일괄 조회
+    GET /api/labor/employees/<id>/projection/?start=2025-11-01&end=2025-11-30 - 스케줄 기준 예상 근무
+    GET /api/labor/employees/<id>/yearly-summary/?year=2025 - 연간 월별 요약 (월 집계 테이블 기반)
+    GET /api/labor/employees/<id>/work-records/?start=2025-11-01&end=2025-11-30&page_size=50 - 기간별 근로기록 (커서 페이지네이션)
     POST /api/labor/employees/<id>/work-records/ - 근로기록 추가
     """
     serializer_class = EmployeeSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Employee.objects.filter(user=self.request.user)
+        queryset = Employee.objects.filter(user=self.request.user)
+        if self.action in ['list', 'retrieve']:
+            # 목록/상세: 근로기록 수와 최근 근로일은 annotate, 중첩 목록은 expand 요청 시에만 prefetch
+            queryset = queryset.annotate(
+                work_record_count=Count('work_records'),
+                latest_work_date=Max('work_records__work_date'),
+            )
+            expand = self._get_expand()
+            if 'work_records' in expand:
+                queryset = queryset.prefetch_related(Prefetch(
+                    'work_records',
+                    queryset=WorkRecord.objects.order_by('-work_date')[:self._get_records_limit()],
+                    to_attr='expanded_work_records',
+                ))
+            if 'schedules' in expand:
+                queryset = queryset.prefetch_related('schedules')
+        return queryset
+
+    def _get_expand(self):
+        """?expand=work_records,schedules"""
+        value = self.request.query_params.get('expand', '')
+        return {name.strip() for name in value.split(',') if name.strip()}
+
+    def _get_records_limit(self):
+        """?records_limit=N (expand=work_records일 때 Job별 최근 근로기록 개수)"""
+        try:
+            limit = int(self.request.query_params.get('records_limit', DEFAULT_RECORDS_LIMIT))
+        except ValueError:
+            limit = DEFAULT_RECORDS_LIMIT
+        return max(1, min(limit, MAX_RECORDS_LIMIT))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in ['list', 'retrieve']:
+            context['expand'] = self._get_expand()
+            context['records_limit'] = self._get_records_limit()
+        return context
+
+    def get_object(self):
+        # 조건부 GET 검사(labor/conditional.py)와 액션 본문이 같은 Job 조회 결과를 사용
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -48,6 +262,8 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         serializer.save()
 
     @action(detail=True, methods=['get'])
+    @cached_employee_response()
+    @conditional_employee_get()
     def summary(self, request, pk=None):
         """특정 Job의 월별 요약 정보"""
         job = self.get_object()
@@ -75,60 +291,145 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             period_start = date(year, month, 1)
             period_end = date(year, month + 1, 1) - timedelta(days=1)
         
-        # 해당 월의 근로기록
-        records = job.work_records.filter(
-            work_date__gte=period_start,
-            work_date__lte=period_end
+        data = monthly_summary_snapshot(
+            job, period_start, period_end,
+            lambda: _build_month_summary(job, period_start, period_end)
         )
-        
-        # 통계 계산
-        total_hours = Decimal('0')
-        total_days = records.count()
-        
-        for record in records:
-            total_hours += record.get_total_hours()
-        
-        estimated_salary = total_hours * job.hourly_rate
-        
-        # 주별 통계
-        week_stats = []
-        current_week_start = period_start
-        
-        while current_week_start <= period_end:
-            week_end = min(current_week_start + timedelta(days=6), period_end)
-            week_records = records.filter(
-                work_date__gte=current_week_start,
-                work_date__lte=week_end
+        data['month'] = month_str
+        return Response(data)
+
+    @action(detail=True, methods=['get'], url_path='yearly-summary')
+    def yearly_summary(self, request, pk=None):
+        """연간 월별 요약 (월 집계 테이블에서 최대 12행만 읽음)
+
+        GET /api/labor/jobs/<id>/yearly-summary/?year=2025
+        """
+        job = self.get_object()
+        try:
+            year = int(request.query_params.get('year', date.today().year))
+        except ValueError:
+            return Response(
+                {'error': 'year 형식 오류 (형식: YYYY)'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-            
-            week_hours = Decimal('0')
-            for record in week_records:
-                week_hours += record.get_total_hours()
-            
-            week_stats.append({
-                'start_date': current_week_start.isoformat(),
-                'end_date': week_end.isoformat(),
-                'hours': float(week_hours),
-                'pay': float(week_hours * job.hourly_rate)
+
+        rollups = job.monthly_rollups.filter(month__year=year)
+        months = []
+        for rollup in rollups:
+            months.append({
+                'month': rollup.month.strftime('%Y-%m'),
+                'total_hours': rollup.worked_minutes / 60,
+                'total_days': rollup.days_worked,
+                'estimated_salary': float(rollup.estimated_pay),
+                'night_hours': rollup.night_minutes / 60,
+                'overtime_hours': rollup.overtime_minutes / 60,
+                'holiday_hours': rollup.holiday_minutes / 60,
+                'premium_pay': float(rollup.premium_pay),
             })
-            
-            current_week_start = week_end + timedelta(days=1)
-        
+
         data = {
             'job_id': job.id,
-            'job_name': job.workplace_name,
-            'workplace_name': job.workplace_name,
-            'hourly_wage': float(job.hourly_rate),
-            'month': month_str,
-            'total_hours': float(total_hours),
-            'total_days': total_days,
-            'estimated_salary': float(estimated_salary),
-            'week_stats': week_stats
+            'year': year,
+            'total_hours': sum(m['total_hours'] for m in months),
+            'total_days': sum(m['total_days'] for m in months),
+            'estimated_salary': sum(m['estimated_salary'] for m in months),
+            'premium_pay': sum(m['premium_pay'] for m in months),
+            'months': months,
         }
-        
         return Response(data)
 
+    @action(detail=True, methods=['get'], url_path='weekly-holiday-pay')
+    def weekly_holiday_pay(self, request, pk=None):
+        """실제 근로기록 기준 ISO 주별 주휴수당 (주 집계 테이블에서 읽음)
+
+        GET /api/labor/jobs/<id>/weekly-holiday-pay/?from=2025-01-01&to=2025-12-31 (생략 시 전체 근속기간)
+        응답: { weeks: [{ week, week_start, total_hours, days_worked, weekly_holiday_pay }], totals: {...} }
+        기간 내 집계가 근로기록과 맞지 않으면 먼저 재생성 (ensure_rollups)
+        """
+        job = self.get_object()
+        try:
+            date_from = date.fromisoformat(request.query_params['from']) if request.query_params.get('from') else None
+            date_to = date.fromisoformat(request.query_params['to']) if request.query_params.get('to') else None
+        except ValueError:
+            return Response(
+                {'error': 'from/to 형식 오류 (형식: YYYY-MM-DD)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        ensure_rollups(
+            [job.id],
+            date_from - timedelta(days=date_from.weekday()) if date_from else date.min,
+            date_to + timedelta(days=7 - date_to.weekday()) if date_to else date.max,
+        )
+        rollups = job.weekly_rollups.all()
+        if date_from:
+            rollups = rollups.filter(week_start__gte=date_from - timedelta(days=6))
+        if date_to:
+            rollups = rollups.filter(week_start__lte=date_to)
+
+        weeks = []
+        for rollup in rollups:
+            year, week, _ = rollup.week_start.isocalendar()
+            weeks.append({
+                'week': f'{year}-W{week:02d}',
+                'week_start': rollup.week_start.isoformat(),
+                'total_hours': rollup.worked_minutes / 60,
+                'days_worked': rollup.days_worked,
+                'weekly_holiday_pay': rollup.weekly_holiday_pay,
+            })
+
+        return Response({
+            'job_id': job.id,
+            'weeks': weeks,
+            'totals': {
+                'weeks': len(weeks),
+                'eligible_weeks': sum(1 for w in weeks if w['weekly_holiday_pay'] > 0),
+                'weekly_holiday_pay': sum(w['weekly_holiday_pay'] for w in weeks),
+            },
+        })
+
     @action(detail=True, methods=['get'])
+    def projection(self, request, pk=None):
+        """주간 스케줄 기준 예상 근무 + 실제 근로기록 병합
+
+        GET /api/labor/jobs/<id>/projection/?start=2025-11-01&end=2025-12-31
+        응답: { days: [{ date, scheduled_start, scheduled_end, projected_minutes, actual_minutes, expected_minutes }], totals }
+        """
+        job = self.get_object()
+        try:
+            start = datetime.strptime(request.query_params.get('start', ''), '%Y-%m-%d').date()
+            end = datetime.strptime(request.query_params.get('end', ''), '%Y-%m-%d').date()
+        except ValueError:
+            return Response(
+                {'error': 'start, end 파라미터 필수 (형식: YYYY-MM-DD)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if end < start or (end - start).days >= MAX_PROJECTION_DAYS:
+            return Response(
+                {'error': f'기간은 1일 이상 {MAX_PROJECTION_DAYS}일 이하여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = project_employee(job, start, end)
+        totals = result['totals']
+        return Response({
+            'job_id': job.id,
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'days': result['days'],
+            'totals': {
+                'projected_hours': totals['projected_minutes'] / 60,
+                'actual_hours': totals['actual_minutes'] / 60,
+                'expected_hours': totals['expected_minutes'] / 60,
+                'projected_salary': float(totals['projected_pay']),
+                'actual_salary': float(totals['actual_pay']),
+                'expected_salary': float(totals['expected_pay']),
+            },
+        })
+
+    @action(detail=True, methods=['get'])
+    @cached_employee_response(depends_on_today=True)
+    @conditional_employee_get(depends_on_today=True)
     def evaluation(self, request, pk=None):
         """특정 Job(알바)의 노동법 기준 근로조건 평가 결과
 
@@ -137,7 +438,12 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         반환 예:
         {
           "min_wage_ok": true,
-          "min_wage_required": 10030,
+          "min_wage_required": 10320,
+          "law_effective_from": "2026-01-01",
+          "min_wage_periods": [
+            {"start": "2025-03-01", "end": "2025-12-31", "effective_from": "2025-01-01", "min_wage_ok": true, "min_wage_required": 10030},
+            {"start": "2026-01-01", "end": "2026-10-18", "effective_from": "2026-01-01", "min_wage_ok": true, "min_wage_required": 10320}
+          ],
           "weekly_holiday_pay": 12040,
           "annual_leave_days": 8.0,
           "severance_estimate": 0,
@@ -145,23 +451,168 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         }
         """
         job = self.get_object()
-        inputs = job_to_inputs(job)
-        result = evaluate_labor(inputs)
-        return Response(result)
+        snapshot = evaluation_snapshot(job)
+        return Response(snapshot.detail_json['evaluation'])
+
+    @action(detail=False, methods=['get'], url_path='evaluations')
+    def evaluations(self, request):
+        """사용자의 모든 Job(또는 ids로 지정한 Job)의 평가 결과 + 연차 요약 일괄 조회
+
+        GET /api/labor/jobs/evaluations/?ids=1,2
+        응답: { results: { "<id>": { evaluation, annual_leave } },
+               totals: { combined_weekly_hours, actual_weekly_hours(최근 4주 실제 합산), ... } }
+        """
+        jobs = self.get_queryset()
+        ids = request.query_params.get('ids')
+        if ids:
+            try:
+                jobs = jobs.filter(id__in=[int(i) for i in ids.split(',') if i.strip()])
+            except ValueError:
+                return Response({'error': 'ids 형식 오류 (예: 1,2,3)'}, status=status.HTTP_400_BAD_REQUEST)
+
+        jobs = list(jobs)
+        # 평가 스냅샷의 annual_leave는 연차 ledger 잔여 (labor/snapshots.py)
+        snapshots = evaluation_snapshots(jobs)
+        results = {}
+        current_inputs = []
+        for job in jobs:
+            detail = snapshots[job.id].detail_json
+            results[str(job.id)] = {'evaluation': detail['evaluation'], 'annual_leave': detail['annual_leave']}
+            if job.is_current:
+                current_inputs.append((job_to_inputs(job), detail['evaluation']))
+
+        return Response({
+            'results': results,
+            'totals': combined_job_totals(current_inputs, recent_combined_weeks(request.user)),
+        })
+
+    @action(detail=False, methods=['get'], url_path='dashboard')
+    def dashboard(self, request):
+        """대시보드 한 번에 조회 (Job 목록 + Job별 월 요약/평가/연차/달력 + 합산 지표)
+
+        GET /api/labor/jobs/dashboard/?month=2025-11 (생략 시 이번 달)
+        응답: { month, jobs: [{ job, summary, evaluation, annual_leave, calendar }], totals }
+        Job 수와 관계없이 일정한 쿼리 수로 구성 (Job 목록 1 + 스케줄 1 + 요약 스냅샷 1 + 평가 스냅샷/최근 3개월 임금
+        + 연차 1 + 근로기록 1 + 합산 근로시간 1, 스냅샷이 없을 때만 일괄 계산/저장 쿼리 추가)
+        """
+        month_str = request.query_params.get('month') or date.today().strftime('%Y-%m')
+        try:
+            year, month = _parse_month(month_str)
+        except ValueError:
+            return Response(
+                {'error': 'month 형식 오류 (형식: YYYY-MM)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        period_start = date(year, month, 1)
+        period_end = date(year, month, pycal.monthrange(year, month)[1])
+
+        jobs = list(
+            Employee.objects.filter(user=request.user)
+            .annotate(work_record_count=Count('work_records'), latest_work_date=Max('work_records__work_date'))
+            .prefetch_related('schedules')
+            .order_by('id')
+        )
+        summaries = monthly_summary_snapshots(
+            jobs, period_start, period_end,
+            lambda missing: _build_month_summaries(missing, period_start, period_end)
+        )
+        snapshots = evaluation_snapshots(jobs)
+        records_by_job = defaultdict(list)
+        records = WorkRecord.objects.filter(
+            employee_id__in=[job.id for job in jobs],
+            work_date__gte=period_start,
+            work_date__lte=period_end
+        ).order_by('work_date')
+        for record in records:
+            records_by_job[record.employee_id].append(record)
+
+        results = []
+        current_inputs = []
+        for job in jobs:
+            evaluation = snapshots[job.id].detail_json['evaluation']
+            calendar = _build_calendar_months(
+                list(job.schedules.all()), job.hourly_rate, [(year, month)],
+                WorkRecordSerializer(records_by_job[job.id], many=True).data,
+                start_date=job.start_date, end_date=job.end_date,
+            )
+            results.append({
+                'job': EmployeeSerializer(job, context={'request': request}).data,
+                'summary': {**summaries[job.id], 'month': month_str},
+                'evaluation': evaluation,
+                'annual_leave': snapshots[job.id].detail_json['annual_leave'],
+                'calendar': calendar[0]['dates'],
+            })
+            if job.is_current:
+                current_inputs.append((job_to_inputs(job), evaluation))
+
+        return Response({
+            'month': month_str,
+            'jobs': results,
+            'totals': combined_job_totals(current_inputs, recent_combined_weeks(request.user)),
+        })
+
+    @action(detail=False, methods=['get'], url_path='cache-stats', permission_classes=[permissions.IsAdminUser])
+    def cache_stats(self, request):
+        """응답 캐시 / 평가 결과 캐시 적중률 (관리자 전용, 프로세스 단위 누계)
+
+        GET /api/labor/jobs/cache-stats/
+        응답: { response_cache: { backend, hits, misses, hit_rate, invalidations }, evaluation_cache: { size, hits, misses } }
+        """
+        return Response({
+            'response_cache': response_cache.stats(),
+            'evaluation_cache': evaluation_cache.stats(),
+        })
 
     @action(detail=True, methods=['get'], url_path='annual-leave')
+    @conditional_employee_get(depends_on_today=True)
     def annual_leave(self, request, pk=None):
-        """연차휴가 요약
+        """연차휴가 요약 (연차 ledger 기준 발생/사용/소멸 잔여)
 
-        GET /api/labor/jobs/<id>/annual-leave/
-        응답: { total, used, available }
+        GET /api/labor/jobs/<id>/annual-leave/?as_of=2025-12-31 (생략 시 오늘)
+        응답: { total, used, available, accrued, expired, as_of }
         """
         job = self.get_object()
-        inputs = job_to_inputs(job)
-        result = calculate_annual_leave(inputs)
-        return Response(result)
+        as_of = request.query_params.get('as_of')
+        try:
+            on = date.fromisoformat(as_of) if as_of else None
+        except ValueError:
+            return Response(
+                {'error': 'as_of 형식 오류 (형식: YYYY-MM-DD)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(leave_balance(job, on))
 
     @action(detail=True, methods=['get'])
+    def severance(self, request, pk=None):
+        """기준일 퇴직 가정 퇴직금 추정 (최근 3개월 임금은 근로기록 집계 기반, 직접 입력값 우선)
+
+        GET /api/labor/jobs/<id>/severance/?as_of=2025-12-31 (생략 시 오늘)
+        GET /api/labor/jobs/<id>/severance/?as_of=2025-12-31&from=2024-01-01 - 매월 1일 기준 시계열(series) 포함
+        응답: { as_of, source, service_days, service_years, wage_last_3m, days_last_3m,
+                average_daily_wage, severance_estimate, series? }
+        """
+        job = self.get_object()
+        try:
+            as_of = date.fromisoformat(request.query_params['as_of']) if request.query_params.get('as_of') else date.today()
+            series_from = date.fromisoformat(request.query_params['from']) if request.query_params.get('from') else None
+        except ValueError:
+            return Response(
+                {'error': 'as_of/from 형식 오류 (형식: YYYY-MM-DD)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = severance_as_of(job, as_of)
+        if series_from is not None:
+            if series_from > as_of or (as_of - series_from).days > MAX_PROJECTION_DAYS:
+                return Response(
+                    {'error': f'from은 as_of 이전이어야 하며 최대 {MAX_PROJECTION_DAYS}일까지 조회 가능합니다.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            data['series'] = rolling_severance_series(job, series_from, as_of)
+        return Response(data)
+
+    @action(detail=True, methods=['get'])
+    @conditional_employee_get()
     def work_records(self, request, pk=None):
         """특정 Job의 기간별 근로기록"""
         job = self.get_object()
@@ -186,20 +637,49 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         records = job.work_records.filter(
             work_date__gte=start,
             work_date__lte=end
-        ).order_by('-work_date')
-        
-        serializer = WorkRecordSerializer(records, many=True)
-        return Response(serializer.data)
+        )
 
-    @action(detail=True, methods=['get', 'post'], url_path='schedules')
+        # 커서 페이지네이션 (?page_size=N, 응답의 next URL로 다음 페이지 조회)
+        paginator = WorkRecordCursorPagination()
+        page = paginator.paginate_queryset(records, request, view=self)
+        serializer = WorkRecordSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=['get', 'post', 'put'], url_path='schedules')
     def schedules(self, request, pk=None):
-        """GET: 리스트, POST: 추가/업데이트(weekday 단위)"""
+        """GET: 리스트, POST: 추가/업데이트(weekday 단위), PUT: 주간 전체 일괄 저장
+
+        PUT body: { "mode": "replace" | "merge", "schedules": [{ weekday, start_time, end_time, enabled }, ...] }
+        - replace(기본): 요청에 없는 요일은 삭제, merge: 요청에 없는 요일은 유지
+        응답: 저장 후 전체 스케줄 목록
+        """
         job = self.get_object()
         if request.method == 'GET':
             schedules = job.schedules.all()
-            from .serializers import WorkScheduleSerializer
             serializer = WorkScheduleSerializer(schedules, many=True)
             return Response(serializer.data)
+        elif request.method == 'PUT':
+            mode = request.data.get('mode', 'replace')
+            if mode not in ['replace', 'merge']:
+                return Response({'error': 'mode는 replace 또는 merge'}, status=status.HTTP_400_BAD_REQUEST)
+            serializer = WorkScheduleSerializer(data=request.data.get('schedules'), many=True)
+            serializer.is_valid(raise_exception=True)
+            weekdays = [item['weekday'] for item in serializer.validated_data]
+            if len(weekdays) != len(set(weekdays)):
+                return Response({'error': '요일(weekday)이 중복되었습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+            with transaction.atomic():
+                WorkSchedule.objects.bulk_create(
+                    [WorkSchedule(employee=job, **item) for item in serializer.validated_data],
+                    update_conflicts=True,
+                    unique_fields=['employee', 'weekday'],
+                    update_fields=['start_time', 'end_time', 'enabled'],
+                )
+                if mode == 'replace':
+                    job.schedules.exclude(weekday__in=weekdays).delete()
+                Employee.bump_data_version([job.pk])
+                response_cache.invalidate([job.pk])
+            return Response(WorkScheduleSerializer(job.schedules.order_by('weekday'), many=True).data)
         else:
             # create or update per weekday
             data = request.data
@@ -217,38 +697,58 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 schedule.end_time = end_time or None
                 schedule.enabled = enabled
                 schedule.save()
-            from .serializers import WorkScheduleSerializer
+            response_cache.invalidate([job.pk])
             return Response(WorkScheduleSerializer(schedule).data)
 
     @action(detail=True, methods=['get'], url_path='calendar')
+    @cached_employee_response()
+    @conditional_employee_get()
     def calendar(self, request, pk=None):
-        """Return month calendar highlighting scheduled weekdays and existing work_records"""
+        """Return month calendar highlighting scheduled weekdays and existing work_records
+
+        GET /api/labor/jobs/<id>/calendar/?month=2025-11 - 단일 월 { dates: [...] }
+        GET /api/labor/jobs/<id>/calendar/?from=2025-09&to=2025-11 - 여러 월 { months: [{ month, dates }] }
+        """
         job = self.get_object()
         month = request.query_params.get('month')  # YYYY-MM
-        if not month:
+        month_from = request.query_params.get('from')
+        month_to = request.query_params.get('to')
+        multi = bool(month_from or month_to)
+        if multi and not (month_from and month_to):
+            return Response({'error': 'from and to parameters required (YYYY-MM)'}, status=status.HTTP_400_BAD_REQUEST)
+        if not multi and not month:
             return Response({'error': 'month parameter required'}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            year, mon = map(int, month.split('-'))
-        except Exception:
+            first = _parse_month(month_from if multi else month)
+            last = _parse_month(month_to) if multi else first
+        except ValueError:
             return Response({'error': 'month format error'}, status=status.HTTP_400_BAD_REQUEST)
-        import calendar as pycal
-        from datetime import date
-        _, lastday = pycal.monthrange(year, mon)
-        dates = []
-        # collect scheduled weekdays
-        schedules = job.schedules.filter(enabled=True)
-        schedule_weekdays = {s.weekday: s for s in schedules}
-        for day in range(1, lastday+1):
-            d = date(year, mon, day)
-            is_scheduled = d.weekday() in schedule_weekdays
-            record = job.work_records.filter(work_date=d).first()
-            dates.append({
-                'date': d.isoformat(),
-                'day': day,
-                'is_scheduled': is_scheduled,
-                'record': WorkRecordSerializer(record).data if record else None,
-            })
-        return Response({'dates': dates})
+
+        months = []
+        year, mon = first
+        while (year, mon) <= last:
+            months.append((year, mon))
+            year, mon = (year + 1, 1) if mon == 12 else (year, mon + 1)
+        if not months:
+            return Response({'error': 'from must not be after to'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(months) > MAX_CALENDAR_MONTHS:
+            return Response(
+                {'error': f'at most {MAX_CALENDAR_MONTHS} months can be requested at once'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        range_start = date(*months[0], 1)
+        range_end = date(*months[-1], pycal.monthrange(*months[-1])[1])
+        # collect scheduled weekdays and the whole range of work_records at once
+        records = job.work_records.filter(work_date__gte=range_start, work_date__lte=range_end)
+        result = _build_calendar_months(
+            list(job.schedules.all()), job.hourly_rate, months, WorkRecordSerializer(records, many=True).data,
+            start_date=job.start_date, end_date=job.end_date,
+        )
+
+        if multi:
+            return Response({'months': result})
+        return Response({'dates': result[0]['dates']})
 
     def destroy(self, request, pk=None):
         """Ensure only owner can delete and return clear responses."""
@@ -270,7 +770,9 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             calc_count = obj.calculation_results.count()
             logger.info('Deleting Employee id=%s: work_records=%s, schedules=%s, calculations=%s', pk, work_count, schedule_count, calc_count)
 
+            employee_id = obj.pk
             obj.delete()
+            response_cache.invalidate([employee_id])
             logger.info('Employee id=%s deleted by user=%s', pk, request.user)
             return Response(status=status.HTTP_204_NO_CONTENT)
         except Exception as e:
@@ -279,10 +781,20 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             return Response({'detail': f'삭제 중 오류가 발생했습니다: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class WorkRecordOverlap(APIException):
+    """근무 시간 중복 (400, 겹치는 기록 목록을 그대로 응답)"""
+    status_code = status.HTTP_400_BAD_REQUEST
+
+    def __init__(self, conflicts):
+        # ValidationError와 달리 값(id, 분)을 문자열로 바꾸지 않도록 detail을 직접 지정
+        self.detail = {'error': '다른 근로기록과 근무 시간이 겹칩니다.', 'conflicts': conflicts}
+
+
 class WorkRecordViewSet(viewsets.ModelViewSet):
-    """근로기록 관련 API"""
+    """근로기록 관련 API (목록은 커서 페이지네이션)"""
     serializer_class = WorkRecordSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = WorkRecordCursorPagination
 
     def get_queryset(self):
         # 로그인 유저의 Employee들에 한정
@@ -293,21 +805,87 @@ class WorkRecordViewSet(viewsets.ModelViewSet):
         employee_id = self.request.data.get('employee')
         try:
             employee = Employee.objects.get(id=employee_id, user=self.request.user)
-            serializer.save()
         except Employee.DoesNotExist:
             raise PermissionError("이 Job에 접근할 권한이 없습니다.")
+        self._check_overlaps(serializer)
+        serializer.save(employee=employee)
+        response_cache.invalidate([employee.id])
+
+    def _check_overlaps(self, serializer):
+        """사용자의 다른 근로기록(모든 Job)과 출퇴근 시간이 겹치면 400"""
+        instance = serializer.instance
+        data = serializer.validated_data
+        time_in = data.get('time_in', getattr(instance, 'time_in', None))
+        time_out = data.get('time_out', getattr(instance, 'time_out', None))
+        conflicts = find_conflicts(self.request.user, time_in, time_out, exclude_id=getattr(instance, 'pk', None))
+        if conflicts:
+            raise WorkRecordOverlap([conflict_json(record, time_in, time_out) for record in conflicts])
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser, FormParser])
+    def bulk_import(self, request):
+        """근로기록 일괄 업로드 (CSV / JSON Lines, (employee, work_date) 기준 upsert)
+
+        POST /api/labor/work-records/import/ (multipart)
+        - file: 업로드 파일 (헤더: employee, work_date, time_in, time_out, break_minutes, is_overtime, is_night, is_holiday)
+        - file_format: csv | jsonl (생략 시 확장자로 판단)
+        - employee: 행에 employee가 없을 때 사용할 Job id (선택)
+        응답: { rows, imported, error_count, errors: [{ row, errors }], overlap_count(업로드 기간 내 겹치는 기록 쌍 수) }
+        """
+        upload = request.FILES.get('file')
+        if not upload:
+            return Response({'error': 'file 필수'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            file_format = detect_format(upload.name, request.data.get('file_format'))
+        except ImportFormatError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        default_employee = request.data.get('employee')
+        if default_employee:
+            try:
+                default_employee = int(default_employee)
+            except ValueError:
+                return Response({'error': 'employee 형식 오류'}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            default_employee = None
+
+        try:
+            report = import_work_records(request.user, upload, file_format, default_employee)
+        except ImportFormatError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report)
 
     def perform_update(self, serializer):
         # ensure user owns this record
         instance = serializer.instance
         if instance.employee.user != self.request.user:
             raise PermissionError("이 작업을 수행할 권한이 없습니다.")
+        self._check_overlaps(serializer)
         serializer.save()
+        response_cache.invalidate([instance.employee_id])
+
+    @action(detail=False, methods=['get'], url_path='overlaps')
+    def overlaps(self, request):
+        """여러 Job에 걸친 근로시간 중복 점검 + 주별 합산 실제 근로시간
+
+        GET /api/labor/work-records/overlaps/?start=2025-01-01&end=2025-12-31 (생략 시 전체)
+        응답: { records, conflict_count, conflicts: [{ records, employees, work_dates, start, end, overlap_minutes }],
+               weeks: [{ week_start, job_count, worked_hours, overlap_hours, combined_hours, over_limit }], warnings }
+        """
+        try:
+            start = date.fromisoformat(request.query_params['start']) if request.query_params.get('start') else None
+            end = date.fromisoformat(request.query_params['end']) if request.query_params.get('end') else None
+        except ValueError:
+            return Response(
+                {'error': '날짜 형식 오류 (형식: YYYY-MM-DD)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(overlap_report(request.user, start, end))
 
     def perform_destroy(self, instance):
         if instance.employee.user != self.request.user:
             raise PermissionError("이 작업을 수행할 권한이 없습니다.")
         instance.delete()
+        response_cache.invalidate([instance.employee_id])
 
 
 class CalculationResultViewSet(viewsets.ReadOnlyModelViewSet):
@@ -317,3 +895,16 @@ class CalculationResultViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         return CalculationResult.objects.filter(employee__user=self.request.user)
 
+    @action(detail=False, methods=['get'])
+    def latest(self, request):
+        """Job별 최신 계산 결과
+
+        GET /api/labor/calculation-results/latest/?calculation_type=전체권리요약
+        """
+        results = latest_results(
+            self.get_queryset(),
+            Employee.objects.filter(user=request.user),
+            request.query_params.get('calculation_type'),
+        )
+        return Response(self.get_serializer(results, many=True).data)
+